@@ -0,0 +1,136 @@
+"""Measure name autocomplete latency for items, tags and categories.
+
+Creates a scratch schema, seeds items, tags and categories with random names,
+and calls the autocomplete services with random one to three character
+prefixes. Items are searched in the database through ix_item_name_pattern.
+Tags and categories are searched in the in-memory name indexes, whose first
+search loads the names and is timed separately.
+
+    python -m benchmarks.autocomplete --items 200000 --tags 2000
+"""
+
+import argparse
+import random
+import statistics
+import time
+
+from sqlalchemy import Connection, create_engine, text
+from sqlalchemy.orm import Session
+
+from crb_inventory.core.name_index import configure_name_indexes
+from crb_inventory.database_schema import mapper_registry
+from crb_inventory.services.autocomplete import (
+    autocomplete_categories,
+    autocomplete_items,
+    autocomplete_tags,
+)
+from crb_inventory.settings import get_settings
+
+SCHEMA = "bench_autocomplete"
+PREFIX_ALPHABET = "0123456789abcdef"
+
+
+def seed(connection: Connection, items: int, tags: int, categories: int):
+    connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    connection.execute(text(f"SET search_path TO {SCHEMA}"))
+    mapper_registry.metadata.create_all(connection)
+
+    for table, count in (("category", categories), ("tag", tags)):
+        connection.execute(
+            text(
+                f"INSERT INTO {table} (id, name) "
+                "SELECT gen_random_uuid(), md5(g::text) "
+                "FROM generate_series(1, :count) AS g"
+            ),
+            {"count": count},
+        )
+    connection.execute(
+        text(
+            "INSERT INTO item (id, name, category_id, minimum_threshold, "
+            "stock_quantity, is_active) "
+            "SELECT gen_random_uuid(), upper(md5(g::text)) || ' item', "
+            "(SELECT id FROM category LIMIT 1), 0, 0, g % 10 <> 0 "
+            "FROM generate_series(1, :count) AS g"
+        ),
+        {"count": items},
+    )
+    connection.commit()
+    connection.execute(text("ANALYZE"))
+
+
+def latencies(search, prefixes: list[str]) -> list[float]:
+    timings = []
+
+    for prefix in prefixes:
+        started = time.perf_counter()
+        search(prefix)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return timings
+
+
+def percentile(timings: list[float], share: int) -> float:
+    return statistics.quantiles(timings, n=100)[share - 1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark name autocomplete.")
+    parser.add_argument("--db-url", default=get_settings().DB_URL)
+    parser.add_argument("--items", type=int, default=200000)
+    parser.add_argument("--tags", type=int, default=2000)
+    parser.add_argument("--categories", type=int, default=200)
+    parser.add_argument("--searches", type=int, default=2000)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--keep", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_engine(args.db_url)
+    configure_name_indexes(get_settings())
+    prefixes = [
+        "".join(random.choices(PREFIX_ALPHABET, k=random.randint(1, 3)))
+        for _ in range(args.searches)
+    ]
+
+    with engine.connect() as connection:
+        seed(connection, args.items, args.tags, args.categories)
+        session = Session(bind=connection)
+
+        plan = connection.execute(
+            text(
+                "EXPLAIN SELECT id, name FROM item WHERE is_active IS TRUE "
+                "AND lower(name) LIKE 'ab%' "
+                f"ORDER BY lower(name) USING ~<~ LIMIT {args.limit}"
+            )
+        ).scalars()
+        print("item plan:")
+        print("\n".join(f"    {line}" for line in plan))
+        print()
+
+        searches = {
+            "item": lambda prefix: autocomplete_items(prefix, args.limit, session),
+            "tag": lambda prefix: autocomplete_tags(prefix, args.limit, session),
+            "category": lambda prefix: autocomplete_categories(
+                prefix, args.limit, session
+            ),
+        }
+
+        print("| resource | first search ms | p50 ms | p99 ms |")
+        print("|---|---:|---:|---:|")
+
+        for resource, search in searches.items():
+            first = latencies(search, prefixes[:1])[0]
+            timings = latencies(search, prefixes)
+            print(
+                f"| {resource} | {first:.3f} | {percentile(timings, 50):.3f} "
+                f"| {percentile(timings, 99):.3f} |"
+            )
+
+        session.close()
+        if not args.keep:
+            connection.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+            connection.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,211 @@
+"""Compare the item read paths on a plain and a hash-partitioned schema.
+
+Both variants are built in scratch schemas of the target database, seeded
+with the same synthetic data and queried with the statements the item
+services issue. The partitioned variant is produced by the partitioning
+migration itself, so the benchmark exercises exactly what production would
+run. The scratch schemas are dropped at the end unless --keep is given.
+
+    python -m benchmarks.item_partitioning --items 200000 --partitions 8
+"""
+
+import argparse
+import importlib.util
+import json
+import statistics
+from pathlib import Path
+
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from sqlalchemy import Connection, create_engine, text
+
+from crb_inventory.database_schema import mapper_registry
+from crb_inventory.settings import get_settings
+
+MIGRATION_PATH = next(
+    (Path(__file__).parents[1] / "migrations" / "versions").glob(
+        "*_optional_item_hash_partitioning.py"
+    )
+)
+
+ITEM_COLUMNS = (
+    "id, name, description, is_active, category_id, minimum_threshold, "
+    "stock_quantity, created_at, updated_at"
+)
+
+QUERIES = {
+    "item by id": f"SELECT {ITEM_COLUMNS} FROM item WHERE id = :item_id",
+    "item tags": (
+        "SELECT tag.id, tag.name FROM tag "
+        "JOIN item_tag_association ON item_tag_association.tag_id = tag.id "
+        "WHERE item_tag_association.item_id = :item_id"
+    ),
+    "items by category page": (
+        f"SELECT {ITEM_COLUMNS} FROM item "
+        "WHERE is_active AND category_id = :category_id "
+        "ORDER BY id DESC LIMIT 10 OFFSET 0"
+    ),
+    "items by category count": (
+        "SELECT count(id) FROM item WHERE is_active AND category_id = :category_id"
+    ),
+    "items by tag page": (
+        f"SELECT {ITEM_COLUMNS} FROM item "
+        "WHERE is_active AND EXISTS (SELECT 1 FROM item_tag_association "
+        "WHERE item_tag_association.item_id = item.id "
+        "AND item_tag_association.tag_id = :tag_id) "
+        "ORDER BY id DESC LIMIT 10 OFFSET 0"
+    ),
+    "active items count": "SELECT count(id) FROM item WHERE is_active",
+}
+
+
+def load_partitioning_migration():
+    spec = importlib.util.spec_from_file_location(
+        "item_partitioning_migration", MIGRATION_PATH
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def build_schema(connection: Connection, schema: str, args):
+    connection.execute(text(f"DROP SCHEMA IF EXISTS {schema} CASCADE"))
+    connection.execute(text(f"CREATE SCHEMA {schema}"))
+    connection.execute(text(f"SET search_path TO {schema}"))
+
+    mapper_registry.metadata.create_all(connection)
+    connection.execute(text("ALTER TABLE item DISABLE TRIGGER USER"))
+
+    connection.execute(
+        text(
+            "INSERT INTO category (id, name, description) "
+            "SELECT gen_random_uuid(), 'category ' || n, '' "
+            "FROM generate_series(1, :categories) AS n"
+        ),
+        {"categories": args.categories},
+    )
+    connection.execute(
+        text(
+            "INSERT INTO tag (id, name) "
+            "SELECT gen_random_uuid(), 'tag ' || n "
+            "FROM generate_series(1, :tags) AS n"
+        ),
+        {"tags": args.tags},
+    )
+    connection.execute(
+        text(
+            f"INSERT INTO item ({ITEM_COLUMNS}) "
+            "SELECT gen_random_uuid(), 'item ' || n, '', n % 10 <> 0, "
+            "categories.ids[1 + n % array_length(categories.ids, 1)], "
+            "10, n % 50, now(), now() "
+            "FROM generate_series(1, :items) AS n, "
+            "(SELECT array_agg(id ORDER BY name) AS ids FROM category) AS categories"
+        ),
+        {"items": args.items},
+    )
+    connection.execute(
+        text(
+            "INSERT INTO item_tag_association (item_id, tag_id) "
+            "SELECT DISTINCT item.id, tags.ids[1 + (abs(hashtext(item.name)) + k) "
+            "% array_length(tags.ids, 1)] "
+            "FROM item, generate_series(1, :tags_per_item) AS k, "
+            "(SELECT array_agg(id ORDER BY name) AS ids FROM tag) AS tags"
+        ),
+        {"tags_per_item": args.tags_per_item},
+    )
+
+    connection.execute(text("ALTER TABLE item ENABLE TRIGGER USER"))
+
+    if args.partitions > 0 and schema.endswith("partitioned"):
+        migration = load_partitioning_migration()
+        with Operations.context(MigrationContext.configure(connection)):
+            migration.partition_item_tables(args.partitions)
+
+    connection.execute(text("ANALYZE"))
+
+
+def sample_parameters(connection: Connection) -> dict:
+    return {
+        "item_id": connection.scalar(
+            text("SELECT id FROM item ORDER BY name OFFSET 100 LIMIT 1")
+        ),
+        "category_id": connection.scalar(
+            text("SELECT id FROM category ORDER BY name LIMIT 1")
+        ),
+        "tag_id": connection.scalar(text("SELECT id FROM tag ORDER BY name LIMIT 1")),
+    }
+
+
+def scanned_relations(plan: dict) -> set[str]:
+    relations = set()
+
+    if "Relation Name" in plan:
+        relations.add(plan["Relation Name"])
+
+    for child in plan.get("Plans", []):
+        relations |= scanned_relations(child)
+
+    return relations
+
+
+def measure(connection: Connection, query: str, parameters: dict, repeat: int):
+    timings = []
+
+    for _ in range(repeat):
+        result = connection.scalar(
+            text(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {query}"), parameters
+        )
+        explain = result[0] if isinstance(result, list) else json.loads(result)[0]
+        timings.append(explain["Execution Time"])
+
+    plan = explain["Plan"]
+    relations = {name for name in scanned_relations(plan) if name.startswith("item")}
+    buffers = plan.get("Shared Hit Blocks", 0) + plan.get("Shared Read Blocks", 0)
+
+    return statistics.median(timings), len(relations), buffers
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark item queries on a plain and a hash-partitioned schema."
+    )
+    parser.add_argument("--db-url", default=get_settings().DB_URL)
+    parser.add_argument("--items", type=int, default=200_000)
+    parser.add_argument("--categories", type=int, default=50)
+    parser.add_argument("--tags", type=int, default=200)
+    parser.add_argument("--tags-per-item", type=int, default=3)
+    parser.add_argument("--partitions", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--keep", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_engine(args.db_url)
+    schemas = ("bench_plain", "bench_partitioned")
+
+    print("| query | schema | median ms | item relations scanned | buffers |")
+    print("|---|---|---:|---:|---:|")
+
+    with engine.connect() as connection:
+        for schema in schemas:
+            build_schema(connection, schema, args)
+            connection.commit()
+
+            connection.execute(text("SET enable_partitionwise_join = on"))
+            connection.execute(text("SET enable_partitionwise_aggregate = on"))
+            parameters = sample_parameters(connection)
+
+            for name, query in QUERIES.items():
+                median, relations, buffers = measure(
+                    connection, query, parameters, args.repeat
+                )
+                print(f"| {name} | {schema} | {median:.3f} | {relations} | {buffers} |")
+
+        if not args.keep:
+            for schema in schemas:
+                connection.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+            connection.commit()
+
+
+if __name__ == "__main__":
+    main()
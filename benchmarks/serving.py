@@ -0,0 +1,167 @@
+"""Compare memory and throughput of the pre-forked server for 1 to N workers.
+
+For every worker count the server is started with and without preloading
+and then loaded by client processes for a fixed duration. Memory
+is read from /proc after the load (Linux only): PSS splits shared pages
+between the processes sharing them, USS counts the pages private to each.
+
+    python -m benchmarks.serving --workers 1 2 4 --duration 10
+"""
+
+import argparse
+import http.client
+import json
+import multiprocessing
+import signal
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parents[1]
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def wait_until_serving(port: int, timeout: float = 30.0):
+    deadline = time.perf_counter() + timeout
+
+    while time.perf_counter() < deadline:
+        try:
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            connection.request("GET", "/")
+            connection.getresponse().read()
+            return
+        except OSError:
+            time.sleep(0.05)
+
+    raise TimeoutError(f"server on port {port} did not start")
+
+
+def child_pids(pid: int) -> list[int]:
+    children = (
+        Path(f"/proc/{pid}/task/{pid}/children").read_text(encoding="utf-8").split()
+    )
+    return [int(child) for child in children]
+
+
+def memory_kib(pid: int) -> tuple[int, int]:
+    values = {}
+
+    for line in (
+        Path(f"/proc/{pid}/smaps_rollup").read_text(encoding="utf-8").splitlines()[1:]
+    ):
+        name, value, *_ = line.split()
+        values[name.rstrip(":")] = int(value)
+
+    return values["Pss"], values["Private_Clean"] + values["Private_Dirty"]
+
+
+def load(port: int, path: str, duration: float, results):
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    deadline = time.perf_counter() + duration
+    completed = 0
+
+    while time.perf_counter() < deadline:
+        connection.request("GET", path)
+        connection.getresponse().read()
+        completed += 1
+
+    results.put(completed)
+
+
+def discover_path(port: int) -> str:
+    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+    connection.request("GET", "/v1/category/?page_size=1")
+    categories = json.loads(connection.getresponse().read())["result"]
+
+    if not categories:
+        return "/v1/"
+
+    return f"/v1/category/{categories[0]['id']}"
+
+
+def measure(workers: int, preload: bool, args) -> dict:
+    port = free_port()
+    command = [
+        sys.executable,
+        "-m",
+        "crb_inventory.serve",
+        "--workers",
+        str(workers),
+        "--port",
+        str(port),
+        "--log-level",
+        "warning",
+    ]
+    if not preload:
+        command.append("--no-preload")
+
+    server = subprocess.Popen(command, cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL)
+
+    try:
+        wait_until_serving(port)
+        path = args.path or discover_path(port)
+
+        results = multiprocessing.Queue()
+        clients = [
+            multiprocessing.Process(
+                target=load, args=(port, path, args.duration, results)
+            )
+            for _ in range(args.clients)
+        ]
+        for client in clients:
+            client.start()
+        requests = sum(results.get() for _ in clients)
+        for client in clients:
+            client.join()
+
+        worker_memory = [memory_kib(pid) for pid in child_pids(server.pid)]
+        supervisor_pss, _ = memory_kib(server.pid)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait()
+
+    return {
+        "workers": workers,
+        "preload": "yes" if preload else "no",
+        "requests_per_second": requests / args.duration,
+        "total_pss_mib": (supervisor_pss + sum(pss for pss, _ in worker_memory)) / 1024,
+        "worker_uss_mib": sum(uss for _, uss in worker_memory)
+        / len(worker_memory)
+        / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark memory and throughput of the pre-forked server."
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--path", help="Defaults to a category read by ID.")
+    args = parser.parse_args()
+
+    print("| workers | preload | requests/s | total PSS MiB | USS per worker MiB |")
+    print("|---:|---|---:|---:|---:|")
+
+    for workers in args.workers:
+        for preload in (False, True):
+            result = measure(workers, preload, args)
+            print(
+                f"| {result['workers']} | {result['preload']} "
+                f"| {result['requests_per_second']:.0f} "
+                f"| {result['total_pss_mib']:.1f} "
+                f"| {result['worker_uss_mib']:.1f} |",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+"""Measure how long a fresh worker takes to start serving requests.
+
+Each run starts the application in a new uvicorn process and polls it until
+the first request is answered, then times the first request that needs a
+database connection. Importing the application is timed separately in its
+own interpreter. With --record, the medians are appended to the history file
+so startup time can be compared across releases.
+
+    python -m benchmarks.startup --runs 5 --record
+"""
+
+import argparse
+import csv
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import tomllib
+import urllib.error
+import urllib.request
+from datetime import date
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parents[1]
+HISTORY_PATH = Path(__file__).parent / "startup_history.csv"
+HISTORY_FIELDS = (
+    "date",
+    "version",
+    "commit",
+    "import_ms",
+    "first_request_ms",
+    "first_db_request_ms",
+)
+
+IMPORT_SCRIPT = (
+    "import time; started = time.perf_counter(); import crb_inventory.main; "
+    "print((time.perf_counter() - started) * 1000)"
+)
+
+
+def free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def wait_for_response(url: str, timeout: float) -> float:
+    deadline = time.perf_counter() + timeout
+
+    while time.perf_counter() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=timeout) as response:
+                response.read()
+                return time.perf_counter()
+        except (ConnectionError, urllib.error.URLError):
+            time.sleep(0.005)
+
+    raise TimeoutError(f"{url} did not answer within {timeout} seconds")
+
+
+def measure_import() -> float:
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def measure_startup(db_path: str, timeout: float) -> tuple[float, float]:
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "crb_inventory.main:app",
+            "--port",
+            str(port),
+            "--log-level",
+            "warning",
+        ],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.DEVNULL,
+    )
+
+    try:
+        first_response = wait_for_response(f"{base_url}/", timeout)
+        db_started = time.perf_counter()
+        db_response = wait_for_response(f"{base_url}{db_path}", timeout)
+    finally:
+        server.terminate()
+        server.wait()
+
+    return (first_response - started) * 1000, (db_response - db_started) * 1000
+
+
+def current_version() -> str:
+    with open(PROJECT_ROOT / "pyproject.toml", "rb") as pyproject:
+        return tomllib.load(pyproject)["tool"]["poetry"]["version"]
+
+
+def current_commit() -> str:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        check=False,
+        text=True,
+    )
+
+    return result.stdout.strip() or "unknown"
+
+
+def record(row: dict):
+    new_file = not HISTORY_PATH.exists()
+
+    with open(HISTORY_PATH, "a", encoding="utf-8", newline="") as history:
+        writer = csv.DictWriter(history, fieldnames=HISTORY_FIELDS)
+        if new_file:
+            writer.writeheader()
+        writer.writerow(row)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the time from process start to first request served."
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--db-path", default="/v1/category/")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--record", action="store_true")
+    args = parser.parse_args()
+
+    imports = [measure_import() for _ in range(args.runs)]
+    startups = [measure_startup(args.db_path, args.timeout) for _ in range(args.runs)]
+
+    row = {
+        "date": date.today().isoformat(),
+        "version": current_version(),
+        "commit": current_commit(),
+        "import_ms": f"{statistics.median(imports):.0f}",
+        "first_request_ms": f"{statistics.median(s[0] for s in startups):.0f}",
+        "first_db_request_ms": f"{statistics.median(s[1] for s in startups):.0f}",
+    }
+
+    print("| " + " | ".join(HISTORY_FIELDS) + " |")
+    print("|" + "---|" * len(HISTORY_FIELDS))
+    print("| " + " | ".join(row[field] for field in HISTORY_FIELDS) + " |")
+
+    if args.record:
+        record(row)
+
+
+if __name__ == "__main__":
+    main()
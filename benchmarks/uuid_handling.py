@@ -0,0 +1,165 @@
+"""Compare string and typed UUID handling on the ID-heavy batch-get path.
+
+The validation part times the ways a list of IDs can be checked: parsing
+each one with uuid.UUID() inside a try/except, matching the canonical
+pattern, and letting pydantic parse them into UUID objects. The database
+part creates a scratch schema, seeds categories and fetches a full batch
+of them by ID, binding and reading the IDs either as strings or as UUID
+objects, and then serializes the rows to JSON as the API would.
+
+    python -m benchmarks.uuid_handling --ids 5000
+"""
+
+import argparse
+import statistics
+import time
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import (
+    Connection,
+    any_,
+    bindparam,
+    create_engine,
+    select,
+    text,
+    type_coerce,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+from crb_inventory.database_schema import Category, mapper_registry
+from crb_inventory.models.utils import BatchGetRequest
+from crb_inventory.services.uuid import generate_uuid_v7, validate_uuid
+from crb_inventory.settings import get_settings
+
+SCHEMA = "bench_uuid"
+
+
+class StringIdRow(BaseModel):
+    id: str
+    name: str
+
+
+class TypedIdRow(BaseModel):
+    id: UUID
+    name: str
+
+
+def parse_with_exceptions(values: list[str]) -> bool:
+    try:
+        for value in values:
+            UUID(value)
+    except ValueError:
+        return False
+    return True
+
+
+def timed(function, repeat: int) -> float:
+    timings = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return statistics.median(timings)
+
+
+def validation_timings(ids: list[str], repeat: int) -> dict:
+    invalid_ids = [value[:-1] + "z" for value in ids]
+    typed_ids = TypeAdapter(List[UUID])
+
+    return {
+        "uuid.UUID() with try/except": timed(
+            lambda: parse_with_exceptions(ids), repeat
+        ),
+        "uuid.UUID() with try/except, invalid": timed(
+            lambda: [parse_with_exceptions([value]) for value in invalid_ids], repeat
+        ),
+        "validate_uuid (pattern)": timed(
+            lambda: [validate_uuid(value) for value in ids], repeat
+        ),
+        "validate_uuid (pattern), invalid": timed(
+            lambda: [validate_uuid(value) for value in invalid_ids], repeat
+        ),
+        "BatchGetRequest": timed(lambda: BatchGetRequest(ids=ids), repeat),
+        "pydantic List[UUID]": timed(lambda: typed_ids.validate_python(ids), repeat),
+    }
+
+
+def seed(connection: Connection, count: int) -> list[str]:
+    connection.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    connection.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    connection.execute(text(f"SET search_path TO {SCHEMA}"))
+    mapper_registry.metadata.create_all(connection)
+
+    ids = [generate_uuid_v7() for _ in range(count)]
+    connection.execute(
+        text(
+            "INSERT INTO category (id, name) "
+            "SELECT id, 'category ' || id FROM unnest(CAST(:ids AS uuid[])) AS id"
+        ),
+        {"ids": ids},
+    )
+    connection.commit()
+
+    return ids
+
+
+def batch_get(connection: Connection, ids: list, typed: bool, row_model) -> bytes:
+    id_type = PG_UUID(as_uuid=typed)
+    statement = select(
+        type_coerce(Category.id, id_type).label("id"), Category.name
+    ).where(Category.id == any_(bindparam("ids", ids, type_=ARRAY(id_type))))
+    rows = [
+        row_model(id=row.id, name=row.name) for row in connection.execute(statement)
+    ]
+
+    return TypeAdapter(List[row_model]).dump_json(rows)
+
+
+def database_timings(connection: Connection, ids: list[str], repeat: int) -> dict:
+    typed_ids = [UUID(value) for value in ids]
+
+    return {
+        "batch get, string IDs": timed(
+            lambda: batch_get(connection, ids, False, StringIdRow), repeat
+        ),
+        "batch get, UUID objects": timed(
+            lambda: batch_get(connection, typed_ids, True, TypedIdRow), repeat
+        ),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark string and typed UUID handling for batch reads."
+    )
+    parser.add_argument("--db-url", default=get_settings().DB_URL)
+    parser.add_argument("--ids", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=21)
+    parser.add_argument("--keep", action="store_true")
+    args = parser.parse_args()
+
+    engine = create_engine(args.db_url)
+
+    print(f"| step ({args.ids} IDs) | median ms |")
+    print("|---|---:|")
+
+    with engine.connect() as connection:
+        ids = seed(connection, args.ids)
+        timings = validation_timings(ids, args.repeat)
+        timings |= database_timings(connection, ids, args.repeat)
+
+        for name, median in timings.items():
+            print(f"| {name} | {median:.2f} |")
+
+        if not args.keep:
+            connection.execute(text(f"DROP SCHEMA {SCHEMA} CASCADE"))
+            connection.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,190 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from time import monotonic
+from typing import Callable
+
+from fastapi import Response
+from pydantic import BaseModel
+
+from ..models.utils import AppResource
+from ..settings import AppSettings
+from .single_flight import read_flights
+
+
+@dataclass
+class CacheEntry:
+    body: bytes
+    version: int
+    fresh_until: float
+    stale_until: float
+    refreshing: bool = False
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: dict[str, int] = field(default_factory=dict)
+
+
+class ResponseCache:
+    """Bounded LRU cache of serialized list responses.
+
+    Entries are tagged with the version of the resource they were built from.
+    Write services bump that version, so any entry built before the write is
+    discarded on its next lookup. Versions live in process memory, which
+    means writes served by other workers only become visible after the TTL.
+    """
+
+    def __init__(self, max_entries: int = 0, ttl: float = 0.0, stale_ttl: float = 0.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: OrderedDict[tuple, CacheEntry] = OrderedDict()
+        self._versions: dict[AppResource, int] = {}
+        self._stats = CacheStats()
+        self._lock = Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl > 0
+
+    def version(self, resource: AppResource) -> int:
+        return self._versions.get(resource, 0)
+
+    def bump_version(self, resource: AppResource):
+        with self._lock:
+            self._versions[resource] = self.version(resource) + 1
+            self._stats.invalidations[resource.value] = (
+                self._stats.invalidations.get(resource.value, 0) + 1
+            )
+
+    def lookup(self, key: tuple, version: int) -> tuple[CacheEntry | None, bool]:
+        """Return the entry for key and whether the caller should refresh it.
+
+        A stale entry is handed to a single caller for refreshing while the
+        others keep being served the stale body.
+        """
+        now = monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry.version != version or now >= entry.stale_until:
+                if entry is not None:
+                    del self._entries[key]
+                self._stats.misses += 1
+                return None, True
+
+            self._entries.move_to_end(key)
+
+            if now < entry.fresh_until:
+                self._stats.hits += 1
+                return entry, False
+
+            self._stats.stale_hits += 1
+            if entry.refreshing:
+                return entry, False
+
+            entry.refreshing = True
+            return entry, True
+
+    def store(self, key: tuple, version: int, body: bytes):
+        now = monotonic()
+
+        with self._lock:
+            self._entries[key] = CacheEntry(
+                body=body,
+                version=version,
+                fresh_until=now + self.ttl,
+                stale_until=now + self.ttl + self.stale_ttl,
+            )
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+            self._stats = CacheStats()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._stats.hits + self._stats.stale_hits + self._stats.misses
+            served = self._stats.hits + self._stats.stale_hits
+
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self._stats.hits,
+                "stale_hits": self._stats.stale_hits,
+                "misses": self._stats.misses,
+                "evictions": self._stats.evictions,
+                "hit_ratio": served / lookups if lookups else 0.0,
+                "invalidations": dict(self._stats.invalidations),
+            }
+
+
+# Disabled until the application configures it on startup.
+response_cache = ResponseCache()
+
+
+def configure_response_cache(settings: AppSettings):
+    response_cache.max_entries = settings.RESPONSE_CACHE_MAX_ENTRIES
+    response_cache.ttl = settings.RESPONSE_CACHE_TTL
+    response_cache.stale_ttl = settings.RESPONSE_CACHE_STALE_TTL
+    response_cache.clear()
+
+
+async def cached_response(
+    route: str,
+    resource: AppResource,
+    params: dict,
+    build_response: Callable[[], BaseModel],
+    related: tuple[AppResource, ...] = (),
+) -> Response:
+    """Serve a list response from the cache.
+
+    Responses that also read related resources are invalidated by writes to
+    any of them: versions only grow, so their sum changes on every bump.
+    """
+    key = (route, tuple(sorted(params.items())))
+    version = sum(response_cache.version(item) for item in (resource, *related))
+
+    def build_body() -> bytes:
+        return build_response().model_dump_json().encode()
+
+    if not response_cache.enabled:
+        body = await read_flights.run((key, version), build_body)
+        return json_response(body, "BYPASS")
+
+    entry, refresh = response_cache.lookup(key, version)
+
+    if entry is not None and not refresh:
+        return json_response(entry.body, "HIT")
+
+    try:
+        body = await read_flights.run((key, version), build_body)
+    except Exception:
+        if entry is not None:
+            entry.refreshing = False
+        raise
+
+    response_cache.store(key, version, body)
+
+    return json_response(body, "MISS" if entry is None else "REFRESH")
+
+
+def json_response(body: bytes, cache_status: str) -> Response:
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"X-Cache": cache_status},
+    )
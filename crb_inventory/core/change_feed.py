@@ -0,0 +1,238 @@
+import asyncio
+import logging
+import select as select_module
+import threading
+import time
+from contextlib import suppress
+from dataclasses import dataclass, field
+from typing import AsyncIterator, List, Optional
+
+from sqlalchemy.orm import Session
+
+from ..database_schema import ITEM_CHANGES_CHANNEL
+from ..models.item import ItemChangeEventModel
+from ..services.item_changes import (
+    ItemChangePosition,
+    read_item_change_start,
+    read_item_changes,
+)
+from .database import get_engine
+
+logger = logging.getLogger(__name__)
+
+ITEM_CHANGES_REPLAY_LIMIT = 1000
+SUBSCRIBER_QUEUE_SIZE = 1000
+HEARTBEAT_INTERVAL = 15.0
+LISTEN_POLL_INTERVAL = 1.0
+RECONNECT_DELAY = 1.0
+
+
+@dataclass(eq=False)
+class Subscription:
+    queue: asyncio.Queue = field(
+        default_factory=lambda: asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+    )
+    overflowed: bool = False
+    closed: bool = False
+
+
+class ChangeFeed:
+    """Fan out committed item changes to in-process subscribers.
+
+    Each worker holds a single LISTEN connection, read by a daemon thread, so
+    the number of database connections does not grow with the number of
+    connected clients. Notifications arrive in commit order, which is not
+    the order of the event ids, so they only wake the thread up: it reads
+    the outbox in commit-safe order with read_item_changes and publishes the
+    events in that order. It also reads on every poll interval, as events
+    held back by a running transaction are released when it ends, which
+    does not notify when it wrote no item. Subscribers that fall too far
+    behind are dropped and are expected to reconnect with Last-Event-ID.
+    """
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self._subscriptions: set[Subscription] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._stopping = threading.Event()
+        self._position: ItemChangePosition | None = None
+
+    @property
+    def subscribers(self) -> int:
+        return len(self._subscriptions)
+
+    def subscribe(self) -> Subscription:
+        subscription = Subscription()
+        self._subscriptions.add(subscription)
+        self._ensure_listener()
+
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription):
+        self._subscriptions.discard(subscription)
+
+    def publish(self, event: ItemChangeEventModel):
+        for subscription in list(self._subscriptions):
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                subscription.overflowed = True
+                self._subscriptions.discard(subscription)
+
+    def close_subscriptions(self):
+        """End every open stream, so its client resumes elsewhere.
+
+        Called when the worker starts draining. It may run in a signal
+        handler or another thread, so the work is handed to the event loop.
+        """
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._close_subscriptions)
+
+    def _close_subscriptions(self):
+        for subscription in list(self._subscriptions):
+            subscription.closed = True
+            self._subscriptions.discard(subscription)
+
+            # Wakes the stream up; a full queue wakes it up anyway.
+            with suppress(asyncio.QueueFull):
+                subscription.queue.put_nowait(None)
+
+    def stop(self):
+        self._stopping.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout=LISTEN_POLL_INTERVAL)
+            self._thread = None
+
+    def _ensure_listener(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        # Read before the first subscriber reads its backlog, so the two
+        # overlap, and kept across reconnects so no event is skipped.
+        if self._position is None:
+            with Session(get_engine()) as session:
+                self._position = read_item_change_start(session)
+
+        self._loop = asyncio.get_running_loop()
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._listen, name=f"listen-{self.channel}", daemon=True
+        )
+        self._thread.start()
+
+    def _listen(self):
+        while not self._stopping.is_set():
+            dbapi_connection = None
+
+            try:
+                connection = get_engine().raw_connection()
+                dbapi_connection = connection.driver_connection
+                connection.detach()
+                self._consume(dbapi_connection)
+            except Exception:
+                logger.exception("Change feed listener failed, reconnecting")
+                time.sleep(RECONNECT_DELAY)
+            finally:
+                if dbapi_connection is not None:
+                    dbapi_connection.close()
+
+    def _consume(self, dbapi_connection):
+        dbapi_connection.autocommit = True
+
+        with dbapi_connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {self.channel}")
+
+        while not self._stopping.is_set():
+            self._publish_committed()
+
+            readable, _, _ = select_module.select(
+                [dbapi_connection], [], [], LISTEN_POLL_INTERVAL
+            )
+            if readable:
+                dbapi_connection.poll()
+                dbapi_connection.notifies.clear()
+
+    def _publish_committed(self):
+        with Session(get_engine()) as session:
+            while True:
+                changes = read_item_changes(
+                    after=self._position,
+                    limit=ITEM_CHANGES_REPLAY_LIMIT,
+                    session=session,
+                )
+
+                for change in changes:
+                    self._loop.call_soon_threadsafe(self.publish, change)
+                    self._position = change.position
+
+                if len(changes) < ITEM_CHANGES_REPLAY_LIMIT:
+                    return
+
+
+item_change_feed = ChangeFeed(ITEM_CHANGES_CHANNEL)
+
+
+def parse_last_event_id(last_event_id: str | None) -> ItemChangePosition | None:
+    xid, _, event_id = (last_event_id or "").partition("-")
+
+    if not xid.isdigit() or not event_id.isdigit():
+        return None
+
+    return int(xid), int(event_id)
+
+
+def format_sse(event: ItemChangeEventModel) -> str:
+    return (
+        f"id: {event.xid}-{event.id}\n"
+        f"event: {event.event_type}\n"
+        f"data: {event.model_dump_json()}\n\n"
+    )
+
+
+async def stream_item_changes(
+    backlog: List[ItemChangeEventModel],
+    subscription: Subscription,
+    after: Optional[ItemChangePosition] = None,
+) -> AsyncIterator[str]:
+    """Send the replayed backlog, then the live events after it.
+
+    Both come in the same commit-safe order, so live events up to the last
+    position sent were already in the backlog.
+    """
+    last_position = after
+
+    try:
+        for event in backlog:
+            last_position = event.position
+            yield format_sse(event)
+
+        # A full backlog means the client is further behind than one replay
+        # page, so end the stream and let it resume from the last event.
+        if len(backlog) >= ITEM_CHANGES_REPLAY_LIMIT:
+            return
+
+        while True:
+            if subscription.closed or (
+                subscription.overflowed and subscription.queue.empty()
+            ):
+                return
+
+            try:
+                event = await asyncio.wait_for(
+                    subscription.queue.get(), HEARTBEAT_INTERVAL
+                )
+            except TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+
+            if event is None or (
+                last_position is not None and event.position <= last_position
+            ):
+                continue
+
+            last_position = event.position
+            yield format_sse(event)
+    finally:
+        item_change_feed.unsubscribe(subscription)
@@ -1,12 +1,75 @@
-from sqlalchemy import create_engine
+import os
+from functools import lru_cache
+
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.orm import Session
 
-from ..settings import AppSettings
+from ..settings import AppSettings, get_settings
+
+# The change feed of each worker holds one LISTEN connection outside its pool.
+LISTEN_CONNECTIONS_PER_WORKER = 1
+
+
+def pool_options(settings: AppSettings) -> dict:
+    """Size the pool of one worker.
+
+    With a connection budget, each worker gets an even share of it. One
+    connection of the share is kept for the change feed listener and the
+    rest is a pool that never overflows, so all workers together stay within
+    the budget.
+    """
+    if settings.DB_CONNECTION_BUDGET > 0:
+        check_connection_budget(settings)
+        per_worker = settings.DB_CONNECTION_BUDGET // settings.WEB_CONCURRENCY
+        return {
+            "pool_size": per_worker - LISTEN_CONNECTIONS_PER_WORKER,
+            "max_overflow": 0,
+        }
+
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+    }
+
+
+def check_connection_budget(settings: AppSettings):
+    minimum = (1 + LISTEN_CONNECTIONS_PER_WORKER) * settings.WEB_CONCURRENCY
+
+    if settings.DB_CONNECTION_BUDGET < minimum:
+        raise ValueError(
+            f"DB_CONNECTION_BUDGET={settings.DB_CONNECTION_BUDGET} is too small "
+            f"for {settings.WEB_CONCURRENCY} workers, which need at least "
+            f"{minimum}: one pooled and one listener connection each"
+        )
+
+
+@lru_cache
+def get_engine() -> Engine:
+    """Create the engine on first use, so importing the app never does."""
+    settings = get_settings()
+
+    return create_engine(
+        settings.DB_URL, echo=settings.DB_ECHO, **pool_options(settings)
+    )
+
+
+def dispose_engine():
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
+        get_engine.cache_clear()
+
+
+def forget_engine_after_fork():
+    # Pooled connections are shared with the parent process, so the child
+    # drops them without closing and opens its own on first use.
+    if get_engine.cache_info().currsize:
+        get_engine().dispose(close=False)
+        get_engine.cache_clear()
+
 
-settings = AppSettings()
-engine = create_engine(settings.DB_URL, echo=True)
+os.register_at_fork(after_in_child=forget_engine_after_fork)
 
 
 def get_session():  # pragma: no cover
-    with Session(engine) as session:
+    with Session(get_engine()) as session:
         yield session
@@ -2,12 +2,24 @@ from fastapi import FastAPI
 from fastapi.responses import JSONResponse
 
 from ..models.exceptions.category import CategoryNameAlreadyExists
+from ..models.exceptions.idempotency import (
+    IdempotencyKeyInProgress,
+    IdempotencyKeyReused,
+)
 from ..models.exceptions.item import (
     ItemNameAlreadyExists,
     TagAlreadyAssociatedWithItem,
     TagNotAssociatedWithItem,
 )
-from ..models.exceptions.resource import ResourceNotFound
+from ..models.exceptions.pagination import InvalidCursor
+from ..models.exceptions.rate_limit import RateLimitExceeded
+from ..models.exceptions.reservation import InsufficientStock, ReservationNotHeld
+from ..models.exceptions.resource import (
+    InvalidReassignTarget,
+    ResourceInUse,
+    ResourceNotFound,
+    ResourceVersionConflict,
+)
 from ..models.exceptions.tag import TagNameAlreadyExists
 
 
@@ -38,6 +50,45 @@ def include_exceptions(app: FastAPI):
             headers={"X-Error-Code": exc.error_code},
         )
 
+    @app.exception_handler(ResourceVersionConflict)
+    async def resource_version_conflict_handler(request, exc):
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "exc": exc.__class__.__name__,
+                "error_code": exc.error_code,
+                "detail": exc.detail,
+                "url": request.url.path,
+            },
+            headers={"X-Error-Code": exc.error_code},
+        )
+
+    @app.exception_handler(ResourceInUse)
+    async def resource_in_use_handler(request, exc):
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "exc": exc.__class__.__name__,
+                "error_code": exc.error_code,
+                "detail": exc.detail,
+                "url": request.url.path,
+            },
+            headers={"X-Error-Code": exc.error_code},
+        )
+
+    @app.exception_handler(InvalidReassignTarget)
+    async def invalid_reassign_target_handler(request, exc):
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "exc": exc.__class__.__name__,
+                "error_code": exc.error_code,
+                "detail": exc.detail,
+                "url": request.url.path,
+            },
+            headers={"X-Error-Code": exc.error_code},
+        )
+
     @app.exception_handler(CategoryNameAlreadyExists)
     async def category_name_already_exists_handler(request, exc):
         return JSONResponse(
@@ -107,4 +158,92 @@ def include_exceptions(app: FastAPI):
             headers={"X-Error-Code": exc.error_code},
         )
 
+    @app.exception_handler(InvalidCursor)
+    async def invalid_cursor_handler(request, exc):
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "exc": exc.__class__.__name__,
+                "error_code": exc.error_code,
+                "detail": exc.detail,
+                "url": request.url.path,
+            },
+            headers={"X-Error-Code": exc.error_code},
+        )
+
+    @app.exception_handler(InsufficientStock)
+    async def insufficient_stock_handler(request, exc):
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "exc": exc.__class__.__name__,
+                "error_code": exc.error_code,
+                "detail": exc.detail,
+                "item_id": exc.item_id,
+                "quantity": exc.quantity,
+                "url": request.url.path,
+            },
+            headers={"X-Error-Code": exc.error_code},
+        )
+
+    @app.exception_handler(ReservationNotHeld)
+    async def reservation_not_held_handler(request, exc):
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "exc": exc.__class__.__name__,
+                "error_code": exc.error_code,
+                "detail": exc.detail,
+                "reservation_id": exc.reservation_id,
+                "url": request.url.path,
+            },
+            headers={"X-Error-Code": exc.error_code},
+        )
+
+    @app.exception_handler(IdempotencyKeyInProgress)
+    async def idempotency_key_in_progress_handler(request, exc):
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "exc": exc.__class__.__name__,
+                "error_code": exc.error_code,
+                "detail": exc.detail,
+                "idempotency_key": exc.idempotency_key,
+                "url": request.url.path,
+            },
+            headers={"X-Error-Code": exc.error_code},
+        )
+
+    @app.exception_handler(IdempotencyKeyReused)
+    async def idempotency_key_reused_handler(request, exc):
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "exc": exc.__class__.__name__,
+                "error_code": exc.error_code,
+                "detail": exc.detail,
+                "idempotency_key": exc.idempotency_key,
+                "url": request.url.path,
+            },
+            headers={"X-Error-Code": exc.error_code},
+        )
+
+    @app.exception_handler(RateLimitExceeded)
+    async def rate_limit_exceeded_handler(request, exc):
+        return JSONResponse(
+            status_code=exc.status_code,
+            content={
+                "exc": exc.__class__.__name__,
+                "error_code": exc.error_code,
+                "detail": exc.detail,
+                "group": exc.group,
+                "retry_after": exc.retry_after,
+                "url": request.url.path,
+            },
+            headers={
+                "X-Error-Code": exc.error_code,
+                "Retry-After": str(exc.retry_after),
+            },
+        )
+
     return app
@@ -0,0 +1,116 @@
+import asyncio
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Optional
+
+from sqlalchemy import Engine, text
+from sqlalchemy.exc import SQLAlchemyError
+from starlette.concurrency import run_in_threadpool
+
+from ..settings import AppSettings
+
+
+@dataclass
+class ReadinessReport:
+    status: str
+    checks: dict[str, str] = field(default_factory=dict)
+    pool: Optional[dict] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.status == "ready"
+
+
+def pool_status(engine: Engine) -> dict:
+    pool = engine.pool
+
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+    }
+
+
+def probe_database(engine: Engine) -> dict[str, str]:
+    try:
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    except SQLAlchemyError:
+        return {"database": "unavailable"}
+
+    return {"database": "ok"}
+
+
+class Readiness:
+    """Tell load balancers whether this worker should receive traffic.
+
+    The database is probed through the worker's own pool, so a passing probe
+    also means the pool holds a working connection. Results are kept for
+    cache_ttl seconds and concurrent probes share one query, so frequent
+    probes from several balancers cost one round trip per interval. A probe
+    that takes longer than timeout, for instance because every pooled
+    connection is checked out, reports the worker as not ready.
+    """
+
+    def __init__(self, cache_ttl: float = 0.0, timeout: float = 2.0):
+        self.cache_ttl = cache_ttl
+        self.timeout = timeout
+        self.draining = False
+        self._report: Optional[ReadinessReport] = None
+        self._report_until = 0.0
+        self._probe: Optional[asyncio.Future] = None
+
+    def start_draining(self):
+        self.draining = True
+
+    def reset(self):
+        self.draining = False
+        self._report = None
+        self._report_until = 0.0
+        self._probe = None
+
+    async def check(self, engine: Engine) -> ReadinessReport:
+        if self.draining:
+            return ReadinessReport(
+                status="draining",
+                checks={"shutdown": "draining"},
+                pool=pool_status(engine),
+            )
+
+        if self._report is not None and monotonic() < self._report_until:
+            return self._report
+
+        if self._probe is None:
+            # The probe keeps running after a timeout; the next check awaits
+            # it instead of queueing another query behind it.
+            self._probe = asyncio.ensure_future(
+                run_in_threadpool(probe_database, engine)
+            )
+            self._probe.add_done_callback(self._forget_probe)
+
+        try:
+            checks = await asyncio.wait_for(asyncio.shield(self._probe), self.timeout)
+        except TimeoutError:
+            checks = {"database": "timeout"}
+
+        status = "ready" if all(c == "ok" for c in checks.values()) else "not_ready"
+        self._report = ReadinessReport(
+            status=status, checks=checks, pool=pool_status(engine)
+        )
+        self._report_until = monotonic() + self.cache_ttl
+
+        return self._report
+
+    def _forget_probe(self, probe: asyncio.Future):
+        if self._probe is probe:
+            self._probe = None
+
+
+readiness = Readiness()
+
+
+def configure_readiness(settings: AppSettings):
+    readiness.cache_ttl = settings.HEALTH_CHECK_CACHE_TTL
+    readiness.timeout = settings.HEALTH_CHECK_TIMEOUT
+    readiness.reset()
@@ -0,0 +1,100 @@
+import asyncio
+import hashlib
+from time import monotonic
+from typing import Callable, Optional
+
+from fastapi import Header, Request, Response
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+from typing_extensions import Annotated
+
+from ..models.exceptions.idempotency import (
+    IdempotencyKeyInProgress,
+    IdempotencyKeyReused,
+)
+from ..services.idempotency import (
+    abandon_idempotency_key,
+    claim_idempotency_key,
+    complete_idempotency_key,
+    read_idempotency_key,
+)
+from ..settings import get_settings
+
+IDEMPOTENCY_POLL_INTERVAL = 0.05
+
+IdempotencyKeyHeader = Annotated[Optional[str], Header(min_length=1, max_length=255)]
+
+
+def request_fingerprint(request: Request, body: Optional[BaseModel] = None) -> str:
+    fingerprint = hashlib.sha256(f"{request.method} {request.url.path}".encode())
+
+    if body is not None:
+        fingerprint.update(body.model_dump_json().encode())
+
+    return fingerprint.hexdigest()
+
+
+async def idempotent_response(
+    idempotency_key: Optional[str],
+    fingerprint: str,
+    status_code: int,
+    execute: Callable[[], BaseModel],
+    session: Session,
+) -> BaseModel | Response:
+    """Run a write once per idempotency key and replay its response afterwards.
+
+    Repeats of a completed request cost one lookup by primary key. A repeat
+    arriving while the first execution is still running waits for it, up to
+    IDEMPOTENCY_WAIT_TIMEOUT. Failed requests are not stored, so they can be
+    retried with the same key.
+    """
+    if idempotency_key is None:
+        return execute()
+
+    deadline = monotonic() + get_settings().IDEMPOTENCY_WAIT_TIMEOUT
+
+    while True:
+        stored = read_idempotency_key(idempotency_key, session)
+
+        if stored is None:
+            if claim_idempotency_key(idempotency_key, fingerprint, session):
+                return execute_and_store(idempotency_key, status_code, execute, session)
+            continue
+
+        if stored.fingerprint != fingerprint:
+            raise IdempotencyKeyReused(idempotency_key=idempotency_key)
+
+        if stored.response_body is not None:
+            return json_response(stored.response_body, stored.response_status, True)
+
+        if monotonic() >= deadline:
+            raise IdempotencyKeyInProgress(idempotency_key=idempotency_key)
+
+        session.rollback()
+        await asyncio.sleep(IDEMPOTENCY_POLL_INTERVAL)
+
+
+def execute_and_store(
+    idempotency_key: str,
+    status_code: int,
+    execute: Callable[[], BaseModel],
+    session: Session,
+) -> Response:
+    try:
+        body = execute().model_dump_json().encode()
+    except Exception:
+        abandon_idempotency_key(idempotency_key, session)
+        raise
+
+    complete_idempotency_key(idempotency_key, status_code, body, session)
+
+    return json_response(body, status_code, False)
+
+
+def json_response(body: bytes, status_code: int, replayed: bool) -> Response:
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json",
+        headers={"Idempotent-Replayed": str(replayed).lower()},
+    )
@@ -0,0 +1,103 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Callable, Iterable
+
+from ..models.utils import AppResource, NameSuggestion
+from ..settings import AppSettings
+from .cache import response_cache
+
+
+@dataclass(frozen=True)
+class NameSnapshot:
+    keys: list[str]
+    suggestions: list[NameSuggestion]
+    version: int
+    loaded_at: float
+
+
+class NameIndex:
+    """Sorted in-memory array of the names of a small resource.
+
+    Names are folded to lower case and searched by prefix with bisect. The
+    array is rebuilt on the first search after a write, which write services
+    signal by bumping the resource version of the response cache, or once it
+    is older than max_age. Versions live in process memory, so max_age bounds
+    how long writes served by other workers stay invisible.
+    """
+
+    def __init__(self, resource: AppResource, max_age: float = 0.0):
+        self.resource = resource
+        self.max_age = max_age
+        self._snapshot: NameSnapshot | None = None
+        self._lock = Lock()
+
+    def search(
+        self,
+        prefix: str,
+        limit: int,
+        load: Callable[[], Iterable[NameSuggestion]],
+    ) -> list[NameSuggestion]:
+        snapshot = self._current(load)
+        folded = prefix.lower()
+        start = bisect_left(snapshot.keys, folded)
+        suggestions = []
+
+        for key, suggestion in zip(
+            snapshot.keys[start : start + limit],
+            snapshot.suggestions[start : start + limit],
+        ):
+            if not key.startswith(folded):
+                break
+            suggestions.append(suggestion)
+
+        return suggestions
+
+    def reset(self):
+        with self._lock:
+            self._snapshot = None
+
+    def _current(self, load: Callable[[], Iterable[NameSuggestion]]) -> NameSnapshot:
+        snapshot = self._snapshot
+        if self._is_fresh(snapshot):
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if self._is_fresh(snapshot):
+                return snapshot
+
+            # Read the version before loading, so a write committed while the
+            # names are read leaves the snapshot outdated rather than lost.
+            version = response_cache.version(self.resource)
+            suggestions = sorted(
+                load(),
+                key=lambda suggestion: (suggestion.name.lower(), suggestion.name),
+            )
+            snapshot = NameSnapshot(
+                keys=[suggestion.name.lower() for suggestion in suggestions],
+                suggestions=suggestions,
+                version=version,
+                loaded_at=monotonic(),
+            )
+            self._snapshot = snapshot
+
+        return snapshot
+
+    def _is_fresh(self, snapshot: NameSnapshot | None) -> bool:
+        return (
+            snapshot is not None
+            and snapshot.version == response_cache.version(self.resource)
+            and monotonic() - snapshot.loaded_at < self.max_age
+        )
+
+
+tag_names = NameIndex(AppResource.TAG)
+category_names = NameIndex(AppResource.CATEGORY)
+
+
+def configure_name_indexes(settings: AppSettings):
+    for index in (tag_names, category_names):
+        index.max_age = settings.AUTOCOMPLETE_NAME_INDEX_MAX_AGE
+        index.reset()
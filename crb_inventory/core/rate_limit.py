@@ -0,0 +1,251 @@
+import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import timedelta
+from enum import Enum
+from ipaddress import IPv4Network, IPv6Network, ip_address, ip_network
+from threading import Lock
+from time import monotonic
+from typing import Protocol
+
+from fastapi import Request
+from sqlalchemy import Engine, delete, func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from ..database_schema import RateLimitBucket
+from ..models.exceptions.rate_limit import RateLimitExceeded
+from ..settings import AppSettings
+from .database import get_engine
+
+READ_METHODS = {"GET", "HEAD", "OPTIONS"}
+BULK_SEGMENTS = {"batch-get", "bulk-delete", "bulk-deactivate"}
+
+
+class RateLimitGroup(Enum):
+    READ = "read"
+    WRITE = "write"
+    BULK = "bulk"
+
+
+@dataclass
+class RateLimit:
+    rate: float
+    burst: int
+
+    @property
+    def interval(self) -> float:
+        return 1 / self.rate
+
+    @property
+    def tolerance(self) -> float:
+        return self.interval * (self.burst - 1)
+
+
+class RateLimitBackend(Protocol):
+    def acquire(self, key: str, limit: RateLimit) -> float: ...
+
+    def reset(self): ...
+
+
+class MemoryRateLimitBackend:
+    """Token buckets held in process memory.
+
+    Each bucket is stored as the time at which it will be full again (GCRA),
+    so taking a token is one comparison and one assignment under the lock.
+    Limits are enforced per worker process.
+    """
+
+    def __init__(self, max_buckets: int):
+        self.max_buckets = max_buckets
+        self._buckets: OrderedDict[str, float] = OrderedDict()
+        self._lock = Lock()
+
+    def acquire(self, key: str, limit: RateLimit) -> float:
+        now = monotonic()
+
+        with self._lock:
+            arrival = max(self._buckets.pop(key, now), now)
+
+            if arrival - now > limit.tolerance:
+                self._buckets[key] = arrival
+                return arrival - now - limit.tolerance
+
+            self._buckets[key] = arrival + limit.interval
+
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+
+        return 0.0
+
+    def reset(self):
+        with self._lock:
+            self._buckets.clear()
+
+
+class DatabaseRateLimitBackend:
+    """Token buckets shared by every worker through an unlogged table.
+
+    Taking a token is a single upsert that only advances the bucket when the
+    request is allowed. Denied requests read the bucket once more to work out
+    Retry-After.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+    def acquire(self, key: str, limit: RateLimit) -> float:
+        bucket = RateLimitBucket.__table__
+        interval = timedelta(seconds=limit.interval)
+        tolerance = timedelta(seconds=limit.tolerance)
+        arrival = func.greatest(bucket.c.arrival_at, func.now())
+
+        acquire_statement = insert(bucket).values(
+            key=key, arrival_at=func.now() + interval
+        )
+        acquire_statement = acquire_statement.on_conflict_do_update(
+            index_elements=[bucket.c.key],
+            set_={"arrival_at": arrival + interval},
+            where=arrival - func.now() <= tolerance,
+        ).returning(bucket.c.key)
+
+        with self.engine.begin() as connection:
+            if connection.execute(acquire_statement).first() is not None:
+                return 0.0
+
+            retry_after = connection.scalar(
+                select(
+                    func.extract("epoch", bucket.c.arrival_at - func.now() - tolerance)
+                ).where(bucket.c.key == key)
+            )
+
+        return max(float(retry_after or 0), 0.0)
+
+    def reset(self):
+        with self.engine.begin() as connection:
+            connection.execute(delete(RateLimitBucket))
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        backend: RateLimitBackend,
+        limits: dict[RateLimitGroup, RateLimit],
+        enabled: bool = True,
+        trusted_proxies: list[IPv4Network | IPv6Network] | None = None,
+    ):
+        self.backend = backend
+        self.limits = limits
+        self.enabled = enabled
+        self.trusted_proxies = trusted_proxies or []
+
+    def is_trusted_proxy(self, host: str) -> bool:
+        try:
+            address = ip_address(host)
+        except ValueError:
+            return False
+
+        return any(address in network for network in self.trusted_proxies)
+
+    def acquire(self, client: str, group: RateLimitGroup) -> float:
+        """Take a token for the client and return seconds to wait if denied."""
+        return self.backend.acquire(f"{group.value}:{client}", self.limits[group])
+
+    def reset(self):
+        self.backend.reset()
+
+
+def build_rate_limit_backend(settings: AppSettings) -> RateLimitBackend:
+    if settings.RATE_LIMIT_BACKEND == "database":
+        return DatabaseRateLimitBackend(get_engine())
+
+    return MemoryRateLimitBackend(max_buckets=settings.RATE_LIMIT_MAX_BUCKETS)
+
+
+# Disabled until the application configures it on startup.
+rate_limiter = RateLimiter(
+    backend=MemoryRateLimitBackend(max_buckets=0), limits={}, enabled=False
+)
+
+
+def configure_rate_limiter(settings: AppSettings):
+    rate_limiter.backend = build_rate_limit_backend(settings)
+    rate_limiter.limits = {
+        RateLimitGroup.READ: RateLimit(
+            rate=settings.RATE_LIMIT_READ_RATE, burst=settings.RATE_LIMIT_READ_BURST
+        ),
+        RateLimitGroup.WRITE: RateLimit(
+            rate=settings.RATE_LIMIT_WRITE_RATE,
+            burst=settings.RATE_LIMIT_WRITE_BURST,
+        ),
+        RateLimitGroup.BULK: RateLimit(
+            rate=settings.RATE_LIMIT_BULK_RATE, burst=settings.RATE_LIMIT_BULK_BURST
+        ),
+    }
+    rate_limiter.enabled = settings.RATE_LIMIT_ENABLED
+    rate_limiter.trusted_proxies = parse_trusted_proxies(
+        settings.RATE_LIMIT_TRUSTED_PROXIES
+    )
+
+
+def parse_trusted_proxies(proxies: str) -> list[IPv4Network | IPv6Network]:
+    """Parse a comma separated list of proxy addresses and networks."""
+    return [
+        ip_network(proxy.strip(), strict=False)
+        for proxy in proxies.split(",")
+        if proxy.strip()
+    ]
+
+
+def client_identity(request: Request) -> str:
+    """Identify the client by the address it connects from.
+
+    Nothing verifies headers such as X-API-Key, and a client rotating them
+    would get a fresh bucket on every request, so only addresses are used.
+    X-Forwarded-For is read when the peer is a trusted proxy: the client is
+    the last address in it that is not a trusted proxy, as every address
+    before that one was sent by the client itself.
+    """
+    host = request.client.host if request.client else "unknown"
+
+    if not rate_limiter.is_trusted_proxy(host):
+        return f"ip:{host}"
+
+    forwarded = [
+        address.strip()
+        for header in request.headers.getlist("X-Forwarded-For")
+        for address in header.split(",")
+        if address.strip()
+    ]
+
+    for address in reversed(forwarded):
+        host = address
+        if not rate_limiter.is_trusted_proxy(address):
+            break
+
+    return f"ip:{host}"
+
+
+def route_group(request: Request) -> RateLimitGroup:
+    if BULK_SEGMENTS.intersection(request.url.path.split("/")):
+        return RateLimitGroup.BULK
+
+    if request.method in READ_METHODS:
+        return RateLimitGroup.READ
+
+    return RateLimitGroup.WRITE
+
+
+async def rate_limit(request: Request):
+    """Router dependency rejecting clients that ran out of tokens with 429.
+
+    It is resolved before the endpoint dependencies, so rejected requests
+    never check out a database connection.
+    """
+    if not rate_limiter.enabled:
+        return
+
+    group = route_group(request)
+    retry_after = rate_limiter.acquire(client_identity(request), group)
+
+    if retry_after > 0:
+        raise RateLimitExceeded(group=group.value, retry_after=math.ceil(retry_after))
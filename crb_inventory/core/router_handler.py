@@ -1,10 +1,13 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 
-from ..routers.v1 import category, item, tag
+from ..routers.v1 import category, item, metrics, reservation, tag
+from .rate_limit import rate_limit
 
 
 def include_routers_v1(app: FastAPI):
-    app.include_router(category.router)
-    app.include_router(tag.router)
-    app.include_router(item.router)
+    app.include_router(category.router, dependencies=[Depends(rate_limit)])
+    app.include_router(tag.router, dependencies=[Depends(rate_limit)])
+    app.include_router(item.router, dependencies=[Depends(rate_limit)])
+    app.include_router(reservation.router, dependencies=[Depends(rate_limit)])
+    app.include_router(metrics.router)
     return app
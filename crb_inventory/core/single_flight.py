@@ -0,0 +1,64 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable
+
+from starlette.concurrency import run_in_threadpool
+
+
+@dataclass
+class SingleFlightStats:
+    executions: int = 0
+    coalesced: int = 0
+
+
+class SingleFlight:
+    """Share one execution among identical calls that overlap in time.
+
+    The first caller for a key runs the function in the thread pool, which
+    leaves the event loop free to accept the identical requests arriving in
+    the meantime. Those await the same result instead of querying again.
+    Nothing is kept once the execution finishes, so this never serves data
+    older than the request that is already in flight.
+    """
+
+    def __init__(self):
+        self._calls: dict[Hashable, asyncio.Task] = {}
+        self._stats = SingleFlightStats()
+
+    async def run(self, key: Hashable, function: Callable[[], Any]) -> Any:
+        """Run the function once for every caller of key that overlaps.
+
+        The execution is a task of its own that every caller awaits through
+        shield, so a caller that goes away leaves it and the other callers
+        alone.
+        """
+        call = self._calls.get(key)
+
+        if call is not None:
+            self._stats.coalesced += 1
+            return await asyncio.shield(call)
+
+        call = asyncio.ensure_future(run_in_threadpool(function))
+        call.add_done_callback(lambda _: self._finish(key, call))
+        self._calls[key] = call
+        self._stats.executions += 1
+
+        return await asyncio.shield(call)
+
+    def _finish(self, key: Hashable, call: asyncio.Task):
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+        # Mark the exception as retrieved when every caller went away.
+        if not call.cancelled():
+            call.exception()
+
+    def stats(self) -> dict:
+        return {
+            "executions": self._stats.executions,
+            "coalesced": self._stats.coalesced,
+            "in_flight": len(self._calls),
+        }
+
+
+read_flights = SingleFlight()
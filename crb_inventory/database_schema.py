@@ -1,8 +1,26 @@
 from datetime import datetime
 from typing import List, Optional
 
-from sqlalchemy import Column, ForeignKey, Table, func
-from sqlalchemy.dialects.postgresql import BOOLEAN, INTEGER, TEXT, TIMESTAMP
+from sqlalchemy import (
+    DDL,
+    Column,
+    ForeignKey,
+    Identity,
+    Index,
+    Table,
+    event,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import (
+    BIGINT,
+    BOOLEAN,
+    BYTEA,
+    INTEGER,
+    JSONB,
+    TEXT,
+    TIMESTAMP,
+)
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, registry, relationship
 
@@ -15,15 +33,19 @@ item_tag_association = Table(
     Column(
         "item_id",
         PG_UUID(as_uuid=False),
-        ForeignKey("item.id"),
+        # Deferred and without ON DELETE: tag_item_count_trigger removes the
+        # tags of deleted items once it has counted them.
+        ForeignKey("item.id", deferrable=True, initially="DEFERRED"),
         primary_key=True,
     ),
     Column(
         "tag_id",
         PG_UUID(as_uuid=False),
-        ForeignKey("tag.id"),
+        ForeignKey("tag.id", ondelete="CASCADE"),
         primary_key=True,
     ),
+    # The primary key leads with item_id; item lists by tag start from here.
+    Index("ix_item_tag_association_tag_id_item_id", "tag_id", "item_id"),
 )
 
 
@@ -47,17 +69,33 @@ class Category:
         server_default=func.now(),
         onupdate=func.now(),
     )
-    items: Mapped[List["Item"]] = relationship("Item", backref="category", init=False)
+    version: Mapped[int] = mapped_column(
+        INTEGER, init=False, nullable=False, server_default="1"
+    )
+    __mapper_args__ = {"version_id_col": version}
+    # Deletes never load the items: the RESTRICT foreign key rejects deleting
+    # a category that still has some, and services move or remove them first.
+    items: Mapped[List["Item"]] = relationship(
+        "Item", backref="category", init=False, passive_deletes="all"
+    )
 
 
 # tag table
 @mapper_registry.mapped_as_dataclass
 class Tag:
     __tablename__ = "tag"
+    __table_args__ = (Index("ix_tag_active_item_count_id", "active_item_count", "id"),)
     id: Mapped[str] = mapped_column(PG_UUID(as_uuid=False), primary_key=True)
     name: Mapped[str] = mapped_column(TEXT, unique=True, index=True, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(TEXT, nullable=True)
     is_active: Mapped[bool] = mapped_column(BOOLEAN, init=False, server_default="true")
+    # Kept by tag_item_count_trigger, see services/tag_counts.py for repairs.
+    item_count: Mapped[int] = mapped_column(
+        INTEGER, init=False, nullable=False, server_default="0"
+    )
+    active_item_count: Mapped[int] = mapped_column(
+        INTEGER, init=False, nullable=False, server_default="0"
+    )
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), init=False, server_default=func.now()
     )
@@ -67,8 +105,15 @@ class Tag:
         server_default=func.now(),
         onupdate=func.now(),
     )
+    version: Mapped[int] = mapped_column(
+        INTEGER, init=False, nullable=False, server_default="1"
+    )
+    __mapper_args__ = {"version_id_col": version}
     items: Mapped[List["Item"]] = relationship(
-        secondary=item_tag_association, back_populates="tags", init=False
+        secondary=item_tag_association,
+        back_populates="tags",
+        init=False,
+        passive_deletes=True,
     )
 
 
@@ -76,6 +121,47 @@ class Tag:
 @mapper_registry.mapped_as_dataclass
 class Item:
     __tablename__ = "item"
+    __table_args__ = (
+        Index("ix_item_updated_at_id", "updated_at", "id"),
+        Index(
+            "ix_item_inactive_updated_at",
+            "updated_at",
+            postgresql_where=text("NOT is_active"),
+        ),
+        # Covers the per-category stats of the category list, which can then
+        # be aggregated with an index-only scan.
+        Index(
+            "ix_item_category_id_is_active",
+            "category_id",
+            "is_active",
+            postgresql_include=["stock_quantity", "minimum_threshold"],
+        ),
+        # Sort orders of the active item lists, see services/item_order.py.
+        # The full list sorts on (key, id), newest first by the primary key
+        # and by update time through ix_item_updated_at_id. The list of one
+        # category sorts on (category_id, key, id).
+        *(
+            Index(
+                f"ix_item_active_{name}_id",
+                *key,
+                "id",
+                postgresql_where=text("is_active IS TRUE"),
+            )
+            for name, key in (
+                ("name", ("name",)),
+                ("stock_quantity", ("stock_quantity",)),
+                ("shortfall", (text("(minimum_threshold - stock_quantity)"),)),
+                ("category_id", ("category_id",)),
+                ("category_id_name", ("category_id", "name")),
+                ("category_id_stock_quantity", ("category_id", "stock_quantity")),
+                ("category_id_updated_at", ("category_id", "updated_at")),
+                (
+                    "category_id_shortfall",
+                    ("category_id", text("(minimum_threshold - stock_quantity)")),
+                ),
+            )
+        ),
+    )
     id: Mapped[str] = mapped_column(
         PG_UUID(as_uuid=False),
         primary_key=True,
@@ -83,9 +169,14 @@ class Item:
     name: Mapped[str] = mapped_column(TEXT, unique=True, index=True, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(TEXT, nullable=True)
     is_active: Mapped[bool] = mapped_column(BOOLEAN, init=False, server_default="true")
-    category_id: Mapped[str] = mapped_column(ForeignKey("category.id"), nullable=False)
+    category_id: Mapped[str] = mapped_column(
+        ForeignKey("category.id", ondelete="RESTRICT"), nullable=False
+    )
     minimum_threshold: Mapped[int] = mapped_column(INTEGER, nullable=False)
     stock_quantity: Mapped[int] = mapped_column(INTEGER, nullable=False)
+    reserved_quantity: Mapped[int] = mapped_column(
+        INTEGER, init=False, nullable=False, server_default="0"
+    )
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True), init=False, server_default=func.now()
     )
@@ -95,6 +186,404 @@ class Item:
         server_default=func.now(),
         onupdate=func.now(),
     )
+    version: Mapped[int] = mapped_column(
+        INTEGER, init=False, nullable=False, server_default="1"
+    )
+    __mapper_args__ = {"version_id_col": version}
     tags: Mapped[List["Tag"]] = relationship(
-        secondary=item_tag_association, back_populates="items", init=False
+        secondary=item_tag_association,
+        back_populates="items",
+        init=False,
+        passive_deletes=True,
+    )
+
+
+# The unique name index follows the database collation, which LIKE cannot use
+# for prefixes. Autocomplete searches this one instead.
+Index(
+    "ix_item_name_pattern",
+    func.lower(Item.name).label("name_lower"),
+    postgresql_ops={"name_lower": "text_pattern_ops"},
+    postgresql_where=text("is_active IS TRUE"),
+)
+
+
+# archive tables for items inactive for longer than the retention period
+item_archive = Table(
+    "item_archive",
+    mapper_registry.metadata,
+    Column("id", PG_UUID(as_uuid=False), primary_key=True),
+    Column("name", TEXT, nullable=False),
+    Column("description", TEXT, nullable=True),
+    Column("is_active", BOOLEAN, nullable=False),
+    Column("category_id", PG_UUID(as_uuid=False), nullable=False),
+    Column("minimum_threshold", INTEGER, nullable=False),
+    Column("stock_quantity", INTEGER, nullable=False),
+    Column("created_at", TIMESTAMP(timezone=True), nullable=False),
+    Column("updated_at", TIMESTAMP(timezone=True), nullable=False),
+    Column("version", INTEGER, nullable=False, server_default="1"),
+    Column(
+        "archived_at",
+        TIMESTAMP(timezone=True),
+        server_default=func.now(),
+        nullable=False,
+    ),
+)
+
+item_tag_association_archive = Table(
+    "item_tag_association_archive",
+    mapper_registry.metadata,
+    Column("item_id", PG_UUID(as_uuid=False), primary_key=True),
+    Column("tag_id", PG_UUID(as_uuid=False), primary_key=True),
+)
+
+
+# item tombstones for delta sync
+@mapper_registry.mapped_as_dataclass
+class ItemTombstone:
+    __tablename__ = "item_tombstone"
+    __table_args__ = (
+        Index("ix_item_tombstone_deleted_at_item_id", "deleted_at", "item_id"),
+    )
+    item_id: Mapped[str] = mapped_column(PG_UUID(as_uuid=False), primary_key=True)
+    deleted_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), init=False, server_default=func.now()
+    )
+
+
+# item change feed (outbox)
+@mapper_registry.mapped_as_dataclass
+class ItemChangeEvent:
+    __tablename__ = "item_change_event"
+    __table_args__ = (Index("ix_item_change_event_xid_id", "xid", "id"),)
+    id: Mapped[int] = mapped_column(
+        BIGINT, Identity(always=True), primary_key=True, init=False
+    )
+    item_id: Mapped[str] = mapped_column(PG_UUID(as_uuid=False), nullable=False)
+    event_type: Mapped[str] = mapped_column(TEXT, nullable=False)
+    payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), init=False, server_default=func.now(), index=True
+    )
+    # id of the writing transaction, the feed reads events in (xid, id) order
+    xid: Mapped[int] = mapped_column(
+        BIGINT,
+        nullable=False,
+        init=False,
+        server_default=text("pg_current_xact_id()::text::bigint"),
+    )
+
+
+ITEM_CHANGES_CHANNEL = "item_changes"
+
+# Every write to item appends an event to the outbox and notifies listeners in
+# the same transaction. Payloads too large for NOTIFY are sent without the item
+# snapshot. The change feed reads events back from the outbox in commit-safe
+# order, so it only uses the notification to wake up. Updates that only move
+# reserved stock happen on every reservation and are not recorded.
+item_change_event_trigger = DDL(
+    """
+CREATE OR REPLACE FUNCTION record_item_change() RETURNS trigger AS $$
+DECLARE
+    event_id BIGINT;
+    event_type TEXT;
+    event_item_id UUID;
+    event_payload JSONB;
+    event_created_at TIMESTAMPTZ;
+    message TEXT;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        event_type := 'item.created';
+        event_item_id := NEW.id;
+        event_payload := to_jsonb(NEW);
+    ELSIF TG_OP = 'DELETE' THEN
+        event_type := 'item.deleted';
+        event_item_id := OLD.id;
+        event_payload := jsonb_build_object('id', OLD.id);
+    ELSE
+        IF (to_jsonb(NEW) - 'reserved_quantity')
+            = (to_jsonb(OLD) - 'reserved_quantity') THEN
+            RETURN NULL;
+        END IF;
+
+        IF NEW.stock_quantity IS DISTINCT FROM OLD.stock_quantity
+            AND (to_jsonb(NEW) - 'stock_quantity' - 'reserved_quantity'
+                - 'updated_at' - 'version')
+                = (to_jsonb(OLD) - 'stock_quantity' - 'reserved_quantity'
+                - 'updated_at' - 'version') THEN
+            event_type := 'item.stock_changed';
+        ELSE
+            event_type := 'item.updated';
+        END IF;
+        event_item_id := NEW.id;
+        event_payload := to_jsonb(NEW);
+    END IF;
+
+    INSERT INTO item_change_event (item_id, event_type, payload)
+    VALUES (event_item_id, event_type, event_payload)
+    RETURNING id, created_at INTO event_id, event_created_at;
+
+    message := json_build_object(
+        'id', event_id,
+        'event_type', event_type,
+        'item_id', event_item_id,
+        'created_at', event_created_at,
+        'payload', event_payload
+    )::text;
+
+    IF octet_length(message) > 7900 THEN
+        message := json_build_object('id', event_id, 'truncated', true)::text;
+    END IF;
+
+    PERFORM pg_notify('item_changes', message);
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER item_change_event_trigger
+AFTER INSERT OR UPDATE OR DELETE ON item
+FOR EACH ROW EXECUTE FUNCTION record_item_change();
+"""
+)
+
+event.listen(Item.__table__, "after_create", item_change_event_trigger)
+
+
+# per-category inventory totals over active items
+@mapper_registry.mapped_as_dataclass
+class CategoryInventorySummary:
+    __tablename__ = "category_inventory_summary"
+    category_id: Mapped[str] = mapped_column(
+        ForeignKey("category.id", ondelete="CASCADE"), primary_key=True
+    )
+    active_item_count: Mapped[int] = mapped_column(
+        INTEGER, nullable=False, server_default="0"
+    )
+    total_stock: Mapped[int] = mapped_column(BIGINT, nullable=False, server_default="0")
+    low_stock_item_count: Mapped[int] = mapped_column(
+        INTEGER, nullable=False, server_default="0"
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), init=False, server_default=func.now()
+    )
+
+
+# Statement level triggers fold every write to item into one net delta per
+# category, so bulk statements such as the archive job touch each summary row
+# once and writes that do not change any total touch none. Rows are upserted
+# in category order so concurrent writers cannot deadlock on them. An item is
+# low on stock when its stock is below its minimum threshold.
+category_inventory_summary_trigger = DDL(
+    """
+CREATE OR REPLACE FUNCTION apply_category_inventory_delta() RETURNS trigger AS $$
+DECLARE
+    changed_items TEXT;
+BEGIN
+    changed_items := CASE TG_OP
+        WHEN 'INSERT' THEN 'SELECT *, 1 AS sign FROM new_items'
+        WHEN 'DELETE' THEN 'SELECT *, -1 AS sign FROM old_items'
+        ELSE 'SELECT *, 1 AS sign FROM new_items '
+            || 'UNION ALL SELECT *, -1 AS sign FROM old_items'
+    END;
+
+    EXECUTE '
+        INSERT INTO category_inventory_summary AS summary (
+            category_id, active_item_count, total_stock, low_stock_item_count
+        )
+        SELECT category_id, items, stock, low_stock
+        FROM (
+            SELECT
+                category_id,
+                sum(sign) AS items,
+                sum(sign * stock_quantity) AS stock,
+                coalesce(
+                    sum(sign) FILTER (WHERE stock_quantity < minimum_threshold), 0
+                ) AS low_stock
+            FROM (' || changed_items || ') AS changed
+            WHERE is_active
+            GROUP BY category_id
+        ) AS delta
+        WHERE items <> 0 OR stock <> 0 OR low_stock <> 0
+        ORDER BY category_id
+        ON CONFLICT (category_id) DO UPDATE SET
+            active_item_count = summary.active_item_count + EXCLUDED.active_item_count,
+            total_stock = summary.total_stock + EXCLUDED.total_stock,
+            low_stock_item_count =
+                summary.low_stock_item_count + EXCLUDED.low_stock_item_count,
+            updated_at = now()';
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER category_inventory_insert_trigger
+AFTER INSERT ON item REFERENCING NEW TABLE AS new_items
+FOR EACH STATEMENT EXECUTE FUNCTION apply_category_inventory_delta();
+
+CREATE TRIGGER category_inventory_update_trigger
+AFTER UPDATE ON item REFERENCING OLD TABLE AS old_items NEW TABLE AS new_items
+FOR EACH STATEMENT EXECUTE FUNCTION apply_category_inventory_delta();
+
+CREATE TRIGGER category_inventory_delete_trigger
+AFTER DELETE ON item REFERENCING OLD TABLE AS old_items
+FOR EACH STATEMENT EXECUTE FUNCTION apply_category_inventory_delta();
+"""
+)
+
+event.listen(Item.__table__, "after_create", category_inventory_summary_trigger)
+
+
+# Statement level triggers fold the tag writes of a statement into one delta
+# per tag, applied in tag order so concurrent writers cannot deadlock. Tags of
+# deleted items are removed by the item delete trigger rather than an
+# ON DELETE CASCADE: cascaded rows arrive after their item is gone, when it
+# can no longer be told whether the item was active. Rows whose item is gone
+# are therefore skipped by the association delete trigger.
+tag_item_count_trigger = DDL(
+    """
+CREATE OR REPLACE FUNCTION apply_tag_item_count_delta() RETURNS trigger AS $$
+DECLARE
+    changed_tags TEXT;
+BEGIN
+    changed_tags := CASE
+        WHEN TG_TABLE_NAME = 'item' AND TG_OP = 'UPDATE' THEN '
+            SELECT
+                association.tag_id,
+                0 AS items,
+                CASE WHEN new_items.is_active THEN 1 ELSE -1 END AS active_items
+            FROM new_items
+            JOIN old_items ON old_items.id = new_items.id
+            JOIN item_tag_association AS association
+                ON association.item_id = new_items.id
+            WHERE new_items.is_active <> old_items.is_active'
+        WHEN TG_TABLE_NAME = 'item' THEN '
+            DELETE FROM item_tag_association AS association
+            USING old_items
+            WHERE association.item_id = old_items.id
+            RETURNING
+                association.tag_id,
+                -1 AS items,
+                CASE WHEN old_items.is_active THEN -1 ELSE 0 END AS active_items'
+        WHEN TG_OP = 'INSERT' THEN '
+            SELECT
+                new_rows.tag_id,
+                1 AS items,
+                CASE WHEN item.is_active THEN 1 ELSE 0 END AS active_items
+            FROM new_rows
+            JOIN item ON item.id = new_rows.item_id'
+        ELSE '
+            SELECT
+                old_rows.tag_id,
+                -1 AS items,
+                CASE WHEN item.is_active THEN -1 ELSE 0 END AS active_items
+            FROM old_rows
+            JOIN item ON item.id = old_rows.item_id'
+    END;
+
+    EXECUTE '
+        WITH changed AS (' || changed_tags || '),
+        delta AS (
+            SELECT tag_id, sum(items) AS items, sum(active_items) AS active_items
+            FROM changed
+            GROUP BY tag_id
+            HAVING sum(items) <> 0 OR sum(active_items) <> 0
+        ),
+        locked AS (
+            SELECT tag.id
+            FROM tag
+            JOIN delta ON delta.tag_id = tag.id
+            ORDER BY tag.id
+            FOR NO KEY UPDATE OF tag
+        )
+        UPDATE tag SET
+            item_count = tag.item_count + delta.items,
+            active_item_count = tag.active_item_count + delta.active_items
+        FROM delta
+        WHERE tag.id = delta.tag_id AND tag.id IN (SELECT id FROM locked)';
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER tag_item_count_insert_trigger
+AFTER INSERT ON item_tag_association REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION apply_tag_item_count_delta();
+
+CREATE TRIGGER tag_item_count_delete_trigger
+AFTER DELETE ON item_tag_association REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION apply_tag_item_count_delta();
+
+CREATE TRIGGER tag_item_count_item_update_trigger
+AFTER UPDATE ON item REFERENCING OLD TABLE AS old_items NEW TABLE AS new_items
+FOR EACH STATEMENT EXECUTE FUNCTION apply_tag_item_count_delta();
+
+CREATE TRIGGER tag_item_count_item_delete_trigger
+AFTER DELETE ON item REFERENCING OLD TABLE AS old_items
+FOR EACH STATEMENT EXECUTE FUNCTION apply_tag_item_count_delta();
+"""
+)
+
+event.listen(item_tag_association, "after_create", tag_item_count_trigger)
+
+
+# stock reservations (holds on item stock until confirmed, released or expired)
+@mapper_registry.mapped_as_dataclass
+class StockReservation:
+    __tablename__ = "stock_reservation"
+    __table_args__ = (
+        Index(
+            "ix_stock_reservation_held_expires_at",
+            "expires_at",
+            postgresql_where=text("status = 'held'"),
+        ),
+    )
+    id: Mapped[str] = mapped_column(PG_UUID(as_uuid=False), primary_key=True)
+    item_id: Mapped[str] = mapped_column(
+        ForeignKey("item.id", ondelete="CASCADE"), index=True, nullable=False
+    )
+    quantity: Mapped[int] = mapped_column(INTEGER, nullable=False)
+    status: Mapped[str] = mapped_column(TEXT, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), init=False, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        init=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
+# idempotency keys (first response of a keyed write, replayed on retries)
+@mapper_registry.mapped_as_dataclass
+class IdempotencyKey:
+    __tablename__ = "idempotency_key"
+    key: Mapped[str] = mapped_column(TEXT, primary_key=True)
+    fingerprint: Mapped[str] = mapped_column(TEXT, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), index=True, nullable=False
+    )
+    response_status: Mapped[Optional[int]] = mapped_column(
+        INTEGER, init=False, nullable=True
+    )
+    response_body: Mapped[Optional[bytes]] = mapped_column(
+        BYTEA, init=False, nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), init=False, server_default=func.now()
+    )
+
+
+# rate limit buckets shared by workers (unlogged: losing them on a crash is fine)
+@mapper_registry.mapped_as_dataclass
+class RateLimitBucket:
+    __tablename__ = "rate_limit_bucket"
+    __table_args__ = {"prefixes": ["UNLOGGED"]}
+    key: Mapped[str] = mapped_column(TEXT, primary_key=True)
+    arrival_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), nullable=False
     )
@@ -0,0 +1,46 @@
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from ..core.database import get_engine
+from ..services.item_archive import archive_inactive_items
+from ..settings import get_settings
+
+
+def main():
+    settings = get_settings()
+    parser = argparse.ArgumentParser(
+        description="Move items inactive for longer than the retention period "
+        "to the archive tables, in throttled batches."
+    )
+    parser.add_argument(
+        "--inactive-days", type=int, default=settings.ARCHIVE_INACTIVE_AFTER_DAYS
+    )
+    parser.add_argument("--batch-size", type=int, default=settings.ARCHIVE_BATCH_SIZE)
+    parser.add_argument("--pause", type=float, default=settings.ARCHIVE_BATCH_PAUSE)
+    args = parser.parse_args()
+
+    inactive_before = datetime.now(timezone.utc) - timedelta(days=args.inactive_days)
+    total_archived = 0
+
+    with Session(get_engine()) as session:
+        while True:
+            archived = archive_inactive_items(
+                inactive_before=inactive_before,
+                batch_size=args.batch_size,
+                session=session,
+            )
+            total_archived += archived
+
+            if archived < args.batch_size:
+                break
+
+            time.sleep(args.pause)
+
+    print(f"Archived {total_archived} items inactive since {inactive_before}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+import argparse
+import time
+
+from sqlalchemy.orm import Session
+
+from ..core.database import get_engine
+from ..services.reservation import expire_reservations
+from ..settings import get_settings
+
+
+def main():
+    settings = get_settings()
+    parser = argparse.ArgumentParser(
+        description="Expire lapsed stock reservations and return their stock. "
+        "Several sweepers may run at once."
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=settings.RESERVATION_SWEEP_BATCH_SIZE
+    )
+    parser.add_argument(
+        "--interval", type=float, default=settings.RESERVATION_SWEEP_INTERVAL
+    )
+    parser.add_argument(
+        "--once",
+        action="store_true",
+        help="Sweep until no lapsed reservations remain, then exit",
+    )
+    args = parser.parse_args()
+
+    total_expired = 0
+
+    with Session(get_engine()) as session:
+        while True:
+            expired = expire_reservations(batch_size=args.batch_size, session=session)
+            total_expired += expired
+
+            if expired == args.batch_size:
+                continue
+
+            if args.once:
+                break
+
+            time.sleep(args.interval)
+
+    print(f"Expired {total_expired} stock reservations")
+
+
+if __name__ == "__main__":
+    main()
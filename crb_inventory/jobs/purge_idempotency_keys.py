@@ -0,0 +1,22 @@
+import argparse
+
+from sqlalchemy.orm import Session
+
+from ..core.database import get_engine
+from ..services.idempotency import purge_idempotency_keys
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Delete idempotency keys whose retention period has ended."
+    )
+    parser.parse_args()
+
+    with Session(get_engine()) as session:
+        purged = purge_idempotency_keys(session=session)
+
+    print(f"Purged {purged} expired idempotency keys")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import argparse
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from ..core.database import get_engine
+from ..services.item_changes import purge_item_changes
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Delete item change events older than the retention period."
+    )
+    parser.add_argument("--retention-days", type=int, default=7)
+    args = parser.parse_args()
+
+    before = datetime.now(timezone.utc) - timedelta(days=args.retention_days)
+
+    with Session(get_engine()) as session:
+        purged = purge_item_changes(before=before, session=session)
+
+    print(f"Purged {purged} item change events older than {before.isoformat()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import argparse
+
+from sqlalchemy.orm import Session
+
+from ..core.database import get_engine
+from ..services.category_summary import reconcile_category_inventory_summary
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Verify the per-category inventory summary against the item "
+        "table and repair any drift."
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report drift without repairing it"
+    )
+    args = parser.parse_args()
+
+    with Session(get_engine()) as session:
+        drifts = reconcile_category_inventory_summary(
+            repair=not args.dry_run, session=session
+        )
+
+    for drift in drifts:
+        print(
+            f"{drift.category_id}: expected {drift.expected.model_dump()}, "
+            f"found {drift.actual.model_dump()}"
+        )
+
+    action = "Found" if args.dry_run else "Repaired"
+    print(f"{action} drift in {len(drifts)} category inventory summaries")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+import argparse
+
+from sqlalchemy.orm import Session
+
+from ..core.database import get_engine
+from ..services.tag_counts import reconcile_tag_item_counts
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Verify the per-tag item counters against the item tags and "
+        "repair any drift."
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Report drift without repairing it"
+    )
+    args = parser.parse_args()
+
+    with Session(get_engine()) as session:
+        drifts = reconcile_tag_item_counts(repair=not args.dry_run, session=session)
+
+    for drift in drifts:
+        print(
+            f"{drift.tag_id}: expected {drift.expected.model_dump()}, "
+            f"found {drift.actual.model_dump()}"
+        )
+
+    action = "Found" if args.dry_run else "Repaired"
+    print(f"{action} drift in {len(drifts)} tag item counters")
+
+
+if __name__ == "__main__":
+    main()
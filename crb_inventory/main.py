@@ -1,10 +1,18 @@
+from contextlib import asynccontextmanager
 from http import HTTPStatus
 
 from fastapi import FastAPI
 
+from .core.cache import configure_response_cache
+from .core.change_feed import item_change_feed
+from .core.database import dispose_engine
 from .core.exception_handler import include_exceptions
+from .core.health import configure_readiness, readiness
+from .core.name_index import configure_name_indexes
+from .core.rate_limit import configure_rate_limiter
 from .core.router_handler import include_routers_v1
-from .settings import AppSettings
+from .routers import health
+from .settings import AppSettings, get_settings
 
 APP_DATA = {
     "name": "CRB Inventory API",
@@ -16,58 +24,87 @@ APP_DATA = {
 }
 
 
-settings = AppSettings()
-
-tags_metadata = [
-    {
-        "name": "v1",
-        "description": "CRB Inventory API v1, doc link on the right",
-        "externalDocs": {
-            "description": "API v1 Documentation",
-            "url": f"{settings.APP_URL}{APP_DATA["docs_v1"]}",
-        },
-    }
-]
-
-app = FastAPI(
-    title=APP_DATA["name"],
-    description=APP_DATA["description"],
-    openapi_tags=tags_metadata,
-)
-
-
-@app.get(
-    "/",
-    status_code=HTTPStatus.OK,
-    include_in_schema=False,
-)
-async def root_endpoint():
-    return {
-        "api_name": APP_DATA["name"],
-        "version": APP_DATA["latest_version"],
-        "docs": APP_DATA["docs"],
-    }
-
-
-v1 = FastAPI(
-    title=APP_DATA["name"],
-    description=APP_DATA["description"],
-)
-v1 = include_routers_v1(v1)
-v1 = include_exceptions(v1)
-
-
-@v1.get(
-    "/",
-    status_code=HTTPStatus.OK,
-    include_in_schema=False,
-)
-async def v1_root_endpoint():
-    return {
-        "api_name": APP_DATA["name"],
-        "version": APP_DATA["version_v1"],
-        "docs": APP_DATA["docs_v1"],
-    }
-
-
-app.mount("/v1", v1, name="v1")
+def build_tags_metadata(settings: AppSettings) -> list:
+    return [
+        {
+            "name": "v1",
+            "description": "CRB Inventory API v1, doc link on the right",
+            "externalDocs": {
+                "description": "API v1 Documentation",
+                "url": f"{settings.APP_URL}{APP_DATA['docs_v1']}",
+            },
+        }
+    ]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Settings are parsed here rather than at import time, and the engine is
+    # only created when the first request needs a connection.
+    settings = get_settings()
+    app.openapi_tags = build_tags_metadata(settings)
+    configure_response_cache(settings)
+    configure_rate_limiter(settings)
+    configure_readiness(settings)
+    configure_name_indexes(settings)
+
+    yield
+
+    readiness.start_draining()
+    item_change_feed.stop()
+    dispose_engine()
+
+
+def create_v1_app() -> FastAPI:
+    v1 = FastAPI(
+        title=APP_DATA["name"],
+        description=APP_DATA["description"],
+    )
+    v1 = include_routers_v1(v1)
+    v1 = include_exceptions(v1)
+
+    @v1.get(
+        "/",
+        status_code=HTTPStatus.OK,
+        include_in_schema=False,
+    )
+    async def v1_root_endpoint():
+        return {
+            "api_name": APP_DATA["name"],
+            "version": APP_DATA["version_v1"],
+            "docs": APP_DATA["docs_v1"],
+        }
+
+    return v1
+
+
+def create_app() -> FastAPI:
+    app = FastAPI(
+        title=APP_DATA["name"],
+        description=APP_DATA["description"],
+        lifespan=lifespan,
+    )
+
+    @app.get(
+        "/",
+        status_code=HTTPStatus.OK,
+        include_in_schema=False,
+    )
+    async def root_endpoint():
+        return {
+            "api_name": APP_DATA["name"],
+            "version": APP_DATA["latest_version"],
+            "docs": APP_DATA["docs"],
+        }
+
+    app.include_router(health.router)
+
+    v1 = create_v1_app()
+    app.state.v1 = v1
+    app.mount("/v1", v1, name="v1")
+
+    return app
+
+
+app = create_app()
+v1 = app.state.v1
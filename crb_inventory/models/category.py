@@ -1,9 +1,20 @@
 from datetime import datetime
+from enum import Enum
 from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict
 
 
+class CategoryInclude(str, Enum):
+    STATS = "stats"
+
+
+class CategoryInventoryTotals(BaseModel):
+    active_item_count: int
+    total_stock: int
+    low_stock_item_count: int
+
+
 class CategoryModel(BaseModel):
     model_config = ConfigDict(from_attributes=True)
     id: str
@@ -12,6 +23,8 @@ class CategoryModel(BaseModel):
     is_active: bool
     created_at: datetime
     updated_at: datetime
+    version: int
+    stats: Optional[CategoryInventoryTotals] = None
 
 
 class CategoryListResponse(BaseModel):
@@ -25,6 +38,11 @@ class CategoryResponse(BaseModel):
     result: CategoryModel
 
 
+class CategoryBatchGetResponse(BaseModel):
+    result: List[CategoryModel]
+    missing: List[str]
+
+
 class CategoryCreateRequest(BaseModel):
     name: str
     description: Optional[str] = None
@@ -34,9 +52,33 @@ class CategoryUpdateRequest(BaseModel):
     name: str
     description: Optional[str] = None
     is_active: bool
+    version: Optional[int] = None
 
 
 class CategoryPatchRequest(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
     is_active: Optional[bool] = None
+    version: Optional[int] = None
+
+
+class CategoryInventorySummaryModel(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    category_id: str
+    category_name: str
+    active_item_count: int
+    total_stock: int
+    low_stock_item_count: int
+
+
+class CategoryInventorySummaryListResponse(BaseModel):
+    result: List[CategoryInventorySummaryModel]
+    total: int
+    page: int
+    page_size: int
+
+
+class CategoryInventoryDriftModel(BaseModel):
+    category_id: str
+    expected: CategoryInventoryTotals
+    actual: CategoryInventoryTotals
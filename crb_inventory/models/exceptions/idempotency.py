@@ -0,0 +1,19 @@
+from http import HTTPStatus
+
+from fastapi import HTTPException
+
+
+class IdempotencyKeyInProgress(HTTPException):
+    def __init__(self, idempotency_key: str):
+        detail = "A request with this idempotency key is still being processed."
+        self.error_code = "060"
+        self.idempotency_key = idempotency_key
+        super().__init__(status_code=HTTPStatus.CONFLICT, detail=detail)
+
+
+class IdempotencyKeyReused(HTTPException):
+    def __init__(self, idempotency_key: str):
+        detail = "This idempotency key was already used for a different request."
+        self.error_code = "061"
+        self.idempotency_key = idempotency_key
+        super().__init__(status_code=HTTPStatus.UNPROCESSABLE_ENTITY, detail=detail)
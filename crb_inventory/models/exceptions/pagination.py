@@ -0,0 +1,10 @@
+from http import HTTPStatus
+
+from fastapi import HTTPException
+
+
+class InvalidCursor(HTTPException):
+    def __init__(self):
+        detail = "Cursor is invalid or does not match the request."
+        self.error_code = "005"
+        super().__init__(status_code=HTTPStatus.UNPROCESSABLE_ENTITY, detail=detail)
@@ -0,0 +1,12 @@
+from http import HTTPStatus
+
+from fastapi import HTTPException
+
+
+class RateLimitExceeded(HTTPException):
+    def __init__(self, group: str, retry_after: int):
+        detail = f"Too many {group} requests. Retry after {retry_after} seconds."
+        self.error_code = "070"
+        self.group = group
+        self.retry_after = retry_after
+        super().__init__(status_code=HTTPStatus.TOO_MANY_REQUESTS, detail=detail)
@@ -0,0 +1,20 @@
+from http import HTTPStatus
+
+from fastapi import HTTPException
+
+
+class InsufficientStock(HTTPException):
+    def __init__(self, item_id: str, quantity: int):
+        detail = "Not enough available stock to reserve the requested quantity."
+        self.error_code = "050"
+        self.item_id = item_id
+        self.quantity = quantity
+        super().__init__(status_code=HTTPStatus.CONFLICT, detail=detail)
+
+
+class ReservationNotHeld(HTTPException):
+    def __init__(self, reservation_id: str, status: str):
+        detail = f"Reservation is {status} and can no longer be changed."
+        self.error_code = "051"
+        self.reservation_id = reservation_id
+        super().__init__(status_code=HTTPStatus.CONFLICT, detail=detail)
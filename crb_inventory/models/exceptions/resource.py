@@ -10,3 +10,31 @@ class ResourceNotFound(HTTPException):
         detail = f"{resource.value.capitalize()} not found."
         self.error_code = "001"
         super().__init__(status_code=HTTPStatus.NOT_FOUND, detail=detail)
+
+
+class ResourceVersionConflict(HTTPException):
+    def __init__(self, resource: AppResource):
+        detail = (
+            f"{resource.value.capitalize()} was modified by another request. "
+            "Read the current version and retry."
+        )
+        self.error_code = "002"
+        super().__init__(status_code=HTTPStatus.PRECONDITION_FAILED, detail=detail)
+
+
+class ResourceInUse(HTTPException):
+    def __init__(self, resource: AppResource, dependent: AppResource):
+        detail = (
+            f"{resource.value.capitalize()} is still referenced by "
+            f"{dependent.value}s. Delete with strategy=cascade or "
+            "strategy=reassign instead."
+        )
+        self.error_code = "008"
+        super().__init__(status_code=HTTPStatus.CONFLICT, detail=detail)
+
+
+class InvalidReassignTarget(HTTPException):
+    def __init__(self, resource: AppResource, reason: str):
+        detail = f"Cannot reassign to this {resource.value}: {reason}"
+        self.error_code = "009"
+        super().__init__(status_code=HTTPStatus.UNPROCESSABLE_ENTITY, detail=detail)
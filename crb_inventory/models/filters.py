@@ -0,0 +1,54 @@
+from datetime import datetime
+from typing import Optional
+
+from fastapi import Query
+from pydantic import BaseModel
+
+
+class Page(BaseModel):
+    page: int
+    page_size: int
+
+
+def page_query(
+    page: int = Query(1, ge=1, description="Page number"),
+    page_size: int = Query(10, ge=1, le=100, description="Number of items per page"),
+) -> Page:
+    return Page(page=page, page_size=page_size)
+
+
+class CreatedRange(BaseModel):
+    created_after: Optional[datetime] = None
+    created_before: Optional[datetime] = None
+
+    @property
+    def unbounded(self) -> bool:
+        return self.created_after is None and self.created_before is None
+
+
+def created_range_query(
+    created_after: Optional[datetime] = Query(
+        None, description="Only resources created at or after this time"
+    ),
+    created_before: Optional[datetime] = Query(
+        None, description="Only resources created before this time"
+    ),
+) -> CreatedRange:
+    return CreatedRange(created_after=created_after, created_before=created_before)
+
+
+class NamePrefix(BaseModel):
+    prefix: str
+    limit: int
+
+
+def name_prefix_query(
+    prefix: str = Query(
+        ...,
+        min_length=1,
+        max_length=100,
+        description="Beginning of the name, case-insensitive",
+    ),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of suggestions"),
+) -> NamePrefix:
+    return NamePrefix(prefix=prefix, limit=limit)
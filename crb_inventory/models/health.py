@@ -0,0 +1,20 @@
+from typing import Dict, Optional
+
+from pydantic import BaseModel
+
+
+class LivenessResponse(BaseModel):
+    status: str
+
+
+class PoolStatusResponse(BaseModel):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+
+
+class ReadinessResponse(BaseModel):
+    status: str
+    checks: Dict[str, str]
+    pool: Optional[PoolStatusResponse] = None
@@ -1,11 +1,28 @@
 from datetime import datetime
+from enum import Enum
 from typing import List, Optional
 
-from pydantic import BaseModel, ConfigDict, field_validator
+from fastapi import Depends, Query
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    computed_field,
+    field_validator,
+    model_validator,
+)
+from typing_extensions import Annotated
 
 from crb_inventory.database_schema import Tag
 
-from ..models.validators import validate_positive_value, validate_uuid_value
+from ..models.filters import CreatedRange, created_range_query
+from ..models.utils import BATCH_GET_MAX_IDS
+from ..models.validators import (
+    validate_positive_value,
+    validate_uuid_list_value,
+    validate_uuid_value,
+)
 
 
 class ItemModel(BaseModel):
@@ -17,8 +34,137 @@ class ItemModel(BaseModel):
     category_id: str
     minimum_threshold: int
     stock_quantity: int
+    reserved_quantity: int = 0
     created_at: datetime
     updated_at: datetime
+    version: int
+    archived_at: Optional[datetime] = None
+
+    @computed_field
+    @property
+    def available_quantity(self) -> int:
+        return self.stock_quantity - self.reserved_quantity
+
+
+class ItemSort(Enum):
+    NEWEST = "newest"
+    NAME = "name"
+    STOCK_QUANTITY = "stock_quantity"
+    UPDATED_AT = "updated_at"
+    SHORTFALL = "shortfall"
+
+
+class ItemListOrder(BaseModel):
+    sort: ItemSort = ItemSort.NEWEST
+    cursor: Optional[str] = None
+
+
+def item_list_order_query(
+    sort: ItemSort = Query(
+        ItemSort.NEWEST,
+        description=(
+            "Order of the items: newest first, name or stock quantity ascending,"
+            " most recently updated first, or largest shortfall against the"
+            " minimum threshold first"
+        ),
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="next_cursor of the previous page, read instead of page",
+    ),
+) -> ItemListOrder:
+    return ItemListOrder(sort=sort, cursor=cursor)
+
+
+class ItemTagMatch(Enum):
+    ANY = "any"
+    ALL = "all"
+
+
+class ItemTagFilter(BaseModel):
+    tag_ids: List[str] = []
+    match: ItemTagMatch = ItemTagMatch.ANY
+
+
+def item_tag_filter_query(
+    tag_id: Annotated[
+        List[str],
+        Query(description="Only items with these tags, see tag_match"),
+        AfterValidator(validate_uuid_list_value),
+    ] = [],
+    tag_match: ItemTagMatch = Query(
+        ItemTagMatch.ANY,
+        description="Whether items need any or all of the tag_id tags",
+    ),
+) -> ItemTagFilter:
+    return ItemTagFilter(
+        tag_ids=list(dict.fromkeys(value.lower() for value in tag_id)),
+        match=tag_match,
+    )
+
+
+class ItemStateFilter(BaseModel):
+    is_active: bool = True
+    min_stock: Optional[int] = None
+    max_stock: Optional[int] = None
+
+
+def item_state_filter_query(
+    is_active: bool = Query(True, description="List active or inactive items"),
+    min_stock: Optional[int] = Query(
+        None, ge=0, description="Only items with at least this stock quantity"
+    ),
+    max_stock: Optional[int] = Query(
+        None, ge=0, description="Only items with at most this stock quantity"
+    ),
+) -> ItemStateFilter:
+    return ItemStateFilter(
+        is_active=is_active, min_stock=min_stock, max_stock=max_stock
+    )
+
+
+class ItemFilter(BaseModel):
+    category_ids: List[str] = []
+    tags: ItemTagFilter = ItemTagFilter()
+    state: ItemStateFilter = ItemStateFilter()
+    created: CreatedRange = CreatedRange()
+    name_prefix: Optional[str] = None
+
+    @property
+    def cache_params(self) -> dict:
+        return {
+            "category_id": tuple(sorted(self.category_ids)),
+            "tag_id": tuple(sorted(self.tags.tag_ids)),
+            "tag_match": self.tags.match.value,
+            **self.state.model_dump(),
+            **self.created.model_dump(),
+            "name_prefix": self.name_prefix,
+        }
+
+
+def item_filter_query(
+    category_id: Annotated[
+        List[str],
+        Query(description="Only items in one of these categories"),
+        AfterValidator(validate_uuid_list_value),
+    ] = [],
+    tags: ItemTagFilter = Depends(item_tag_filter_query),
+    state: ItemStateFilter = Depends(item_state_filter_query),
+    created: CreatedRange = Depends(created_range_query),
+    name_prefix: Optional[str] = Query(
+        None,
+        min_length=1,
+        max_length=100,
+        description="Beginning of the name, case-insensitive",
+    ),
+) -> ItemFilter:
+    return ItemFilter(
+        category_ids=list(dict.fromkeys(value.lower() for value in category_id)),
+        tags=tags,
+        state=state,
+        created=created,
+        name_prefix=name_prefix,
+    )
 
 
 class ItemListResponse(BaseModel):
@@ -26,12 +172,18 @@ class ItemListResponse(BaseModel):
     total: int
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 class ItemResponse(BaseModel):
     result: ItemModel
 
 
+class ItemBatchGetResponse(BaseModel):
+    result: List[ItemModel]
+    missing: List[str]
+
+
 class ItemCreateRequest(BaseModel):
     name: str
     description: Optional[str] = None
@@ -55,6 +207,7 @@ class ItemUpdateRequest(BaseModel):
     category_id: str
     minimum_threshold: int
     stock_quantity: int
+    version: Optional[int] = None
 
     _validate_positive_value = field_validator(
         "minimum_threshold", "stock_quantity", mode="after"
@@ -72,6 +225,7 @@ class ItemPatchRequest(BaseModel):
     category_id: Optional[str] = None
     minimum_threshold: Optional[int] = None
     stock_quantity: Optional[int] = None
+    version: Optional[int] = None
 
     _validate_positive_value = field_validator(
         "minimum_threshold", "stock_quantity", mode="after"
@@ -97,3 +251,97 @@ class ItemTagDeleteMessage(BaseModel):
 class ItemTagListResponse(BaseModel):
     result: List[Tag]
     total: int
+
+
+class ItemChangeEventModel(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: int
+    event_type: str
+    item_id: str
+    created_at: datetime
+    payload: dict
+    xid: int = Field(exclude=True)
+
+    @property
+    def position(self) -> tuple[int, int]:
+        return self.xid, self.id
+
+
+class ItemTombstoneModel(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    item_id: str
+    deleted_at: datetime
+
+
+class ItemDeltaResponse(BaseModel):
+    result: List[ItemModel]
+    deleted: List[ItemTombstoneModel]
+    watermark: Optional[str] = None
+    has_more: bool
+
+
+class ItemCreationBucket(Enum):
+    HOUR = "hour"
+    DAY = "day"
+
+
+class ItemCreationCountModel(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    start: datetime
+    count: int
+
+
+class ItemCreationStatsResponse(BaseModel):
+    bucket: ItemCreationBucket
+    result: List[ItemCreationCountModel]
+
+
+class ItemBulkRequest(BaseModel):
+    ids: Optional[List[str]] = Field(
+        default=None, min_length=1, max_length=BATCH_GET_MAX_IDS
+    )
+    category_id: Optional[str] = None
+    tag_id: Optional[str] = None
+    inactive_since: Optional[datetime] = None
+
+    _validate_uuid_list_value = field_validator("ids", mode="after")(
+        validate_uuid_list_value
+    )
+    _validate_uuid_value = field_validator("category_id", "tag_id", mode="after")(
+        validate_uuid_value
+    )
+
+    @model_validator(mode="after")
+    def validate_selection(self):
+        if (
+            self.ids is None
+            and self.category_id is None
+            and self.tag_id is None
+            and self.inactive_since is None
+        ):
+            raise ValueError(
+                "ids or at least one of category_id, tag_id and inactive_since "
+                "should be given"
+            )
+
+        return self
+
+
+class ItemBulkDeactivateRequest(ItemBulkRequest):
+    @model_validator(mode="after")
+    def validate_inactive_since(self):
+        # Only active items are deactivated, and inactive_since selects
+        # inactive ones, so the request could never deactivate anything.
+        if self.inactive_since is not None:
+            raise ValueError("inactive_since can not be used to deactivate items")
+
+        return self
+
+
+class ItemBulkDeleteResponse(BaseModel):
+    deleted: int
+    tags_removed: int
+
+
+class ItemBulkDeactivateResponse(BaseModel):
+    deactivated: int
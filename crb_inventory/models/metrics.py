@@ -0,0 +1,21 @@
+from typing import Dict
+
+from pydantic import BaseModel
+
+
+class ResponseCacheStatsResponse(BaseModel):
+    enabled: bool
+    entries: int
+    max_entries: int
+    hits: int
+    stale_hits: int
+    misses: int
+    evictions: int
+    hit_ratio: float
+    invalidations: Dict[str, int]
+
+
+class SingleFlightStatsResponse(BaseModel):
+    executions: int
+    coalesced: int
+    in_flight: int
@@ -0,0 +1,39 @@
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from ..models.validators import validate_uuid_value
+
+RESERVATION_MAX_TTL = 24 * 60 * 60
+
+
+class ReservationStatus(Enum):
+    HELD = "held"
+    CONFIRMED = "confirmed"
+    RELEASED = "released"
+    EXPIRED = "expired"
+
+
+class ReservationModel(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: str
+    item_id: str
+    quantity: int
+    status: ReservationStatus
+    expires_at: datetime
+    created_at: datetime
+    updated_at: datetime
+
+
+class ReservationResponse(BaseModel):
+    result: ReservationModel
+
+
+class ReservationCreateRequest(BaseModel):
+    item_id: str
+    quantity: int = Field(gt=0)
+    ttl_seconds: Optional[int] = Field(default=None, gt=0, le=RESERVATION_MAX_TTL)
+
+    _validate_uuid_value = field_validator("item_id", mode="after")(validate_uuid_value)
@@ -1,4 +1,5 @@
 from datetime import datetime
+from enum import Enum
 from typing import List, Optional
 
 from pydantic import BaseModel, ConfigDict, field_validator
@@ -12,8 +13,16 @@ class TagModel(BaseModel):
     name: str
     description: Optional[str] = None
     is_active: bool
+    item_count: int
+    active_item_count: int
     created_at: datetime
     updated_at: datetime
+    version: int
+
+
+class TagSort(Enum):
+    NEWEST = "newest"
+    POPULARITY = "popularity"
 
 
 class TagListResponse(BaseModel):
@@ -27,6 +36,11 @@ class TagResponse(BaseModel):
     result: TagModel
 
 
+class TagBatchGetResponse(BaseModel):
+    result: List[TagModel]
+    missing: List[str]
+
+
 class TagCreateRequest(BaseModel):
     name: str
     description: Optional[str] = None
@@ -40,6 +54,7 @@ class TagUpdateRequest(BaseModel):
     name: str
     description: Optional[str] = None
     is_active: bool
+    version: Optional[int] = None
 
     _validate_tag_name_value = field_validator("name", mode="after")(
         validate_tag_name_value
@@ -50,7 +65,19 @@ class TagPatchRequest(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
     is_active: Optional[bool] = None
+    version: Optional[int] = None
 
     _validate_tag_name_value = field_validator("name", mode="after")(
         validate_tag_name_value
     )
+
+
+class TagItemCounts(BaseModel):
+    item_count: int
+    active_item_count: int
+
+
+class TagItemCountDriftModel(BaseModel):
+    tag_id: str
+    expected: TagItemCounts
+    actual: TagItemCounts
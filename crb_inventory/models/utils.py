@@ -1,16 +1,48 @@
 from enum import Enum
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+from ..models.validators import validate_uuid_list_value
 
 
 class AppResource(Enum):
     CATEGORY = "category"
     TAG = "tag"
     ITEM = "item"
+    RESERVATION = "reservation"
+
+
+class DeleteStrategy(Enum):
+    RESTRICT = "restrict"
+    CASCADE = "cascade"
+    REASSIGN = "reassign"
 
 
 class ResourceDeletedMessage(BaseModel):
     message: Optional[str] = "Resource deleted successfully."
     id: str
     resource: AppResource
+    strategy: Optional[DeleteStrategy] = None
+    affected_items: Optional[int] = None
+
+
+class NameSuggestion(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    id: str
+    name: str
+
+
+class NameSuggestionListResponse(BaseModel):
+    result: List[NameSuggestion]
+
+
+BATCH_GET_MAX_IDS = 5000
+
+
+class BatchGetRequest(BaseModel):
+    ids: List[str] = Field(min_length=1, max_length=BATCH_GET_MAX_IDS)
+
+    _validate_uuid_list_value = field_validator("ids", mode="after")(
+        validate_uuid_list_value
+    )
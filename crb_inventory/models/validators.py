@@ -1,6 +1,6 @@
 import re
 
-from ..services.uuid import validate_uuid
+from ..services.uuid import find_invalid_uuids, validate_uuid
 
 
 def validate_positive_value(value: int | None) -> int | None:
@@ -10,13 +10,26 @@ def validate_positive_value(value: int | None) -> int | None:
     return value
 
 
-def validate_uuid_value(value: str) -> str:
-    if not validate_uuid(value):
+def validate_uuid_value(value: str | None) -> str | None:
+    if value is not None and not validate_uuid(value):
         raise ValueError("value should be a valid UUID")
 
     return value
 
 
+def validate_uuid_list_value(values: list[str] | None) -> list[str] | None:
+    max_reported_values = 20
+    invalid_values = find_invalid_uuids(values or [])
+
+    if invalid_values:
+        raise ValueError(
+            "values should be valid UUIDs, invalid values: "
+            + ", ".join(invalid_values[:max_reported_values])
+        )
+
+    return values
+
+
 def validate_tag_name_value(value: str) -> str:
     max_tag_length = 50
     regex = r"^[a-z0-9]+(-[a-z0-9]+)*$"
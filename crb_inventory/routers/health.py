@@ -0,0 +1,42 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import JSONResponse
+from sqlalchemy import Engine
+
+from ..core.database import get_engine
+from ..core.health import readiness
+from ..models.health import LivenessResponse, ReadinessResponse
+
+router = APIRouter(prefix="/health", tags=["health"])
+
+
+@router.get(
+    "/live",
+    status_code=HTTPStatus.OK,
+    response_model=LivenessResponse,
+    summary="Check that the worker process is running",
+)
+async def read_liveness_endpoint() -> LivenessResponse:
+    return LivenessResponse(status="alive")
+
+
+@router.get(
+    "/ready",
+    status_code=HTTPStatus.OK,
+    response_model=ReadinessResponse,
+    responses={HTTPStatus.SERVICE_UNAVAILABLE: {"model": ReadinessResponse}},
+    summary="Check that the worker can serve requests",
+)
+async def read_readiness_endpoint(engine: Engine = Depends(get_engine)):
+    report = await readiness.check(engine)
+    content = ReadinessResponse(
+        status=report.status, checks=report.checks, pool=report.pool
+    )
+
+    if not report.ready:
+        return JSONResponse(
+            status_code=HTTPStatus.SERVICE_UNAVAILABLE, content=content.model_dump()
+        )
+
+    return content
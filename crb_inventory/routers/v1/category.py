@@ -1,28 +1,56 @@
 from http import HTTPStatus
+from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 from pydantic import AfterValidator
 from sqlalchemy.orm import Session
 from typing_extensions import Annotated
 
+from ...core.cache import cached_response
 from ...core.database import get_session
+from ...core.idempotency import (
+    IdempotencyKeyHeader,
+    idempotent_response,
+    request_fingerprint,
+)
 from ...models.category import (
+    CategoryBatchGetResponse,
     CategoryCreateRequest,
+    CategoryInclude,
+    CategoryInventorySummaryListResponse,
     CategoryListResponse,
     CategoryPatchRequest,
     CategoryResponse,
     CategoryUpdateRequest,
 )
-from ...models.utils import ResourceDeletedMessage
+from ...models.filters import (
+    CreatedRange,
+    NamePrefix,
+    Page,
+    created_range_query,
+    name_prefix_query,
+    page_query,
+)
+from ...models.utils import (
+    AppResource,
+    BatchGetRequest,
+    DeleteStrategy,
+    NameSuggestionListResponse,
+    ResourceDeletedMessage,
+)
 from ...models.validators import validate_uuid_value
+from ...services.autocomplete import autocomplete_categories
 from ...services.category import (
     create_category,
     delete_category,
     patch_category,
     read_categories,
+    read_categories_batch,
     read_category,
     update_category,
 )
+from ...services.category_summary import read_category_inventory_summary
+from ...services.version import format_etag
 
 router = APIRouter(prefix="/category", tags=["category"])
 
@@ -34,11 +62,63 @@ router = APIRouter(prefix="/category", tags=["category"])
     summary="Get category list",
 )
 async def read_categories_endpoint(
+    request: Request,
+    page: Page = Depends(page_query),
+    created: CreatedRange = Depends(created_range_query),
+    include: Optional[CategoryInclude] = Query(
+        None, description="Add the active item totals of each category"
+    ),
+    session: Session = Depends(get_session),
+) -> Response:
+    return await cached_response(
+        route=request.url.path,
+        resource=AppResource.CATEGORY,
+        params={
+            **page.model_dump(),
+            "include": include and include.value,
+            **created.model_dump(),
+        },
+        build_response=lambda: read_categories(
+            page=page.page,
+            page_size=page.page_size,
+            created=created,
+            include=include,
+            session=session,
+        ),
+        related=(AppResource.ITEM,) if include is CategoryInclude.STATS else (),
+    )
+
+
+@router.get(
+    "/summary",
+    status_code=HTTPStatus.OK,
+    response_model=CategoryInventorySummaryListResponse,
+    summary="Get inventory totals per category",
+)
+async def read_category_inventory_summary_endpoint(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(10, ge=1, le=100, description="Number of items per page"),
+    created: CreatedRange = Depends(created_range_query),
     session: Session = Depends(get_session),
-) -> CategoryListResponse:
-    return read_categories(page=page, page_size=page_size, session=session)
+) -> CategoryInventorySummaryListResponse:
+    return read_category_inventory_summary(
+        page=page, page_size=page_size, created=created, session=session
+    )
+
+
+@router.get(
+    "/autocomplete",
+    status_code=HTTPStatus.OK,
+    response_model=NameSuggestionListResponse,
+    summary="Suggest category names starting with a prefix",
+)
+async def autocomplete_categories_endpoint(
+    name_prefix: NamePrefix = Depends(name_prefix_query),
+    session: Session = Depends(get_session),
+) -> NameSuggestionListResponse:
+    return autocomplete_categories(
+        prefix=name_prefix.prefix, limit=name_prefix.limit, session=session
+    )
 
 
 @router.get(
@@ -49,9 +129,26 @@ async def read_categories_endpoint(
 )
 async def read_category_endpoint(
     category_id: Annotated[str, AfterValidator(validate_uuid_value)],
+    response: Response,
     session: Session = Depends(get_session),
 ) -> CategoryResponse:
-    return read_category(category_id=category_id, session=session)
+    category = read_category(category_id=category_id, session=session)
+    response.headers["ETag"] = format_etag(category.result.version)
+
+    return category
+
+
+@router.post(
+    "/batch-get",
+    status_code=HTTPStatus.OK,
+    response_model=CategoryBatchGetResponse,
+    summary="Get categories by a list of IDs",
+)
+async def read_categories_batch_endpoint(
+    body: BatchGetRequest,
+    session: Session = Depends(get_session),
+) -> CategoryBatchGetResponse:
+    return read_categories_batch(body=body, session=session)
 
 
 @router.post(
@@ -61,10 +158,18 @@ async def read_category_endpoint(
     summary="Create a category",
 )
 async def create_category_endpoint(
+    request: Request,
     body: CategoryCreateRequest,
+    idempotency_key: IdempotencyKeyHeader = None,
     session: Session = Depends(get_session),
 ) -> CategoryResponse:
-    return create_category(body=body, session=session)
+    return await idempotent_response(
+        idempotency_key=idempotency_key,
+        fingerprint=request_fingerprint(request, body),
+        status_code=HTTPStatus.CREATED,
+        execute=lambda: create_category(body=body, session=session),
+        session=session,
+    )
 
 
 @router.put(
@@ -76,9 +181,16 @@ async def create_category_endpoint(
 async def update_category_endpoint(
     category_id: Annotated[str, AfterValidator(validate_uuid_value)],
     body: CategoryUpdateRequest,
+    response: Response,
+    if_match: Annotated[str | None, Header()] = None,
     session: Session = Depends(get_session),
 ) -> CategoryResponse:
-    return update_category(category_id=category_id, body=body, session=session)
+    category = update_category(
+        category_id=category_id, body=body, session=session, if_match=if_match
+    )
+    response.headers["ETag"] = format_etag(category.result.version)
+
+    return category
 
 
 @router.delete(
@@ -89,9 +201,22 @@ async def update_category_endpoint(
 )
 async def delete_category_endpoint(
     category_id: Annotated[str, AfterValidator(validate_uuid_value)],
+    strategy: DeleteStrategy = Query(
+        DeleteStrategy.RESTRICT, description="What to do with the items of the category"
+    ),
+    reassign_to: Annotated[
+        str | None,
+        Query(description="Category that receives them with strategy=reassign"),
+        AfterValidator(validate_uuid_value),
+    ] = None,
     session: Session = Depends(get_session),
 ) -> ResourceDeletedMessage:
-    return delete_category(category_id=category_id, session=session)
+    return delete_category(
+        category_id=category_id,
+        session=session,
+        strategy=strategy,
+        reassign_to=reassign_to,
+    )
 
 
 @router.patch(
@@ -103,10 +228,16 @@ async def delete_category_endpoint(
 async def patch_category_endpoint(
     category_id: Annotated[str, AfterValidator(validate_uuid_value)],
     body: CategoryPatchRequest,
+    response: Response,
+    if_match: Annotated[str | None, Header()] = None,
     session: Session = Depends(get_session),
 ) -> CategoryResponse:
-    return patch_category(
+    category = patch_category(
         category_id=category_id,
         body=body,
         session=session,
+        if_match=if_match,
     )
+    response.headers["ETag"] = format_etag(category.result.version)
+
+    return category
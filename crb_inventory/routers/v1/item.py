@@ -1,13 +1,46 @@
 from http import HTTPStatus
+from typing import Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import AfterValidator
 from sqlalchemy.orm import Session
 from typing_extensions import Annotated
 
+from ...core.cache import cached_response, response_cache
+from ...core.change_feed import (
+    ITEM_CHANGES_REPLAY_LIMIT,
+    item_change_feed,
+    parse_last_event_id,
+    stream_item_changes,
+)
 from ...core.database import get_session
+from ...core.idempotency import (
+    IdempotencyKeyHeader,
+    idempotent_response,
+    request_fingerprint,
+)
+from ...core.single_flight import read_flights
+from ...models.filters import (
+    CreatedRange,
+    NamePrefix,
+    Page,
+    created_range_query,
+    name_prefix_query,
+    page_query,
+)
 from ...models.item import (
+    ItemBatchGetResponse,
+    ItemBulkDeactivateRequest,
+    ItemBulkDeactivateResponse,
+    ItemBulkDeleteResponse,
+    ItemBulkRequest,
     ItemCreateRequest,
+    ItemCreationBucket,
+    ItemCreationStatsResponse,
+    ItemDeltaResponse,
+    ItemFilter,
+    ItemListOrder,
     ItemListResponse,
     ItemPatchRequest,
     ItemResponse,
@@ -15,9 +48,17 @@ from ...models.item import (
     ItemTagDeleteMessage,
     ItemTagListResponse,
     ItemUpdateRequest,
+    item_filter_query,
+    item_list_order_query,
+)
+from ...models.utils import (
+    AppResource,
+    BatchGetRequest,
+    NameSuggestionListResponse,
+    ResourceDeletedMessage,
 )
-from ...models.utils import ResourceDeletedMessage
 from ...models.validators import validate_uuid_value
+from ...services.autocomplete import autocomplete_items
 from ...services.item import (
     add_tag_to_item,
     create_item,
@@ -25,12 +66,23 @@ from ...services.item import (
     delete_tag_from_item,
     patch_item,
     read_item,
+    read_item_creation_stats,
     read_item_tags,
     read_items,
+    read_items_batch,
     read_items_by_category,
     read_items_by_tag,
+    read_items_delta,
     update_item,
 )
+from ...services.item_archive import (
+    read_item_including_archived,
+    restore_archived_item,
+)
+from ...services.item_bulk import bulk_deactivate_items, bulk_delete_items
+from ...services.item_changes import read_item_changes
+from ...services.version import format_etag
+from ...settings import get_settings
 
 router = APIRouter(prefix="/item", tags=["item"])
 
@@ -42,11 +94,110 @@ router = APIRouter(prefix="/item", tags=["item"])
     summary="Get item list",
 )
 async def read_items_endpoint(
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(10, ge=1, le=100, description="Number of items per page"),
+    request: Request,
+    page: Page = Depends(page_query),
+    order: ItemListOrder = Depends(item_list_order_query),
+    item_filter: ItemFilter = Depends(item_filter_query),
     session: Session = Depends(get_session),
-) -> ItemListResponse:
-    return read_items(page=page, page_size=page_size, session=session)
+) -> Response:
+    # Deleting a tag moves or drops its associations without writing items.
+    related = (AppResource.TAG,) if item_filter.tags.tag_ids else ()
+
+    return await cached_response(
+        route=request.url.path,
+        resource=AppResource.ITEM,
+        params={
+            **page.model_dump(),
+            **item_filter.cache_params,
+            "sort": order.sort.value,
+            "cursor": order.cursor,
+        },
+        build_response=lambda: read_items(
+            page=page, order=order, item_filter=item_filter, session=session
+        ),
+        related=related,
+    )
+
+
+@router.get(
+    "/changes/stream",
+    status_code=HTTPStatus.OK,
+    response_class=StreamingResponse,
+    summary="Stream item changes as server-sent events",
+)
+async def stream_item_changes_endpoint(
+    last_event_id: Annotated[str | None, Header()] = None,
+    session: Session = Depends(get_session),
+) -> StreamingResponse:
+    subscription = item_change_feed.subscribe()
+    after = parse_last_event_id(last_event_id)
+
+    backlog = []
+    if after is not None:
+        backlog = read_item_changes(
+            after=after, limit=ITEM_CHANGES_REPLAY_LIMIT, session=session
+        )
+
+    return StreamingResponse(
+        stream_item_changes(backlog, subscription, after),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get(
+    "/delta",
+    status_code=HTTPStatus.OK,
+    response_model=ItemDeltaResponse,
+    summary="Get items changed or deleted since a watermark",
+)
+async def read_items_delta_endpoint(
+    since: Optional[str] = Query(
+        None, description="Watermark returned by the previous sync"
+    ),
+    limit: int = Query(500, ge=1, le=1000, description="Maximum number of changes"),
+    session: Session = Depends(get_session),
+) -> ItemDeltaResponse:
+    return read_items_delta(since=since, limit=limit, session=session)
+
+
+@router.get(
+    "/stats/created",
+    status_code=HTTPStatus.OK,
+    response_model=ItemCreationStatsResponse,
+    summary="Count items created per hour or day",
+)
+async def read_item_creation_stats_endpoint(
+    request: Request,
+    bucket: ItemCreationBucket = Query(
+        ItemCreationBucket.DAY, description="Length of each bucket"
+    ),
+    created: CreatedRange = Depends(created_range_query),
+    session: Session = Depends(get_session),
+) -> Response:
+    return await cached_response(
+        route=request.url.path,
+        resource=AppResource.ITEM,
+        params={"bucket": bucket.value, **created.model_dump()},
+        build_response=lambda: read_item_creation_stats(
+            bucket=bucket, created=created, session=session
+        ),
+    )
+
+
+@router.get(
+    "/autocomplete",
+    status_code=HTTPStatus.OK,
+    response_model=NameSuggestionListResponse,
+    summary="Suggest item names starting with a prefix",
+)
+async def autocomplete_items_endpoint(
+    name_prefix: NamePrefix = Depends(name_prefix_query),
+    session: Session = Depends(get_session),
+) -> NameSuggestionListResponse:
+    return autocomplete_items(
+        prefix=name_prefix.prefix, limit=name_prefix.limit, session=session
+    )
 
 
 @router.get(
@@ -56,10 +207,88 @@ async def read_items_endpoint(
     summary="Get item by ID",
 )
 async def read_item_endpoint(
+    request: Request,
     item_id: Annotated[str, AfterValidator(validate_uuid_value)],
+    response: Response,
+    include_archived: bool = Query(
+        False, description="Fall back to archived items when not found"
+    ),
     session: Session = Depends(get_session),
 ) -> ItemResponse:
-    return read_item(item_id=item_id, session=session)
+    if include_archived:
+        item = read_item_including_archived(item_id=item_id, session=session)
+    else:
+        item = await read_flights.run(
+            (request.url.path, response_cache.version(AppResource.ITEM)),
+            lambda: read_item(item_id=item_id, session=session),
+        )
+
+    response.headers["ETag"] = format_etag(item.result.version)
+
+    return item
+
+
+@router.post(
+    "/batch-get",
+    status_code=HTTPStatus.OK,
+    response_model=ItemBatchGetResponse,
+    summary="Get items by a list of IDs",
+)
+async def read_items_batch_endpoint(
+    body: BatchGetRequest,
+    session: Session = Depends(get_session),
+) -> ItemBatchGetResponse:
+    return read_items_batch(body=body, session=session)
+
+
+@router.post(
+    "/bulk-delete",
+    status_code=HTTPStatus.OK,
+    response_model=ItemBulkDeleteResponse,
+    summary="Delete items by a list of IDs or a filter",
+)
+async def bulk_delete_items_endpoint(
+    request: Request,
+    body: ItemBulkRequest,
+    idempotency_key: IdempotencyKeyHeader = None,
+    session: Session = Depends(get_session),
+) -> ItemBulkDeleteResponse:
+    return await idempotent_response(
+        idempotency_key=idempotency_key,
+        fingerprint=request_fingerprint(request, body),
+        status_code=HTTPStatus.OK,
+        execute=lambda: bulk_delete_items(
+            body=body,
+            chunk_size=get_settings().ITEM_BULK_CHUNK_SIZE,
+            session=session,
+        ),
+        session=session,
+    )
+
+
+@router.post(
+    "/bulk-deactivate",
+    status_code=HTTPStatus.OK,
+    response_model=ItemBulkDeactivateResponse,
+    summary="Deactivate items by a list of IDs or a filter",
+)
+async def bulk_deactivate_items_endpoint(
+    request: Request,
+    body: ItemBulkDeactivateRequest,
+    idempotency_key: IdempotencyKeyHeader = None,
+    session: Session = Depends(get_session),
+) -> ItemBulkDeactivateResponse:
+    return await idempotent_response(
+        idempotency_key=idempotency_key,
+        fingerprint=request_fingerprint(request, body),
+        status_code=HTTPStatus.OK,
+        execute=lambda: bulk_deactivate_items(
+            body=body,
+            chunk_size=get_settings().ITEM_BULK_CHUNK_SIZE,
+            session=session,
+        ),
+        session=session,
+    )
 
 
 @router.post(
@@ -69,10 +298,18 @@ async def read_item_endpoint(
     summary="Create an item",
 )
 async def create_item_endpoint(
+    request: Request,
     body: ItemCreateRequest,
+    idempotency_key: IdempotencyKeyHeader = None,
     session: Session = Depends(get_session),
 ) -> ItemResponse:
-    return create_item(body=body, session=session)
+    return await idempotent_response(
+        idempotency_key=idempotency_key,
+        fingerprint=request_fingerprint(request, body),
+        status_code=HTTPStatus.CREATED,
+        execute=lambda: create_item(body=body, session=session),
+        session=session,
+    )
 
 
 @router.put(
@@ -84,9 +321,14 @@ async def create_item_endpoint(
 async def update_item_endpoint(
     item_id: Annotated[str, AfterValidator(validate_uuid_value)],
     body: ItemUpdateRequest,
+    response: Response,
+    if_match: Annotated[str | None, Header()] = None,
     session: Session = Depends(get_session),
 ) -> ItemResponse:
-    return update_item(item_id=item_id, body=body, session=session)
+    item = update_item(item_id=item_id, body=body, session=session, if_match=if_match)
+    response.headers["ETag"] = format_etag(item.result.version)
+
+    return item
 
 
 @router.delete(
@@ -111,13 +353,32 @@ async def delete_item_endpoint(
 async def patch_item_endpoint(
     item_id: Annotated[str, AfterValidator(validate_uuid_value)],
     body: ItemPatchRequest,
+    response: Response,
+    if_match: Annotated[str | None, Header()] = None,
     session: Session = Depends(get_session),
 ) -> ItemResponse:
-    return patch_item(
+    item = patch_item(
         item_id=item_id,
         body=body,
         session=session,
+        if_match=if_match,
     )
+    response.headers["ETag"] = format_etag(item.result.version)
+
+    return item
+
+
+@router.post(
+    "/{item_id}/restore",
+    status_code=HTTPStatus.OK,
+    response_model=ItemResponse,
+    summary="Restore an archived item",
+)
+async def restore_archived_item_endpoint(
+    item_id: Annotated[str, AfterValidator(validate_uuid_value)],
+    session: Session = Depends(get_session),
+) -> ItemResponse:
+    return restore_archived_item(item_id=item_id, session=session)
 
 
 @router.get(
@@ -140,11 +401,21 @@ async def read_item_tags_endpoint(
     summary="Add a tag to an item",
 )
 async def add_tag_to_item_endpoint(
+    request: Request,
     item_id: Annotated[str, AfterValidator(validate_uuid_value)],
     tag_id: Annotated[str, AfterValidator(validate_uuid_value)],
+    idempotency_key: IdempotencyKeyHeader = None,
     session: Session = Depends(get_session),
 ) -> ItemTagAddMessage:
-    return add_tag_to_item(item_id=item_id, tag_id=tag_id, session=session)
+    return await idempotent_response(
+        idempotency_key=idempotency_key,
+        fingerprint=request_fingerprint(request),
+        status_code=HTTPStatus.CREATED,
+        execute=lambda: add_tag_to_item(
+            item_id=item_id, tag_id=tag_id, session=session
+        ),
+        session=session,
+    )
 
 
 @router.delete(
@@ -169,12 +440,17 @@ async def delete_tag_from_item_endpoint(
 )
 async def read_items_by_category_endpoint(
     category_id: Annotated[str, AfterValidator(validate_uuid_value)],
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(10, ge=1, le=100, description="Number of items per page"),
+    page: Page = Depends(page_query),
+    created: CreatedRange = Depends(created_range_query),
+    order: ItemListOrder = Depends(item_list_order_query),
     session: Session = Depends(get_session),
 ) -> ItemListResponse:
     return read_items_by_category(
-        page=page, page_size=page_size, category_id=category_id, session=session
+        category_id=category_id,
+        page=page,
+        created=created,
+        order=order,
+        session=session,
     )
 
 
@@ -186,10 +462,11 @@ async def read_items_by_category_endpoint(
 )
 async def read_items_by_tag_endpoint(
     tag_id: Annotated[str, AfterValidator(validate_uuid_value)],
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(10, ge=1, le=100, description="Number of items per page"),
+    page: Page = Depends(page_query),
+    created: CreatedRange = Depends(created_range_query),
+    order: ItemListOrder = Depends(item_list_order_query),
     session: Session = Depends(get_session),
 ) -> ItemListResponse:
     return read_items_by_tag(
-        page=page, page_size=page_size, tag_id=tag_id, session=session
+        tag_id=tag_id, page=page, created=created, order=order, session=session
     )
@@ -0,0 +1,29 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter
+
+from ...core.cache import response_cache
+from ...core.single_flight import read_flights
+from ...models.metrics import ResponseCacheStatsResponse, SingleFlightStatsResponse
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+
+@router.get(
+    "/cache",
+    status_code=HTTPStatus.OK,
+    response_model=ResponseCacheStatsResponse,
+    summary="Get response cache metrics",
+)
+async def read_response_cache_stats_endpoint() -> ResponseCacheStatsResponse:
+    return ResponseCacheStatsResponse(**response_cache.stats())
+
+
+@router.get(
+    "/single-flight",
+    status_code=HTTPStatus.OK,
+    response_model=SingleFlightStatsResponse,
+    summary="Get metrics of coalesced concurrent reads",
+)
+async def read_single_flight_stats_endpoint() -> SingleFlightStatsResponse:
+    return SingleFlightStatsResponse(**read_flights.stats())
@@ -0,0 +1,83 @@
+from http import HTTPStatus
+
+from fastapi import APIRouter, Depends, Request
+from pydantic import AfterValidator
+from sqlalchemy.orm import Session
+from typing_extensions import Annotated
+
+from ...core.database import get_session
+from ...core.idempotency import (
+    IdempotencyKeyHeader,
+    idempotent_response,
+    request_fingerprint,
+)
+from ...models.reservation import ReservationCreateRequest, ReservationResponse
+from ...models.validators import validate_uuid_value
+from ...services.reservation import (
+    confirm_reservation,
+    create_reservation,
+    read_reservation,
+    release_reservation,
+)
+
+router = APIRouter(prefix="/reservation", tags=["reservation"])
+
+
+@router.post(
+    "/",
+    status_code=HTTPStatus.CREATED,
+    response_model=ReservationResponse,
+    summary="Hold stock of an item for a limited time",
+)
+async def create_reservation_endpoint(
+    request: Request,
+    body: ReservationCreateRequest,
+    idempotency_key: IdempotencyKeyHeader = None,
+    session: Session = Depends(get_session),
+) -> ReservationResponse:
+    return await idempotent_response(
+        idempotency_key=idempotency_key,
+        fingerprint=request_fingerprint(request, body),
+        status_code=HTTPStatus.CREATED,
+        execute=lambda: create_reservation(body=body, session=session),
+        session=session,
+    )
+
+
+@router.get(
+    "/{reservation_id}",
+    status_code=HTTPStatus.OK,
+    response_model=ReservationResponse,
+    summary="Get reservation by ID",
+)
+async def read_reservation_endpoint(
+    reservation_id: Annotated[str, AfterValidator(validate_uuid_value)],
+    session: Session = Depends(get_session),
+) -> ReservationResponse:
+    return read_reservation(reservation_id=reservation_id, session=session)
+
+
+@router.post(
+    "/{reservation_id}/confirm",
+    status_code=HTTPStatus.OK,
+    response_model=ReservationResponse,
+    summary="Confirm a reservation, deducting its quantity from stock",
+)
+async def confirm_reservation_endpoint(
+    reservation_id: Annotated[str, AfterValidator(validate_uuid_value)],
+    session: Session = Depends(get_session),
+) -> ReservationResponse:
+    return confirm_reservation(reservation_id=reservation_id, session=session)
+
+
+@router.post(
+    "/{reservation_id}/release",
+    status_code=HTTPStatus.OK,
+    response_model=ReservationResponse,
+    summary="Release a reservation, returning its quantity to available stock",
+)
+async def release_reservation_endpoint(
+    reservation_id: Annotated[str, AfterValidator(validate_uuid_value)],
+    session: Session = Depends(get_session),
+) -> ReservationResponse:
+    return release_reservation(reservation_id=reservation_id, session=session)
@@ -1,28 +1,53 @@
 from http import HTTPStatus
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, Query, Request, Response
 from pydantic import AfterValidator
 from sqlalchemy.orm import Session
 from typing_extensions import Annotated
 
+from ...core.cache import cached_response
 from ...core.database import get_session
+from ...core.idempotency import (
+    IdempotencyKeyHeader,
+    idempotent_response,
+    request_fingerprint,
+)
+from ...models.filters import (
+    CreatedRange,
+    NamePrefix,
+    Page,
+    created_range_query,
+    name_prefix_query,
+    page_query,
+)
 from ...models.tag import (
+    TagBatchGetResponse,
     TagCreateRequest,
     TagListResponse,
     TagPatchRequest,
     TagResponse,
+    TagSort,
     TagUpdateRequest,
 )
-from ...models.utils import ResourceDeletedMessage
+from ...models.utils import (
+    AppResource,
+    BatchGetRequest,
+    DeleteStrategy,
+    NameSuggestionListResponse,
+    ResourceDeletedMessage,
+)
 from ...models.validators import validate_uuid_value
+from ...services.autocomplete import autocomplete_tags
 from ...services.tag import (
     create_tag,
     delete_tag,
     patch_tag,
     read_tag,
     read_tags,
+    read_tags_batch,
     update_tag,
 )
+from ...services.version import format_etag
 
 router = APIRouter(prefix="/tag", tags=["tag"])
 
@@ -34,11 +59,43 @@ router = APIRouter(prefix="/tag", tags=["tag"])
     summary="Get tag list",
 )
 async def read_tags_endpoint(
-    page: int = Query(1, ge=1, description="Page number"),
-    page_size: int = Query(10, ge=1, le=100, description="Number of items per page"),
+    request: Request,
+    page: Page = Depends(page_query),
+    created: CreatedRange = Depends(created_range_query),
+    sort: TagSort = Query(
+        TagSort.NEWEST, description="newest first, or most active items first"
+    ),
+    session: Session = Depends(get_session),
+) -> Response:
+    return await cached_response(
+        route=request.url.path,
+        resource=AppResource.TAG,
+        params={**page.model_dump(), "sort": sort.value, **created.model_dump()},
+        build_response=lambda: read_tags(
+            page=page.page,
+            page_size=page.page_size,
+            created=created,
+            sort=sort,
+            session=session,
+        ),
+        # Item writes move the item counters without writing tags.
+        related=(AppResource.ITEM,),
+    )
+
+
+@router.get(
+    "/autocomplete",
+    status_code=HTTPStatus.OK,
+    response_model=NameSuggestionListResponse,
+    summary="Suggest tag names starting with a prefix",
+)
+async def autocomplete_tags_endpoint(
+    name_prefix: NamePrefix = Depends(name_prefix_query),
     session: Session = Depends(get_session),
-) -> TagListResponse:
-    return read_tags(page=page, page_size=page_size, session=session)
+) -> NameSuggestionListResponse:
+    return autocomplete_tags(
+        prefix=name_prefix.prefix, limit=name_prefix.limit, session=session
+    )
 
 
 @router.get(
@@ -49,9 +106,26 @@ async def read_tags_endpoint(
 )
 async def read_tag_endpoint(
     tag_id: Annotated[str, AfterValidator(validate_uuid_value)],
+    response: Response,
     session: Session = Depends(get_session),
 ) -> TagResponse:
-    return read_tag(tag_id=tag_id, session=session)
+    tag = read_tag(tag_id=tag_id, session=session)
+    response.headers["ETag"] = format_etag(tag.result.version)
+
+    return tag
+
+
+@router.post(
+    "/batch-get",
+    status_code=HTTPStatus.OK,
+    response_model=TagBatchGetResponse,
+    summary="Get tags by a list of IDs",
+)
+async def read_tags_batch_endpoint(
+    body: BatchGetRequest,
+    session: Session = Depends(get_session),
+) -> TagBatchGetResponse:
+    return read_tags_batch(body=body, session=session)
 
 
 @router.post(
@@ -61,10 +135,18 @@ async def read_tag_endpoint(
     summary="Create a tag",
 )
 async def create_tag_endpoint(
+    request: Request,
     body: TagCreateRequest,
+    idempotency_key: IdempotencyKeyHeader = None,
     session: Session = Depends(get_session),
 ) -> TagResponse:
-    return create_tag(body=body, session=session)
+    return await idempotent_response(
+        idempotency_key=idempotency_key,
+        fingerprint=request_fingerprint(request, body),
+        status_code=HTTPStatus.CREATED,
+        execute=lambda: create_tag(body=body, session=session),
+        session=session,
+    )
 
 
 @router.put(
@@ -76,9 +158,14 @@ async def create_tag_endpoint(
 async def update_tag_endpoint(
     tag_id: Annotated[str, AfterValidator(validate_uuid_value)],
     body: TagUpdateRequest,
+    response: Response,
+    if_match: Annotated[str | None, Header()] = None,
     session: Session = Depends(get_session),
 ) -> TagResponse:
-    return update_tag(tag_id=tag_id, body=body, session=session)
+    tag = update_tag(tag_id=tag_id, body=body, session=session, if_match=if_match)
+    response.headers["ETag"] = format_etag(tag.result.version)
+
+    return tag
 
 
 @router.delete(
@@ -89,9 +176,23 @@ async def update_tag_endpoint(
 )
 async def delete_tag_endpoint(
     tag_id: Annotated[str, AfterValidator(validate_uuid_value)],
+    strategy: DeleteStrategy = Query(
+        DeleteStrategy.CASCADE,
+        description="What to do with the item associations of the tag",
+    ),
+    reassign_to: Annotated[
+        str | None,
+        Query(description="Tag that receives them with strategy=reassign"),
+        AfterValidator(validate_uuid_value),
+    ] = None,
     session: Session = Depends(get_session),
 ) -> ResourceDeletedMessage:
-    return delete_tag(tag_id=tag_id, session=session)
+    return delete_tag(
+        tag_id=tag_id,
+        session=session,
+        strategy=strategy,
+        reassign_to=reassign_to,
+    )
 
 
 @router.patch(
@@ -103,6 +204,11 @@ async def delete_tag_endpoint(
 async def patch_tag_endpoint(
     tag_id: Annotated[str, AfterValidator(validate_uuid_value)],
     body: TagPatchRequest,
+    response: Response,
+    if_match: Annotated[str | None, Header()] = None,
     session: Session = Depends(get_session),
 ) -> TagResponse:
-    return patch_tag(tag_id=tag_id, body=body, session=session)
+    tag = patch_tag(tag_id=tag_id, body=body, session=session, if_match=if_match)
+    response.headers["ETag"] = format_etag(tag.result.version)
+
+    return tag
@@ -0,0 +1,195 @@
+"""Serve the API from several pre-forked uvicorn workers sharing one socket.
+
+The application is imported once in the supervisor and the imported objects
+are moved out of the garbage collector's reach with gc.freeze() before
+forking, so the workers share those memory pages with the supervisor instead
+of each importing, and copying, everything again. Workers that die are
+replaced until the supervisor receives SIGINT or SIGTERM.
+
+On SIGTERM a worker first reports itself as draining on /health/ready and
+keeps serving for the drain delay, so load balancers stop routing to it
+before it closes the socket. Open change streams are ended, so their clients
+resume on another worker. It then finishes the requests in flight, waiting
+at most the graceful timeout, and disposes its engine.
+
+    python -m crb_inventory.serve --workers 4 --port 8000
+"""
+
+import argparse
+import gc
+import importlib
+import os
+import signal
+import socket
+import threading
+
+import uvicorn
+
+from .core.change_feed import item_change_feed
+from .core.database import check_connection_budget
+from .core.health import readiness
+from .settings import get_settings
+
+APP_MODULE = "crb_inventory.main"
+
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    listener.bind((host, port))
+    listener.listen(backlog)
+    listener.set_inheritable(True)
+
+    return listener
+
+
+def load_app():
+    return importlib.import_module(APP_MODULE).app
+
+
+class DrainingServer(uvicorn.Server):
+    def __init__(self, config: uvicorn.Config, drain_delay: float):
+        super().__init__(config)
+        self.drain_delay = drain_delay
+        self._drain_timer = None
+
+    def handle_exit(self, sig, frame):
+        # A second signal skips the rest of the drain delay.
+        if self._drain_timer is None and self.drain_delay > 0:
+            readiness.start_draining()
+            item_change_feed.close_subscriptions()
+            self._drain_timer = threading.Timer(
+                self.drain_delay, self._shut_down, (sig, frame)
+            )
+            self._drain_timer.daemon = True
+            self._drain_timer.start()
+            return
+
+        if self._drain_timer is not None:
+            self._drain_timer.cancel()
+        self._shut_down(sig, frame)
+
+    def _shut_down(self, sig, frame):
+        # Change streams never finish on their own. Ending them lets their
+        # clients resume with Last-Event-ID on another worker instead of
+        # holding the shutdown for the whole graceful timeout. Streams
+        # opened during the drain delay are ended here as well.
+        item_change_feed.close_subscriptions()
+        super().handle_exit(sig, frame)
+
+
+def run_worker(listener: socket.socket, app, args):
+    signal.signal(signal.SIGINT, signal.SIG_DFL)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    if app is None:
+        app = load_app()
+
+    config = uvicorn.Config(
+        app,
+        log_level=args.log_level,
+        access_log=args.access_log,
+        timeout_graceful_shutdown=args.graceful_timeout,
+    )
+    DrainingServer(config, drain_delay=args.drain_delay).run(sockets=[listener])
+
+
+def spawn_worker(listener: socket.socket, app, args) -> int:
+    pid = os.fork()
+
+    if pid == 0:
+        exit_code = 1
+        try:
+            run_worker(listener, app, args)
+            exit_code = 0
+        finally:
+            os._exit(exit_code)
+
+    return pid
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Serve the API from several pre-forked worker processes."
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--backlog", type=int, default=2048)
+    parser.add_argument(
+        "--drain-delay",
+        type=float,
+        default=5.0,
+        help="Seconds to keep serving after SIGTERM while reported as not ready.",
+    )
+    parser.add_argument(
+        "--graceful-timeout",
+        type=int,
+        default=30,
+        help="Seconds to wait for requests in flight before closing them.",
+    )
+    parser.add_argument("--log-level", default="info")
+    parser.add_argument("--access-log", action="store_true")
+    parser.add_argument(
+        "--no-preload",
+        dest="preload",
+        action="store_false",
+        help="Import the application in each worker after forking.",
+    )
+    args = parser.parse_args()
+
+    # Read by every worker when it sizes its connection pool.
+    os.environ["WEB_CONCURRENCY"] = str(args.workers)
+
+    if get_settings().DB_CONNECTION_BUDGET > 0:
+        try:
+            check_connection_budget(get_settings())
+        except ValueError as exc:
+            parser.error(str(exc))
+
+    listener = bind_socket(args.host, args.port, args.backlog)
+    app = None
+
+    if args.preload:
+        app = load_app()
+        gc.collect()
+        gc.freeze()
+
+    workers = {spawn_worker(listener, app, args) for _ in range(args.workers)}
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+        for pid in workers:
+            os.kill(pid, signal.SIGTERM)
+
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+
+    print(
+        f"Serving on http://{args.host}:{args.port} with {args.workers} workers "
+        f"({'preloaded' if args.preload else 'not preloaded'})",
+        flush=True,
+    )
+
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+
+        workers.discard(pid)
+
+        if not stopping:
+            print(
+                f"Worker {pid} exited with status {os.waitstatus_to_exitcode(status)}, "
+                "starting a new one",
+                flush=True,
+            )
+            workers.add(spawn_worker(listener, app, args))
+
+
+if __name__ == "__main__":
+    main()
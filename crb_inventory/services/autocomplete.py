@@ -0,0 +1,72 @@
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import operators
+from sqlalchemy.sql.expression import UnaryExpression
+
+from ..core.name_index import NameIndex, category_names, tag_names
+from ..database_schema import Category, Item, Tag
+from ..models.utils import NameSuggestion, NameSuggestionListResponse
+
+ITEM_NAME_KEY = func.lower(Item.name)
+
+# ix_item_name_pattern is built with text_pattern_ops, whose ordering operator
+# is ~<~. Sorting with it lets the prefix range scan stop after limit rows
+# instead of sorting every match.
+ITEM_NAME_PATTERN_ORDER = UnaryExpression(
+    ITEM_NAME_KEY, modifier=operators.custom_op("USING ~<~")
+)
+
+
+def autocomplete_items(
+    prefix: str,
+    limit: int,
+    session: Session,
+) -> NameSuggestionListResponse:
+    suggestions_query = (
+        select(Item.id, Item.name)
+        .where(
+            Item.is_active.is_(True),
+            ITEM_NAME_KEY.startswith(prefix.lower(), autoescape=True),
+        )
+        .order_by(ITEM_NAME_PATTERN_ORDER)
+        .limit(limit)
+    )
+
+    suggestions = session.execute(suggestions_query).all()
+
+    return NameSuggestionListResponse(result=suggestions)
+
+
+def autocomplete_tags(
+    prefix: str,
+    limit: int,
+    session: Session,
+) -> NameSuggestionListResponse:
+    return autocomplete_from_index(tag_names, Tag, prefix, limit, session)
+
+
+def autocomplete_categories(
+    prefix: str,
+    limit: int,
+    session: Session,
+) -> NameSuggestionListResponse:
+    return autocomplete_from_index(category_names, Category, prefix, limit, session)
+
+
+def autocomplete_from_index(
+    index: NameIndex,
+    entity: type[Tag] | type[Category],
+    prefix: str,
+    limit: int,
+    session: Session,
+) -> NameSuggestionListResponse:
+    def load_names() -> list[NameSuggestion]:
+        names_query = select(entity.id, entity.name).where(entity.is_active.is_(True))
+
+        return [
+            NameSuggestion.model_validate(row) for row in session.execute(names_query)
+        ]
+
+    return NameSuggestionListResponse(
+        result=index.search(prefix=prefix, limit=limit, load=load_names)
+    )
@@ -1,27 +1,50 @@
-from sqlalchemy import func, select
+from typing import Optional
+
+from sqlalchemy import Select, and_, func, select, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
-from ..database_schema import Category
+from ..core.cache import response_cache
+from ..database_schema import Category, Item
 from ..models.category import (
+    CategoryBatchGetResponse,
     CategoryCreateRequest,
+    CategoryInclude,
+    CategoryInventoryTotals,
     CategoryListResponse,
+    CategoryModel,
     CategoryPatchRequest,
     CategoryResponse,
     CategoryUpdateRequest,
 )
 from ..models.exceptions.category import CategoryNameAlreadyExists
-from ..models.exceptions.resource import ResourceNotFound
-from ..models.utils import AppResource, ResourceDeletedMessage
-from ..services.uuid import generate_uuid_v7
+from ..models.exceptions.resource import (
+    InvalidReassignTarget,
+    ResourceInUse,
+    ResourceNotFound,
+)
+from ..models.filters import CreatedRange
+from ..models.utils import (
+    AppResource,
+    BatchGetRequest,
+    DeleteStrategy,
+    ResourceDeletedMessage,
+)
+from ..services.category_summary import SUMMARY_TOTALS
+from ..services.item_bulk import delete_item_batch
+from ..services.uuid import created_between, generate_uuid_v7, match_any_uuid
+from ..services.version import check_version_precondition, commit_versioned
 
 
 def read_categories(
     page: int,
     page_size: int,
     session: Session,
+    created: Optional[CreatedRange] = None,
+    include: Optional[CategoryInclude] = None,
 ) -> CategoryListResponse:
     offset = (page - 1) * page_size
-    where_clause = Category.is_active.is_(True)
+    where_clause = Category.is_active.is_(True) & created_between(Category.id, created)
 
     categories_query = (
         select(
@@ -31,6 +54,7 @@ def read_categories(
             Category.is_active,
             Category.created_at,
             Category.updated_at,
+            Category.version,
         )
         .where(where_clause)
         .offset(offset)
@@ -41,7 +65,19 @@ def read_categories(
     total_count_query = select(func.count(Category.id)).where(where_clause)
 
     total_count = session.scalar(total_count_query)
-    categories = session.execute(categories_query).all()
+
+    if include is CategoryInclude.STATS:
+        categories = [
+            CategoryModel(
+                **row._mapping,
+                stats=CategoryInventoryTotals(**{
+                    total: row._mapping[total] for total in SUMMARY_TOTALS
+                }),
+            )
+            for row in session.execute(with_category_stats(categories_query))
+        ]
+    else:
+        categories = session.execute(categories_query).all()
 
     return CategoryListResponse(
         result=categories,
@@ -51,6 +87,31 @@ def read_categories(
     )
 
 
+def with_category_stats(categories_query: Select) -> Select:
+    """Add the active item totals to a page of categories.
+
+    The whole page is aggregated in a single grouped join. Only the item
+    columns covered by ix_item_category_id_is_active are read, so the join
+    can be served by an index-only scan.
+    """
+    page = categories_query.subquery()
+
+    return (
+        select(
+            *page.c,
+            func.count(Item.category_id).label("active_item_count"),
+            func.coalesce(func.sum(Item.stock_quantity), 0).label("total_stock"),
+            func
+            .count(Item.category_id)
+            .filter(Item.stock_quantity < Item.minimum_threshold)
+            .label("low_stock_item_count"),
+        )
+        .outerjoin(Item, and_(Item.category_id == page.c.id, Item.is_active.is_(True)))
+        .group_by(*page.c)
+        .order_by(page.c.id.desc())
+    )
+
+
 def read_category(
     category_id: str,
     session: Session,
@@ -60,6 +121,37 @@ def read_category(
     return CategoryResponse(result=category)
 
 
+def read_categories_batch(
+    body: BatchGetRequest,
+    session: Session,
+) -> CategoryBatchGetResponse:
+    category_ids = list(dict.fromkeys(value.lower() for value in body.ids))
+
+    categories_query = (
+        select(
+            Category.id,
+            Category.name,
+            Category.description,
+            Category.is_active,
+            Category.created_at,
+            Category.updated_at,
+            Category.version,
+        )
+        .where(match_any_uuid(Category.id, category_ids))
+        .order_by(Category.id.desc())
+    )
+
+    categories = session.execute(categories_query).all()
+    found_ids = {category.id for category in categories}
+
+    return CategoryBatchGetResponse(
+        result=categories,
+        missing=[
+            category_id for category_id in category_ids if category_id not in found_ids
+        ],
+    )
+
+
 def create_category(
     body: CategoryCreateRequest,
     session: Session,
@@ -74,6 +166,7 @@ def create_category(
 
     session.add(category)
     session.commit()
+    response_cache.bump_version(AppResource.CATEGORY)
     session.refresh(category)
 
     return CategoryResponse(result=category)
@@ -83,9 +176,17 @@ def update_category(
     category_id: str,
     body: CategoryUpdateRequest,
     session: Session,
+    if_match: Optional[str] = None,
 ) -> CategoryResponse:
     category = check_category_exists(category_id=category_id, session=session)
 
+    check_version_precondition(
+        resource=AppResource.CATEGORY,
+        version=category.version,
+        if_match=if_match,
+        expected_version=body.version,
+    )
+
     check_category_name_exists(
         name=body.name, session=session, previous_category_id=category_id
     )
@@ -94,7 +195,8 @@ def update_category(
     category.description = body.description
     category.is_active = body.is_active
 
-    session.commit()
+    commit_versioned(AppResource.CATEGORY, session)
+    response_cache.bump_version(AppResource.CATEGORY)
     session.refresh(category)
 
     return CategoryResponse(result=category)
@@ -103,22 +205,79 @@ def update_category(
 def delete_category(
     category_id: str,
     session: Session,
+    strategy: DeleteStrategy = DeleteStrategy.RESTRICT,
+    reassign_to: Optional[str] = None,
 ) -> ResourceDeletedMessage:
+    """Delete a category and deal with its items in one transaction.
+
+    restrict leaves it to the foreign key to refuse the delete while items
+    remain, cascade deletes the items with a single statement that also
+    writes their tombstones, and reassign moves them to another category.
+    """
     category = check_category_exists(category_id=category_id, session=session)
+    affected_items = 0
+
+    if strategy is DeleteStrategy.CASCADE:
+        batch = (
+            select(Item.id)
+            .where(Item.category_id == category.id)
+            .order_by(Item.id)
+            .with_for_update()
+            .cte("batch")
+        )
+        affected_items, _ = delete_item_batch(batch, session)
+    elif strategy is DeleteStrategy.REASSIGN:
+        target = check_category_reassign_target(category, reassign_to, session)
+        # The version is bumped like an ORM update, so clients holding an
+        # ETag from before the move get a conflict on their next write.
+        affected_items = session.execute(
+            update(Item)
+            .where(Item.category_id == category.id)
+            .values(
+                category_id=target.id,
+                version=Item.version + 1,
+                updated_at=func.now(),
+            )
+            .execution_options(synchronize_session=False)
+        ).rowcount
 
     session.delete(category)
-    session.commit()
 
-    return ResourceDeletedMessage(id=category.id, resource=AppResource.CATEGORY)
+    try:
+        session.flush()
+    except IntegrityError:
+        session.rollback()
+        raise ResourceInUse(resource=AppResource.CATEGORY, dependent=AppResource.ITEM)
+
+    commit_versioned(AppResource.CATEGORY, session)
+    response_cache.bump_version(AppResource.CATEGORY)
+
+    if affected_items:
+        response_cache.bump_version(AppResource.ITEM)
+
+    return ResourceDeletedMessage(
+        id=category.id,
+        resource=AppResource.CATEGORY,
+        strategy=strategy,
+        affected_items=affected_items,
+    )
 
 
 def patch_category(
     category_id: str,
     body: CategoryPatchRequest,
     session: Session,
+    if_match: Optional[str] = None,
 ) -> CategoryResponse:
     category = check_category_exists(category_id=category_id, session=session)
 
+    check_version_precondition(
+        resource=AppResource.CATEGORY,
+        version=category.version,
+        if_match=if_match,
+        expected_version=body.version,
+    )
+
     if body.name is not None:
         check_category_name_exists(
             name=body.name, session=session, previous_category_id=category_id
@@ -131,7 +290,8 @@ def patch_category(
     if body.is_active is not None:
         category.is_active = body.is_active
 
-    session.commit()
+    commit_versioned(AppResource.CATEGORY, session)
+    response_cache.bump_version(AppResource.CATEGORY)
     session.refresh(category)
 
     return CategoryResponse(result=category)
@@ -163,3 +323,30 @@ def check_category_exists(
         raise ResourceNotFound(resource=AppResource.CATEGORY)
 
     return category
+
+
+def check_category_reassign_target(
+    category: Category,
+    reassign_to: Optional[str],
+    session: Session,
+) -> Category:
+    if reassign_to is None:
+        raise InvalidReassignTarget(
+            resource=AppResource.CATEGORY,
+            reason="reassign_to is required with strategy=reassign.",
+        )
+
+    if reassign_to.lower() == category.id:
+        raise InvalidReassignTarget(
+            resource=AppResource.CATEGORY,
+            reason="it is the category being deleted.",
+        )
+
+    target = session.scalar(select(Category).where(Category.id == reassign_to))
+
+    if not target:
+        raise InvalidReassignTarget(
+            resource=AppResource.CATEGORY, reason="it does not exist."
+        )
+
+    return target
@@ -0,0 +1,155 @@
+from typing import List, Optional
+
+from sqlalchemy import func, select, text, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ..database_schema import Category, CategoryInventorySummary, Item
+from ..models.category import (
+    CategoryInventoryDriftModel,
+    CategoryInventorySummaryListResponse,
+    CategoryInventoryTotals,
+)
+from ..models.filters import CreatedRange
+from ..services.uuid import created_between
+
+SUMMARY_TOTALS = ("active_item_count", "total_stock", "low_stock_item_count")
+
+
+def read_category_inventory_summary(
+    page: int,
+    page_size: int,
+    session: Session,
+    created: Optional[CreatedRange] = None,
+) -> CategoryInventorySummaryListResponse:
+    offset = (page - 1) * page_size
+    where_clause = Category.is_active.is_(True) & created_between(Category.id, created)
+
+    summary_query = (
+        select(
+            Category.id.label("category_id"),
+            Category.name.label("category_name"),
+            *(
+                func.coalesce(getattr(CategoryInventorySummary, total), 0).label(total)
+                for total in SUMMARY_TOTALS
+            ),
+        )
+        .outerjoin(
+            CategoryInventorySummary,
+            CategoryInventorySummary.category_id == Category.id,
+        )
+        .where(where_clause)
+        .offset(offset)
+        .limit(page_size)
+        .order_by(Category.id.desc())
+    )
+
+    total_count_query = select(func.count(Category.id)).where(where_clause)
+
+    total_count = session.scalar(total_count_query)
+    summaries = session.execute(summary_query).all()
+
+    return CategoryInventorySummaryListResponse(
+        result=summaries,
+        total=total_count,
+        page=page,
+        page_size=page_size,
+    )
+
+
+def reconcile_category_inventory_summary(
+    repair: bool,
+    session: Session,
+) -> List[CategoryInventoryDriftModel]:
+    """Compare the summary with totals recomputed from item.
+
+    When repairing, the summary table is locked first so item writes wait for
+    the repair and then apply their deltas on top of the corrected totals.
+    """
+    if repair:
+        session.execute(
+            text("LOCK TABLE category_inventory_summary IN SHARE ROW EXCLUSIVE MODE")
+        )
+
+    expected = (
+        select(
+            Item.category_id,
+            func.count().label("active_item_count"),
+            func.sum(Item.stock_quantity).label("total_stock"),
+            func
+            .count()
+            .filter(Item.stock_quantity < Item.minimum_threshold)
+            .label("low_stock_item_count"),
+        )
+        .where(Item.is_active.is_(True))
+        .group_by(Item.category_id)
+        .subquery()
+    )
+
+    expected_totals = [
+        func.coalesce(expected.c[total], 0).label(f"expected_{total}")
+        for total in SUMMARY_TOTALS
+    ]
+    actual_totals = [
+        func.coalesce(getattr(CategoryInventorySummary, total), 0).label(
+            f"actual_{total}"
+        )
+        for total in SUMMARY_TOTALS
+    ]
+
+    drift_query = (
+        select(
+            func.coalesce(
+                expected.c.category_id, CategoryInventorySummary.category_id
+            ).label("category_id"),
+            *expected_totals,
+            *actual_totals,
+        )
+        .select_from(expected)
+        .join(
+            CategoryInventorySummary,
+            CategoryInventorySummary.category_id == expected.c.category_id,
+            full=True,
+        )
+        .where(tuple_(*expected_totals).is_distinct_from(tuple_(*actual_totals)))
+        .order_by("category_id")
+    )
+
+    drifts = [
+        CategoryInventoryDriftModel(
+            category_id=row.category_id,
+            expected=CategoryInventoryTotals(**{
+                total: row._mapping[f"expected_{total}"] for total in SUMMARY_TOTALS
+            }),
+            actual=CategoryInventoryTotals(**{
+                total: row._mapping[f"actual_{total}"] for total in SUMMARY_TOTALS
+            }),
+        )
+        for row in session.execute(drift_query)
+    ]
+
+    if not repair:
+        session.rollback()
+        return drifts
+
+    if drifts:
+        repair_statement = insert(CategoryInventorySummary).values([
+            {"category_id": drift.category_id, **drift.expected.model_dump()}
+            for drift in drifts
+        ])
+        session.execute(
+            repair_statement.on_conflict_do_update(
+                index_elements=[CategoryInventorySummary.category_id],
+                set_={
+                    **{
+                        total: getattr(repair_statement.excluded, total)
+                        for total in SUMMARY_TOTALS
+                    },
+                    "updated_at": func.now(),
+                },
+            )
+        )
+
+    session.commit()
+
+    return drifts
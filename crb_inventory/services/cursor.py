@@ -0,0 +1,39 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+
+from ..models.exceptions.pagination import InvalidCursor
+
+
+def encode_cursor(values: list) -> str:
+    payload = json.dumps(values, default=_encode_value, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list:
+    padding = "=" * (-len(cursor) % 4)
+
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor()
+
+    if not isinstance(values, list) or len(values) != size:
+        raise InvalidCursor()
+
+    return values
+
+
+def decode_cursor_datetime(value) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise InvalidCursor()
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    raise TypeError(f"Cannot encode {type(value).__name__} in a cursor")
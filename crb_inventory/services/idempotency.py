@@ -0,0 +1,94 @@
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ..database_schema import IdempotencyKey
+from ..settings import get_settings
+
+
+def read_idempotency_key(
+    key: str,
+    session: Session,
+) -> Optional[IdempotencyKey]:
+    key_query = select(IdempotencyKey).where(
+        IdempotencyKey.key == key,
+        IdempotencyKey.expires_at > func.now(),
+    )
+
+    return session.scalar(key_query)
+
+
+def claim_idempotency_key(
+    key: str,
+    fingerprint: str,
+    session: Session,
+) -> bool:
+    """Insert the key in the current transaction, taking over an expired one.
+
+    The claim is left uncommitted on purpose: it is committed together with
+    the write it guards, and a concurrent request with the same key blocks on
+    it until then instead of running the write a second time.
+    """
+    claim_statement = insert(IdempotencyKey).values(
+        key=key,
+        fingerprint=fingerprint,
+        expires_at=func.now() + timedelta(seconds=get_settings().IDEMPOTENCY_KEY_TTL),
+    )
+    claim_statement = claim_statement.on_conflict_do_update(
+        index_elements=[IdempotencyKey.key],
+        set_={
+            "fingerprint": claim_statement.excluded.fingerprint,
+            "expires_at": claim_statement.excluded.expires_at,
+            "response_status": None,
+            "response_body": None,
+            "created_at": func.now(),
+        },
+        where=IdempotencyKey.expires_at <= func.now(),
+    ).returning(IdempotencyKey.key)
+
+    return session.execute(claim_statement).first() is not None
+
+
+def complete_idempotency_key(
+    key: str,
+    response_status: int,
+    response_body: bytes,
+    session: Session,
+):
+    session.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.key == key)
+        .values(response_status=response_status, response_body=response_body)
+    )
+    session.commit()
+
+
+def abandon_idempotency_key(
+    key: str,
+    session: Session,
+):
+    """Forget a key whose request failed, so a retry runs it again."""
+    session.rollback()
+    session.execute(
+        delete(IdempotencyKey).where(
+            IdempotencyKey.key == key,
+            IdempotencyKey.response_body.is_(None),
+        )
+    )
+    session.commit()
+
+
+def purge_idempotency_keys(
+    session: Session,
+) -> int:
+    purge_statement = delete(IdempotencyKey).where(
+        IdempotencyKey.expires_at <= func.now()
+    )
+
+    result = session.execute(purge_statement)
+    session.commit()
+
+    return result.rowcount
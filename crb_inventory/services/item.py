@@ -1,39 +1,85 @@
-from sqlalchemy import func, select
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import column, func, select, table, tuple_
 from sqlalchemy.orm import Session
 
 from crb_inventory.services.tag import check_tag_exists
 
-from ..database_schema import Item, Tag
+from ..core.cache import response_cache
+from ..database_schema import Item, ItemTombstone, Tag
 from ..models.exceptions.item import (
     ItemNameAlreadyExists,
     TagAlreadyAssociatedWithItem,
     TagNotAssociatedWithItem,
 )
+from ..models.exceptions.pagination import InvalidCursor
 from ..models.exceptions.resource import ResourceNotFound
+from ..models.filters import CreatedRange, Page
 from ..models.item import (
+    ItemBatchGetResponse,
     ItemCreateRequest,
+    ItemCreationBucket,
+    ItemCreationStatsResponse,
+    ItemDeltaResponse,
+    ItemFilter,
+    ItemListOrder,
     ItemListResponse,
     ItemPatchRequest,
     ItemResponse,
     ItemTagAddMessage,
     ItemTagDeleteMessage,
+    ItemTagFilter,
     ItemTagListResponse,
     ItemUpdateRequest,
 )
-from ..models.utils import AppResource, ResourceDeletedMessage
+from ..models.utils import (
+    AppResource,
+    BatchGetRequest,
+    ResourceDeletedMessage,
+)
 from ..services.category import check_category_exists
-from ..services.uuid import generate_uuid_v7
+from ..services.cursor import decode_cursor, decode_cursor_datetime, encode_cursor
+from ..services.item_filter import (
+    choose_item_filter_fence,
+    item_filter_clause,
+    read_tag_item_counts,
+)
+from ..services.item_order import next_item_cursor, page_items
+from ..services.uuid import (
+    created_between,
+    generate_uuid_v7,
+    match_any_uuid,
+    uuid_v7_timestamp,
+    validate_uuid,
+)
+from ..services.version import check_version_precondition, commit_versioned
 
 
 def read_items(
-    page: int,
-    page_size: int,
+    page: Page,
     session: Session,
+    order: Optional[ItemListOrder] = None,
+    item_filter: Optional[ItemFilter] = None,
 ) -> ItemListResponse:
-    offset = (page - 1) * page_size
-    where_clause = Item.is_active.is_(True)
-
-    items_query = (
+    order = order or ItemListOrder()
+    item_filter = item_filter or ItemFilter()
+    tag_item_counts = read_tag_item_counts(item_filter.tags.tag_ids, session)
+    where_clause = item_filter_clause(item_filter)
+
+    # The tag counter already holds the number of active items with the tag,
+    # so a list of one tag only needs a COUNT when it is narrowed further.
+    tag_ids = item_filter.tags.tag_ids
+    if len(tag_ids) == 1 and item_filter == ItemFilter(
+        tags=ItemTagFilter(tag_ids=tag_ids)
+    ):
+        total_count = tag_item_counts.get(tag_ids[0], 0)
+    else:
+        total_count_query = select(func.count(Item.id)).where(where_clause)
+        total_count = session.scalar(total_count_query)
+
+    fence = choose_item_filter_fence(item_filter, order, tag_item_counts, total_count)
+    items_query = page_items(
         select(
             Item.id,
             Item.name,
@@ -42,25 +88,23 @@ def read_items(
             Item.category_id,
             Item.minimum_threshold,
             Item.stock_quantity,
+            Item.reserved_quantity,
             Item.created_at,
             Item.updated_at,
-        )
-        .where(where_clause)
-        .offset(offset)
-        .limit(page_size)
-        .order_by(Item.id.desc())
+            Item.version,
+        ).where(item_filter_clause(item_filter, fence)),
+        page=page,
+        order=order,
     )
 
-    total_count_query = select(func.count(Item.id)).where(where_clause)
-
-    total_count = session.scalar(total_count_query)
     items = session.execute(items_query).all()
 
     return ItemListResponse(
         result=items,
         total=total_count,
-        page=page,
-        page_size=page_size,
+        page=page.page,
+        page_size=page.page_size,
+        next_cursor=next_item_cursor(items, page=page, order=order),
     )
 
 
@@ -73,6 +117,170 @@ def read_item(
     return ItemResponse(result=item)
 
 
+def read_items_batch(
+    body: BatchGetRequest,
+    session: Session,
+) -> ItemBatchGetResponse:
+    item_ids = list(dict.fromkeys(value.lower() for value in body.ids))
+
+    items_query = (
+        select(
+            Item.id,
+            Item.name,
+            Item.description,
+            Item.is_active,
+            Item.category_id,
+            Item.minimum_threshold,
+            Item.stock_quantity,
+            Item.reserved_quantity,
+            Item.created_at,
+            Item.updated_at,
+            Item.version,
+        )
+        .where(match_any_uuid(Item.id, item_ids))
+        .order_by(Item.id.desc())
+    )
+
+    items = session.execute(items_query).all()
+    found_ids = {item.id for item in items}
+
+    return ItemBatchGetResponse(
+        result=items,
+        missing=[item_id for item_id in item_ids if item_id not in found_ids],
+    )
+
+
+def read_delta_horizon(session: Session) -> datetime:
+    """Start of the oldest transaction open in this database.
+
+    updated_at and deleted_at hold the start of the writing transaction, not
+    its commit, so a change can commit behind a watermark already handed out.
+    Every change stamped before this horizon has committed or rolled back.
+    It is read in its own statement, before the changes, so transactions
+    that end in between are visible to them. The application role has to
+    see the transactions of every writer, which holds when they share it.
+    """
+    activity = table("pg_stat_activity", column("datname"), column("xact_start"))
+    horizon_query = select(
+        func.least(func.min(activity.c.xact_start), func.now())
+    ).where(activity.c.datname == func.current_database())
+
+    return session.scalar(horizon_query)
+
+
+def read_items_delta(
+    since: Optional[str],
+    limit: int,
+    session: Session,
+) -> ItemDeltaResponse:
+    """Read the changes after a watermark, up to the delta horizon.
+
+    Changes newer than read_delta_horizon are left for a later sync, so the
+    watermark never passes a change that has yet to commit.
+    """
+    horizon = read_delta_horizon(session)
+
+    # One more row of each stream tells whether the merged page was cut.
+    items_query = (
+        select(
+            Item.id,
+            Item.name,
+            Item.description,
+            Item.is_active,
+            Item.category_id,
+            Item.minimum_threshold,
+            Item.stock_quantity,
+            Item.reserved_quantity,
+            Item.created_at,
+            Item.updated_at,
+            Item.version,
+        )
+        .where(Item.updated_at < horizon)
+        .order_by(Item.updated_at, Item.id)
+        .limit(limit + 1)
+    )
+    tombstones_query = (
+        select(ItemTombstone.item_id, ItemTombstone.deleted_at)
+        .where(ItemTombstone.deleted_at < horizon)
+        .order_by(ItemTombstone.deleted_at, ItemTombstone.item_id)
+        .limit(limit + 1)
+    )
+
+    if since is not None:
+        changed_at, item_id = decode_delta_watermark(since)
+        items_query = items_query.where(
+            tuple_(Item.updated_at, Item.id) > tuple_(changed_at, item_id)
+        )
+        tombstones_query = tombstones_query.where(
+            tuple_(ItemTombstone.deleted_at, ItemTombstone.item_id)
+            > tuple_(changed_at, item_id)
+        )
+
+    items = session.execute(items_query).all()
+    tombstones = session.execute(tombstones_query).all()
+
+    # Both streams are ordered by (changed_at, id), so merging them and
+    # keeping the first page keeps the watermark consistent for both.
+    changes = sorted(
+        [(item.updated_at, item.id, False, item) for item in items]
+        + [
+            (tombstone.deleted_at, tombstone.item_id, True, tombstone)
+            for tombstone in tombstones
+        ],
+        key=lambda change: change[:2],
+    )
+
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+
+    watermark = since
+    if changes:
+        changed_at, item_id, _, _ = changes[-1]
+        watermark = encode_cursor([changed_at, item_id])
+
+    return ItemDeltaResponse(
+        result=[row for _, _, deleted, row in changes if not deleted],
+        deleted=[row for _, _, deleted, row in changes if deleted],
+        watermark=watermark,
+        has_more=has_more,
+    )
+
+
+def read_item_creation_stats(
+    bucket: ItemCreationBucket,
+    session: Session,
+    created: Optional[CreatedRange] = None,
+) -> ItemCreationStatsResponse:
+    """Count active items per hour or day of creation.
+
+    The creation time is read from the UUIDv7 key rather than created_at, so
+    the range is served by the primary key index.
+    """
+    bucket_start = func.date_trunc(
+        bucket.value, uuid_v7_timestamp(Item.id), "UTC"
+    ).label("start")
+
+    stats_query = (
+        select(bucket_start, func.count().label("count"))
+        .where(Item.is_active.is_(True) & created_between(Item.id, created))
+        .group_by(bucket_start)
+        .order_by(bucket_start)
+    )
+
+    return ItemCreationStatsResponse(
+        bucket=bucket, result=session.execute(stats_query).all()
+    )
+
+
+def decode_delta_watermark(watermark: str) -> tuple[datetime, str]:
+    changed_at, item_id = decode_cursor(watermark, size=2)
+
+    if not isinstance(item_id, str) or not validate_uuid(item_id):
+        raise InvalidCursor()
+
+    return decode_cursor_datetime(changed_at), item_id
+
+
 def create_item(
     body: ItemCreateRequest,
     session: Session,
@@ -97,6 +305,7 @@ def create_item(
 
     session.add(item)
     session.commit()
+    response_cache.bump_version(AppResource.ITEM)
     session.refresh(item)
 
     return ItemResponse(result=item)
@@ -106,16 +315,25 @@ def update_item(
     item_id: str,
     body: ItemUpdateRequest,
     session: Session,
+    if_match: Optional[str] = None,
 ) -> ItemResponse:
     item = check_item_exists(item_id, session)
 
+    check_version_precondition(
+        resource=AppResource.ITEM,
+        version=item.version,
+        if_match=if_match,
+        expected_version=body.version,
+    )
+
     check_item_name_exists(body.name, session, item.id)
     check_category_exists(body.category_id, session)
 
-    for key, value in body.model_dump().items():
+    for key, value in body.model_dump(exclude={"version"}).items():
         setattr(item, key, value)
 
-    session.commit()
+    commit_versioned(AppResource.ITEM, session)
+    response_cache.bump_version(AppResource.ITEM)
     session.refresh(item)
 
     return ItemResponse(result=item)
@@ -128,7 +346,9 @@ def delete_item(
     item = check_item_exists(item_id, session)
 
     session.delete(item)
-    session.commit()
+    session.add(ItemTombstone(item_id=item.id))
+    commit_versioned(AppResource.ITEM, session)
+    response_cache.bump_version(AppResource.ITEM)
 
     return ResourceDeletedMessage(id=item.id, resource=AppResource.ITEM)
 
@@ -137,9 +357,17 @@ def patch_item(
     item_id: str,
     body: ItemPatchRequest,
     session: Session,
+    if_match: Optional[str] = None,
 ) -> ItemResponse:
     item = check_item_exists(item_id, session)
 
+    check_version_precondition(
+        resource=AppResource.ITEM,
+        version=item.version,
+        if_match=if_match,
+        expected_version=body.version,
+    )
+
     if body.name is not None:
         check_item_name_exists(body.name, session, item.id)
         item.name = body.name
@@ -160,7 +388,8 @@ def patch_item(
     if body.stock_quantity is not None:
         item.stock_quantity = body.stock_quantity
 
-    session.commit()
+    commit_versioned(AppResource.ITEM, session)
+    response_cache.bump_version(AppResource.ITEM)
     session.refresh(item)
 
     return ItemResponse(result=item)
@@ -215,6 +444,7 @@ def add_tag_to_item(
 
     item.tags.append(tag)
     session.commit()
+    response_cache.bump_version(AppResource.ITEM)
 
     return ItemTagAddMessage(item_id=item.id, tag_id=tag.id)
 
@@ -231,6 +461,7 @@ def delete_tag_from_item(
 
     item.tags.remove(tag)
     session.commit()
+    response_cache.bump_version(AppResource.ITEM)
 
     return ItemTagDeleteMessage(item_id=item.id, tag_id=tag.id)
 
@@ -247,83 +478,37 @@ def check_tag_not_associated_with_item(item: Item, tag: Tag):
 
 def read_items_by_category(
     category_id: str,
-    page: int,
-    page_size: int,
+    page: Page,
     session: Session,
+    created: Optional[CreatedRange] = None,
+    order: Optional[ItemListOrder] = None,
 ) -> ItemListResponse:
     category = check_category_exists(category_id, session)
 
-    offset = (page - 1) * page_size
-    where_clause = Item.is_active.is_(True) & (Item.category_id == category.id)
-
-    items_query = (
-        select(
-            Item.id,
-            Item.name,
-            Item.description,
-            Item.is_active,
-            Item.category_id,
-            Item.minimum_threshold,
-            Item.stock_quantity,
-            Item.created_at,
-            Item.updated_at,
-        )
-        .where(where_clause)
-        .offset(offset)
-        .limit(page_size)
-        .order_by(Item.id.desc())
-    )
-
-    total_count_query = select(func.count(Item.id)).where(where_clause)
-    total_count = session.scalar(total_count_query)
-
-    items = session.execute(items_query).all()
-
-    return ItemListResponse(
-        result=items,
-        total=total_count,
+    return read_items(
         page=page,
-        page_size=page_size,
+        order=order,
+        item_filter=ItemFilter(
+            category_ids=[category.id], created=created or CreatedRange()
+        ),
+        session=session,
     )
 
 
 def read_items_by_tag(
     tag_id: str,
-    page: int,
-    page_size: int,
+    page: Page,
     session: Session,
+    created: Optional[CreatedRange] = None,
+    order: Optional[ItemListOrder] = None,
 ) -> ItemListResponse:
     tag = check_tag_exists(tag_id, session)
 
-    offset = (page - 1) * page_size
-    where_clause = Item.is_active.is_(True) & (Item.tags.any(Tag.id == tag.id))
-
-    items_query = (
-        select(
-            Item.id,
-            Item.name,
-            Item.description,
-            Item.is_active,
-            Item.category_id,
-            Item.minimum_threshold,
-            Item.stock_quantity,
-            Item.created_at,
-            Item.updated_at,
-        )
-        .where(where_clause)
-        .offset(offset)
-        .limit(page_size)
-        .order_by(Item.id.desc())
-    )
-
-    total_count_query = select(func.count(Item.id)).where(where_clause)
-    total_count = session.scalar(total_count_query)
-
-    items = session.execute(items_query).all()
-
-    return ItemListResponse(
-        result=items,
-        total=total_count,
+    return read_items(
         page=page,
-        page_size=page_size,
+        order=order,
+        item_filter=ItemFilter(
+            tags=ItemTagFilter(tag_ids=[tag.id]), created=created or CreatedRange()
+        ),
+        session=session,
     )
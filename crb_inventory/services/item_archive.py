@@ -0,0 +1,166 @@
+from datetime import datetime
+
+from sqlalchemy import delete, exists, func, insert, select
+from sqlalchemy.orm import Session
+
+from ..core.cache import response_cache
+from ..database_schema import (
+    Item,
+    Tag,
+    item_archive,
+    item_tag_association,
+    item_tag_association_archive,
+)
+from ..models.exceptions.resource import ResourceNotFound
+from ..models.item import ItemResponse
+from ..models.utils import AppResource
+from ..services.category import check_category_exists
+from ..services.item import check_item_exists, check_item_name_exists
+
+ITEM_COLUMNS = [
+    "id",
+    "name",
+    "description",
+    "is_active",
+    "category_id",
+    "minimum_threshold",
+    "stock_quantity",
+    "created_at",
+    "updated_at",
+    "version",
+]
+
+
+def archive_inactive_items(
+    inactive_before: datetime,
+    batch_size: int,
+    session: Session,
+) -> int:
+    """Move one batch of long inactive items and their tags to the archive.
+
+    The batch is selected with SKIP LOCKED and moved by a single statement, so
+    rows being edited are left for a later batch and the transaction only
+    holds locks on the rows it moves.
+    """
+    item_table = Item.__table__
+
+    batch = (
+        select(item_table.c.id)
+        .where(
+            item_table.c.is_active.is_(False),
+            item_table.c.updated_at < inactive_before,
+        )
+        .order_by(item_table.c.updated_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .cte("batch")
+    )
+
+    # The delete trigger of item removes the tags once the items are gone.
+    moved_tags = (
+        select(item_tag_association.c.item_id, item_tag_association.c.tag_id)
+        .where(item_tag_association.c.item_id.in_(select(batch.c.id)))
+        .cte("moved_tags")
+    )
+
+    archived_tags = (
+        insert(item_tag_association_archive)
+        .from_select(
+            ["item_id", "tag_id"],
+            select(moved_tags.c.item_id, moved_tags.c.tag_id),
+        )
+        .cte("archived_tags")
+    )
+
+    moved_items = (
+        delete(item_table)
+        .where(item_table.c.id.in_(select(batch.c.id)))
+        .returning(*[item_table.c[column] for column in ITEM_COLUMNS])
+        .cte("moved_items")
+    )
+
+    archive_statement = (
+        insert(item_archive)
+        .from_select(
+            ITEM_COLUMNS,
+            select(*[moved_items.c[column] for column in ITEM_COLUMNS]),
+        )
+        .add_cte(archived_tags)
+    )
+
+    archived = session.execute(archive_statement).rowcount
+    session.commit()
+
+    if archived:
+        response_cache.bump_version(AppResource.ITEM)
+
+    return archived
+
+
+def read_item_including_archived(
+    item_id: str,
+    session: Session,
+) -> ItemResponse:
+    item = session.scalar(select(Item).where(Item.id == item_id))
+
+    if item:
+        return ItemResponse(result=item)
+
+    archived_item = check_archived_item_exists(item_id, session)
+
+    return ItemResponse(result=archived_item)
+
+
+def restore_archived_item(
+    item_id: str,
+    session: Session,
+) -> ItemResponse:
+    archived_item = check_archived_item_exists(item_id, session)
+
+    check_item_name_exists(archived_item.name, session)
+    check_category_exists(archived_item.category_id, session)
+
+    item_values = {column: archived_item[column] for column in ITEM_COLUMNS}
+    item_values["updated_at"] = func.now()
+    item_values["version"] = archived_item.version + 1
+
+    session.execute(insert(Item.__table__).values(**item_values))
+
+    # Tags deleted while the item was archived are dropped on restore.
+    session.execute(
+        insert(item_tag_association).from_select(
+            ["item_id", "tag_id"],
+            select(
+                item_tag_association_archive.c.item_id,
+                item_tag_association_archive.c.tag_id,
+            ).where(
+                item_tag_association_archive.c.item_id == item_id,
+                exists().where(Tag.id == item_tag_association_archive.c.tag_id),
+            ),
+        )
+    )
+    session.execute(
+        delete(item_tag_association_archive).where(
+            item_tag_association_archive.c.item_id == item_id
+        )
+    )
+    session.execute(delete(item_archive).where(item_archive.c.id == item_id))
+    session.commit()
+    response_cache.bump_version(AppResource.ITEM)
+
+    item = check_item_exists(item_id, session)
+
+    return ItemResponse(result=item)
+
+
+def check_archived_item_exists(
+    item_id: str,
+    session: Session,
+):
+    archived_item_query = select(item_archive).where(item_archive.c.id == item_id)
+    archived_item = session.execute(archived_item_query).mappings().first()
+
+    if not archived_item:
+        raise ResourceNotFound(resource=AppResource.ITEM)
+
+    return archived_item
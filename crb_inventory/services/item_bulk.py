@@ -0,0 +1,194 @@
+from typing import Callable, Iterator
+
+from sqlalchemy import (
+    CTE,
+    ColumnElement,
+    Select,
+    delete,
+    exists,
+    func,
+    insert,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.orm import Session
+
+from ..core.cache import response_cache
+from ..database_schema import Item, ItemTombstone, item_tag_association
+from ..models.item import (
+    ItemBulkDeactivateRequest,
+    ItemBulkDeactivateResponse,
+    ItemBulkDeleteResponse,
+    ItemBulkRequest,
+)
+from ..models.utils import AppResource
+from ..services.uuid import match_any_uuid
+
+item_table = Item.__table__
+tombstone_table = ItemTombstone.__table__
+
+
+def bulk_item_filter(body: ItemBulkRequest) -> ColumnElement[bool]:
+    condition = true()
+
+    if body.category_id is not None:
+        condition &= item_table.c.category_id == body.category_id
+
+    if body.tag_id is not None:
+        condition &= exists().where(
+            item_tag_association.c.item_id == item_table.c.id,
+            item_tag_association.c.tag_id == body.tag_id,
+        )
+
+    if body.inactive_since is not None:
+        condition &= item_table.c.is_active.is_(False) & (
+            item_table.c.updated_at < body.inactive_since
+        )
+
+    return condition
+
+
+def item_batches(
+    body: ItemBulkRequest, condition: ColumnElement[bool], chunk_size: int
+) -> Iterator[Select]:
+    """Yield selects of the IDs of one chunk, locked in primary key order.
+
+    ID lists are cut into chunks up front. Filters are re-evaluated for every
+    chunk, so the caller stops once a chunk affects fewer rows than its size.
+    """
+    if body.ids is not None:
+        ids = list(dict.fromkeys(value.lower() for value in body.ids))
+
+        for start in range(0, len(ids), chunk_size):
+            yield (
+                select(item_table.c.id)
+                .where(
+                    condition
+                    & match_any_uuid(item_table.c.id, ids[start : start + chunk_size])
+                )
+                .order_by(item_table.c.id)
+                .with_for_update()
+            )
+        return
+
+    while True:
+        yield (
+            select(item_table.c.id)
+            .where(condition)
+            .order_by(item_table.c.id)
+            .limit(chunk_size)
+            .with_for_update()
+        )
+
+
+def run_in_chunks(
+    body: ItemBulkRequest,
+    condition: ColumnElement[bool],
+    chunk_size: int,
+    session: Session,
+    run_chunk: Callable[[Select], tuple[int, ...]],
+) -> tuple[int, ...]:
+    """Run a set-based statement per chunk, committing after each one.
+
+    Committing per chunk keeps row locks and the change feed transactions
+    short, at the price of a partially applied request if a later chunk
+    fails. Totals of the committed chunks are returned.
+    """
+    totals = None
+
+    for batch in item_batches(body, condition, chunk_size):
+        counts = run_chunk(batch.cte("batch"))
+        session.commit()
+
+        totals = counts if totals is None else tuple(map(sum, zip(totals, counts)))
+
+        if body.ids is None and counts[0] < chunk_size:
+            break
+
+    return totals
+
+
+def delete_item_batch(batch: CTE, session: Session) -> tuple[int, int]:
+    """Delete the items selected by a batch CTE in a single statement.
+
+    Their tombstones are written by the same statement, and the delete
+    trigger of item removes their tags. Returns the numbers of deleted items
+    and removed tags.
+    """
+    removed_tags = (
+        select(item_tag_association.c.item_id)
+        .where(item_tag_association.c.item_id.in_(select(batch.c.id)))
+        .cte("removed_tags")
+    )
+    deleted_items = (
+        delete(item_table)
+        .where(item_table.c.id.in_(select(batch.c.id)))
+        .returning(item_table.c.id)
+        .cte("deleted_items")
+    )
+    tombstones = (
+        insert(tombstone_table)
+        .from_select(["item_id"], select(deleted_items.c.id))
+        .returning(tombstone_table.c.item_id)
+        .cte("tombstones")
+    )
+
+    counts = session.execute(
+        select(
+            select(func.count()).select_from(tombstones).scalar_subquery(),
+            select(func.count()).select_from(removed_tags).scalar_subquery(),
+        )
+    ).one()
+
+    return tuple(counts)
+
+
+def bulk_delete_items(
+    body: ItemBulkRequest,
+    chunk_size: int,
+    session: Session,
+) -> ItemBulkDeleteResponse:
+    deleted, tags_removed = run_in_chunks(
+        body,
+        bulk_item_filter(body),
+        chunk_size,
+        session,
+        lambda batch: delete_item_batch(batch, session),
+    )
+
+    if deleted:
+        response_cache.bump_version(AppResource.ITEM)
+
+    return ItemBulkDeleteResponse(deleted=deleted, tags_removed=tags_removed)
+
+
+def bulk_deactivate_items(
+    body: ItemBulkDeactivateRequest,
+    chunk_size: int,
+    session: Session,
+) -> ItemBulkDeactivateResponse:
+    def deactivate_chunk(batch) -> tuple[int]:
+        # The version is bumped like an ORM update, so clients holding an
+        # ETag from before the deactivation get a conflict on their write.
+        statement = (
+            update(item_table)
+            .where(item_table.c.id.in_(select(batch.c.id)))
+            .values(
+                is_active=False,
+                version=item_table.c.version + 1,
+                updated_at=func.now(),
+            )
+        )
+
+        return (session.execute(statement).rowcount,)
+
+    condition = bulk_item_filter(body) & item_table.c.is_active.is_(True)
+    (deactivated,) = run_in_chunks(
+        body, condition, chunk_size, session, deactivate_chunk
+    )
+
+    if deactivated:
+        response_cache.bump_version(AppResource.ITEM)
+
+    return ItemBulkDeactivateResponse(deactivated=deactivated)
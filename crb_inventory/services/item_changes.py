@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import BIGINT, TEXT, delete, func, select, tuple_
+from sqlalchemy.orm import Session
+
+from ..database_schema import ItemChangeEvent
+from ..models.item import ItemChangeEventModel
+
+ItemChangePosition = tuple[int, int]
+
+
+def running_xid_horizon():
+    """Oldest transaction id that may still be running.
+
+    Every transaction below it has committed or rolled back.
+    """
+    snapshot_xmin = func.pg_snapshot_xmin(func.pg_current_snapshot())
+
+    return snapshot_xmin.cast(TEXT).cast(BIGINT)
+
+
+def read_item_change_start(session: Session) -> ItemChangePosition:
+    """Position before the events of every transaction still running."""
+    return session.scalar(select(running_xid_horizon())), 0
+
+
+def read_item_changes(
+    after: ItemChangePosition,
+    limit: int,
+    session: Session,
+) -> List[ItemChangeEventModel]:
+    """Read the events after a position, in commit-safe order.
+
+    Event ids are taken when a transaction writes but become visible when it
+    commits, so a lower id can show up after a higher one was read. Events
+    are read in (xid, id) order instead, and only from transactions older
+    than any still running: nothing can commit before an event once it is
+    read, so the position of the last event read is enough to resume.
+    """
+    changes_query = (
+        select(ItemChangeEvent)
+        .where(
+            tuple_(ItemChangeEvent.xid, ItemChangeEvent.id) > tuple_(*after),
+            ItemChangeEvent.xid < running_xid_horizon(),
+        )
+        .order_by(ItemChangeEvent.xid, ItemChangeEvent.id)
+        .limit(limit)
+    )
+
+    changes = session.scalars(changes_query).all()
+
+    return [ItemChangeEventModel.model_validate(change) for change in changes]
+
+
+def purge_item_changes(
+    before: datetime,
+    session: Session,
+) -> int:
+    purge_statement = delete(ItemChangeEvent).where(ItemChangeEvent.created_at < before)
+
+    result = session.execute(purge_statement)
+    session.commit()
+
+    return result.rowcount
@@ -0,0 +1,156 @@
+from enum import Enum
+from typing import Optional
+
+from sqlalchemy import ColumnElement, Select, and_, func, select
+from sqlalchemy.orm import Session
+
+from ..database_schema import Item, Tag, item_tag_association
+from ..models.item import (
+    ItemFilter,
+    ItemListOrder,
+    ItemSort,
+    ItemTagFilter,
+    ItemTagMatch,
+)
+from ..services.autocomplete import ITEM_NAME_KEY
+from ..services.uuid import created_between
+
+MATCHED_ITEMS_SORT_MAX_ITEMS = 10000
+
+
+class ItemFilterFence(Enum):
+    TAGS = "tags"
+    NAME_PREFIX = "name_prefix"
+
+
+def read_tag_item_counts(
+    tag_ids: list[str],
+    session: Session,
+) -> dict[str, int]:
+    if not tag_ids:
+        return {}
+
+    counts_query = select(Tag.id, Tag.active_item_count).where(Tag.id.in_(tag_ids))
+
+    return dict(session.execute(counts_query).all())
+
+
+def tagged_items_query(tags: ItemTagFilter) -> Select:
+    """Select the ids of the items with any or all of the tags.
+
+    Both read the (tag_id, item_id) index of the association. The association
+    holds a tag once per item, so an item has all the tags when it has as
+    many rows as there are tags.
+    """
+    tagged_items = select(item_tag_association.c.item_id).where(
+        item_tag_association.c.tag_id.in_(tags.tag_ids)
+    )
+
+    if tags.match is ItemTagMatch.ALL and len(tags.tag_ids) > 1:
+        tagged_items = tagged_items.group_by(item_tag_association.c.item_id).having(
+            func.count() == len(tags.tag_ids)
+        )
+
+    return tagged_items
+
+
+def count_tagged_items(tags: ItemTagFilter, tag_item_counts: dict[str, int]) -> int:
+    """Bound the number of active items with the tags from their counters."""
+    counts = [tag_item_counts.get(tag_id, 0) for tag_id in tags.tag_ids]
+
+    return min(counts) if tags.match is ItemTagMatch.ALL else sum(counts)
+
+
+def choose_item_filter_fence(
+    item_filter: ItemFilter,
+    order: ItemListOrder,
+    tag_item_counts: dict[str, int],
+    total_count: int,
+) -> Optional[ItemFilterFence]:
+    """Pick the filter whose matches are read whole before sorting, if any.
+
+    Tags and name prefixes have their own indexes, none of them in the order
+    of the list. Newest first walks the primary key and probes them for each
+    item, which stays cheap, but the other orders would walk their sort index
+    the same way and pay for every skipped item when few of them match. The
+    planner cannot tell how the matches spread along the sort index, so a
+    small enough match is fenced off in a materialized CTE and sorted.
+
+    Tags are bounded by their counters. A name prefix has no counter, so it
+    is only fenced when it is the only filter on the active items: the total
+    then counts its matches. With any other filter the total only bounds
+    the matches of all of them, and the prefix alone may match far more.
+    """
+    if order.sort is ItemSort.NEWEST:
+        return None
+
+    if (
+        item_filter.tags.tag_ids
+        and count_tagged_items(item_filter.tags, tag_item_counts)
+        <= MATCHED_ITEMS_SORT_MAX_ITEMS
+    ):
+        return ItemFilterFence.TAGS
+
+    if (
+        item_filter.name_prefix is not None
+        and item_filter == ItemFilter(name_prefix=item_filter.name_prefix)
+        and total_count <= MATCHED_ITEMS_SORT_MAX_ITEMS
+    ):
+        return ItemFilterFence.NAME_PREFIX
+
+    return None
+
+
+def item_filter_clause(
+    item_filter: ItemFilter,
+    fence: Optional[ItemFilterFence] = None,
+) -> ColumnElement[bool]:
+    """Build the WHERE clause of a filtered item list.
+
+    Every filter is written the way its index is declared: active items are
+    matched with IS TRUE like the partial sort and name indexes, inactive
+    items with NOT like ix_item_inactive_updated_at, and the name prefix on
+    lower(name) like ix_item_name_pattern.
+    """
+    state = item_filter.state
+    clauses = [
+        Item.is_active.is_(True) if state.is_active else ~Item.is_active,
+        created_between(Item.id, item_filter.created),
+    ]
+
+    if item_filter.category_ids:
+        clauses.append(Item.category_id.in_(item_filter.category_ids))
+
+    if state.min_stock is not None:
+        clauses.append(Item.stock_quantity >= state.min_stock)
+
+    if state.max_stock is not None:
+        clauses.append(Item.stock_quantity <= state.max_stock)
+
+    if item_filter.name_prefix is not None:
+        name_clause = ITEM_NAME_KEY.startswith(
+            item_filter.name_prefix.lower(), autoescape=True
+        )
+
+        if fence is ItemFilterFence.NAME_PREFIX:
+            name_clause = Item.id.in_(
+                fenced_ids(select(Item.id).where(Item.is_active.is_(True), name_clause))
+            )
+
+        clauses.append(name_clause)
+
+    if item_filter.tags.tag_ids:
+        tagged_items = tagged_items_query(item_filter.tags)
+
+        if fence is ItemFilterFence.TAGS:
+            tagged_items = fenced_ids(tagged_items)
+
+        clauses.append(Item.id.in_(tagged_items))
+
+    return and_(*clauses)
+
+
+def fenced_ids(ids_query: Select) -> Select:
+    matched_items = ids_query.cte("matched_items").prefix_with("MATERIALIZED")
+
+    return select(*matched_items.c)
@@ -0,0 +1,137 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Sequence
+
+from sqlalchemy import ColumnElement, Row, Select, tuple_
+
+from ..database_schema import Item
+from ..models.exceptions.pagination import InvalidCursor
+from ..models.filters import Page
+from ..models.item import ItemListOrder, ItemSort
+from ..services.cursor import decode_cursor, decode_cursor_datetime, encode_cursor
+from ..services.uuid import validate_uuid
+
+SORT_KEY_LABEL = "sort_key"
+
+
+def decode_cursor_str(value) -> str:
+    if not isinstance(value, str):
+        raise InvalidCursor()
+
+    return value
+
+
+def decode_cursor_int(value) -> int:
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise InvalidCursor()
+
+    return value
+
+
+def decode_cursor_uuid(value) -> str:
+    if not isinstance(value, str) or not validate_uuid(value):
+        raise InvalidCursor()
+
+    return value
+
+
+@dataclass(frozen=True)
+class ItemOrder:
+    """Sort key of an item list, tie-broken on id in the same direction.
+
+    Every order has partial indexes on (key, id) and (category_id, key, id),
+    so a page is read with one index range scan whatever its depth.
+    """
+
+    key: Optional[ColumnElement]
+    decode_key: Optional[Callable[[Any], Any]]
+    descending: bool
+
+    @property
+    def columns(self) -> tuple[ColumnElement, ...]:
+        return (Item.id,) if self.key is None else (self.key, Item.id)
+
+    @property
+    def decoders(self) -> tuple[Callable[[Any], Any], ...]:
+        if self.key is None:
+            return (decode_cursor_uuid,)
+
+        return (self.decode_key, decode_cursor_uuid)
+
+
+ITEM_ORDERS = {
+    ItemSort.NEWEST: ItemOrder(key=None, decode_key=None, descending=True),
+    ItemSort.NAME: ItemOrder(
+        key=Item.name, decode_key=decode_cursor_str, descending=False
+    ),
+    ItemSort.STOCK_QUANTITY: ItemOrder(
+        key=Item.stock_quantity, decode_key=decode_cursor_int, descending=False
+    ),
+    ItemSort.UPDATED_AT: ItemOrder(
+        key=Item.updated_at, decode_key=decode_cursor_datetime, descending=True
+    ),
+    ItemSort.SHORTFALL: ItemOrder(
+        key=Item.minimum_threshold - Item.stock_quantity,
+        decode_key=decode_cursor_int,
+        descending=True,
+    ),
+}
+
+
+def page_items(
+    items_query: Select,
+    page: Page,
+    order: ItemListOrder,
+) -> Select:
+    """Sort an item list and cut one page from it.
+
+    A cursor replaces the page number: the page starts right after the item
+    the cursor was issued for, which the index seeks to directly.
+    """
+    item_order = ITEM_ORDERS[order.sort]
+
+    if item_order.key is not None:
+        items_query = items_query.add_columns(item_order.key.label(SORT_KEY_LABEL))
+
+    if order.cursor is None:
+        items_query = items_query.offset((page.page - 1) * page.page_size)
+    else:
+        after = tuple_(*decode_item_cursor(order.cursor, order.sort))
+        columns = tuple_(*item_order.columns)
+        items_query = items_query.where(
+            columns < after if item_order.descending else columns > after
+        )
+
+    return items_query.limit(page.page_size).order_by(
+        *(
+            column.desc() if item_order.descending else column.asc()
+            for column in item_order.columns
+        )
+    )
+
+
+def next_item_cursor(
+    items: Sequence[Row],
+    page: Page,
+    order: ItemListOrder,
+) -> Optional[str]:
+    if len(items) < page.page_size:
+        return None
+
+    last_item = items[-1]
+    values = [last_item.id]
+
+    if ITEM_ORDERS[order.sort].key is not None:
+        values.insert(0, last_item._mapping[SORT_KEY_LABEL])
+
+    return encode_cursor([order.sort.value, *values])
+
+
+def decode_item_cursor(cursor: str, sort: ItemSort) -> list:
+    item_order = ITEM_ORDERS[sort]
+    sort_value, *values = decode_cursor(cursor, size=len(item_order.columns) + 1)
+
+    # A cursor only continues the order it was issued for.
+    if sort_value != sort.value:
+        raise InvalidCursor()
+
+    return [decode(value) for decode, value in zip(item_order.decoders, values)]
@@ -0,0 +1,257 @@
+from datetime import timedelta
+
+from sqlalchemy import column, func, insert, literal, select, update, values
+from sqlalchemy.dialects.postgresql import INTEGER
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Session
+
+from ..core.cache import response_cache
+from ..database_schema import Item, StockReservation
+from ..models.exceptions.reservation import InsufficientStock, ReservationNotHeld
+from ..models.exceptions.resource import ResourceNotFound
+from ..models.reservation import (
+    ReservationCreateRequest,
+    ReservationResponse,
+    ReservationStatus,
+)
+from ..models.utils import AppResource
+from ..services.item import check_item_exists
+from ..services.uuid import generate_uuid_v7
+from ..settings import get_settings
+
+HELD = ReservationStatus.HELD.value
+
+
+def create_reservation(
+    body: ReservationCreateRequest,
+    session: Session,
+) -> ReservationResponse:
+    """Hold stock of an item for a limited time.
+
+    Availability is checked and the hold is taken by one conditional update,
+    and the reservation row is inserted by the same statement, so the item row
+    is locked only for as long as that statement and its commit take.
+    """
+    item_table = Item.__table__
+    reservation_table = StockReservation.__table__
+    ttl = timedelta(seconds=body.ttl_seconds or get_settings().RESERVATION_DEFAULT_TTL)
+
+    held_stock = (
+        update(item_table)
+        .where(
+            item_table.c.id == body.item_id,
+            item_table.c.is_active.is_(True),
+            item_table.c.stock_quantity - item_table.c.reserved_quantity
+            >= body.quantity,
+        )
+        # Holds change availability, not the item, so updated_at is kept.
+        .values(
+            reserved_quantity=item_table.c.reserved_quantity + body.quantity,
+            updated_at=item_table.c.updated_at,
+        )
+        .returning(item_table.c.id)
+        .cte("held_stock")
+    )
+
+    reservation_statement = (
+        insert(reservation_table)
+        .from_select(
+            ["id", "item_id", "quantity", "status", "expires_at"],
+            select(
+                literal(generate_uuid_v7()),
+                held_stock.c.id,
+                literal(body.quantity),
+                literal(HELD),
+                func.now() + ttl,
+            ),
+        )
+        .returning(reservation_table)
+        .add_cte(held_stock)
+    )
+
+    reservation = session.execute(reservation_statement).first()
+    session.commit()
+
+    if reservation is None:
+        check_item_exists(body.item_id, session)
+        raise InsufficientStock(item_id=body.item_id, quantity=body.quantity)
+
+    response_cache.bump_version(AppResource.ITEM)
+
+    return ReservationResponse(result=reservation)
+
+
+def read_reservation(
+    reservation_id: str,
+    session: Session,
+) -> ReservationResponse:
+    reservation = check_reservation_exists(reservation_id, session)
+
+    return ReservationResponse(result=reservation)
+
+
+def confirm_reservation(
+    reservation_id: str,
+    session: Session,
+) -> ReservationResponse:
+    """Turn a hold into a stock decrement."""
+    return settle_reservation(
+        reservation_id=reservation_id,
+        status=ReservationStatus.CONFIRMED,
+        session=session,
+    )
+
+
+def release_reservation(
+    reservation_id: str,
+    session: Session,
+) -> ReservationResponse:
+    return settle_reservation(
+        reservation_id=reservation_id,
+        status=ReservationStatus.RELEASED,
+        session=session,
+    )
+
+
+def settle_reservation(
+    reservation_id: str,
+    status: ReservationStatus,
+    session: Session,
+) -> ReservationResponse:
+    item_table = Item.__table__
+    reservation_table = StockReservation.__table__
+
+    settled = (
+        update(reservation_table)
+        .where(
+            reservation_table.c.id == reservation_id,
+            reservation_table.c.status == HELD,
+            reservation_table.c.expires_at > func.now(),
+        )
+        .values(status=status.value, updated_at=func.now())
+        .returning(reservation_table)
+        .cte("settled")
+    )
+
+    item_values = {
+        "reserved_quantity": item_table.c.reserved_quantity - settled.c.quantity,
+        "updated_at": item_table.c.updated_at,
+    }
+
+    if status == ReservationStatus.CONFIRMED:
+        item_values = {
+            "reserved_quantity": item_table.c.reserved_quantity - settled.c.quantity,
+            "stock_quantity": item_table.c.stock_quantity - settled.c.quantity,
+            "version": item_table.c.version + 1,
+        }
+
+    settle_statement = (
+        update(item_table)
+        .where(item_table.c.id == settled.c.item_id)
+        .values(**item_values)
+        .returning(*[settled.c[column.name] for column in reservation_table.c])
+    )
+
+    reservation = session.execute(settle_statement).first()
+    session.commit()
+
+    if reservation is None:
+        reservation = check_reservation_exists(reservation_id, session)
+        raise ReservationNotHeld(
+            reservation_id=reservation_id,
+            status=(
+                ReservationStatus.EXPIRED.value
+                if reservation.status == HELD
+                else reservation.status
+            ),
+        )
+
+    response_cache.bump_version(AppResource.ITEM)
+
+    return ReservationResponse(result=reservation)
+
+
+def expire_reservations(
+    batch_size: int,
+    session: Session,
+) -> int:
+    """Expire one batch of lapsed holds and return their stock.
+
+    Reservations are claimed with SKIP LOCKED, so several sweepers can run
+    side by side and holds being confirmed or released concurrently are left
+    alone. The affected items are then locked in id order, which keeps
+    sweepers from deadlocking on items shared by their batches.
+    """
+    item_table = Item.__table__
+    reservation_table = StockReservation.__table__
+
+    batch = (
+        select(reservation_table.c.id)
+        .where(
+            reservation_table.c.status == HELD,
+            reservation_table.c.expires_at <= func.now(),
+        )
+        .order_by(reservation_table.c.expires_at)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+        .cte("batch")
+    )
+
+    expire_statement = (
+        update(reservation_table)
+        .where(reservation_table.c.id.in_(select(batch.c.id)))
+        .values(status=ReservationStatus.EXPIRED.value, updated_at=func.now())
+        .returning(reservation_table.c.item_id, reservation_table.c.quantity)
+    )
+
+    expired = session.execute(expire_statement).all()
+
+    released: dict[str, int] = {}
+    for item_id, quantity in expired:
+        released[item_id] = released.get(item_id, 0) + quantity
+
+    if released:
+        session.execute(
+            select(item_table.c.id)
+            .where(item_table.c.id.in_(released))
+            .order_by(item_table.c.id)
+            .with_for_update(key_share=True)
+        )
+
+        released_stock = values(
+            column("item_id", PG_UUID(as_uuid=False)),
+            column("quantity", INTEGER),
+            name="released_stock",
+        ).data(sorted(released.items()))
+
+        session.execute(
+            update(item_table)
+            .where(item_table.c.id == released_stock.c.item_id)
+            .values(
+                reserved_quantity=item_table.c.reserved_quantity
+                - released_stock.c.quantity,
+                updated_at=item_table.c.updated_at,
+            )
+        )
+
+    session.commit()
+
+    if released:
+        response_cache.bump_version(AppResource.ITEM)
+
+    return len(expired)
+
+
+def check_reservation_exists(
+    reservation_id: str,
+    session: Session,
+):
+    reservation_query = select(StockReservation.__table__).where(
+        StockReservation.id == reservation_id
+    )
+    reservation = session.execute(reservation_query).first()
+
+    if not reservation:
+        raise ResourceNotFound(resource=AppResource.RESERVATION)
+
+    return reservation
@@ -1,27 +1,51 @@
-from sqlalchemy import func, select
+from typing import Optional
+
+from sqlalchemy import delete, exists, func, literal, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
-from ..database_schema import Tag
-from ..models.exceptions.resource import ResourceNotFound
+from ..core.cache import response_cache
+from ..database_schema import Tag, item_tag_association
+from ..models.exceptions.resource import (
+    InvalidReassignTarget,
+    ResourceInUse,
+    ResourceNotFound,
+)
 from ..models.exceptions.tag import TagNameAlreadyExists
+from ..models.filters import CreatedRange
 from ..models.tag import (
+    TagBatchGetResponse,
     TagCreateRequest,
     TagListResponse,
     TagPatchRequest,
     TagResponse,
+    TagSort,
     TagUpdateRequest,
 )
-from ..models.utils import AppResource, ResourceDeletedMessage
-from ..services.uuid import generate_uuid_v7
+from ..models.utils import (
+    AppResource,
+    BatchGetRequest,
+    DeleteStrategy,
+    ResourceDeletedMessage,
+)
+from ..services.uuid import created_between, generate_uuid_v7, match_any_uuid
+from ..services.version import check_version_precondition, commit_versioned
+
+TAG_ORDERS = {
+    TagSort.NEWEST: (Tag.id.desc(),),
+    TagSort.POPULARITY: (Tag.active_item_count.desc(), Tag.id.desc()),
+}
 
 
 def read_tags(
     page: int,
     page_size: int,
     session: Session,
+    created: Optional[CreatedRange] = None,
+    sort: TagSort = TagSort.NEWEST,
 ) -> TagListResponse:
     offset = (page - 1) * page_size
-    where_clause = Tag.is_active.is_(True)
+    where_clause = Tag.is_active.is_(True) & created_between(Tag.id, created)
 
     tags_query = (
         select(
@@ -29,13 +53,16 @@ def read_tags(
             Tag.name,
             Tag.description,
             Tag.is_active,
+            Tag.item_count,
+            Tag.active_item_count,
             Tag.created_at,
             Tag.updated_at,
+            Tag.version,
         )
         .where(where_clause)
         .offset(offset)
         .limit(page_size)
-        .order_by(Tag.id.desc())
+        .order_by(*TAG_ORDERS[sort])
     )
 
     total_count_query = select(func.count(Tag.id)).where(where_clause)
@@ -60,6 +87,37 @@ def read_tag(
     return TagResponse(result=tag)
 
 
+def read_tags_batch(
+    body: BatchGetRequest,
+    session: Session,
+) -> TagBatchGetResponse:
+    tag_ids = list(dict.fromkeys(value.lower() for value in body.ids))
+
+    tags_query = (
+        select(
+            Tag.id,
+            Tag.name,
+            Tag.description,
+            Tag.is_active,
+            Tag.item_count,
+            Tag.active_item_count,
+            Tag.created_at,
+            Tag.updated_at,
+            Tag.version,
+        )
+        .where(match_any_uuid(Tag.id, tag_ids))
+        .order_by(Tag.id.desc())
+    )
+
+    tags = session.execute(tags_query).all()
+    found_ids = {tag.id for tag in tags}
+
+    return TagBatchGetResponse(
+        result=tags,
+        missing=[tag_id for tag_id in tag_ids if tag_id not in found_ids],
+    )
+
+
 def create_tag(
     body: TagCreateRequest,
     session: Session,
@@ -74,6 +132,7 @@ def create_tag(
 
     session.add(tag)
     session.commit()
+    response_cache.bump_version(AppResource.TAG)
     session.refresh(tag)
 
     return TagResponse(result=tag)
@@ -83,16 +142,25 @@ def update_tag(
     tag_id: str,
     body: TagUpdateRequest,
     session: Session,
+    if_match: Optional[str] = None,
 ) -> TagResponse:
     tag = check_tag_exists(tag_id, session)
 
+    check_version_precondition(
+        resource=AppResource.TAG,
+        version=tag.version,
+        if_match=if_match,
+        expected_version=body.version,
+    )
+
     check_tag_name_exists(body.name, session, previous_tag_id=tag_id)
 
     tag.name = body.name
     tag.description = body.description
     tag.is_active = body.is_active
 
-    session.commit()
+    commit_versioned(AppResource.TAG, session)
+    response_cache.bump_version(AppResource.TAG)
     session.refresh(tag)
 
     return TagResponse(result=tag)
@@ -101,22 +169,66 @@ def update_tag(
 def delete_tag(
     tag_id: str,
     session: Session,
+    strategy: DeleteStrategy = DeleteStrategy.CASCADE,
+    reassign_to: Optional[str] = None,
 ) -> ResourceDeletedMessage:
+    """Delete a tag and deal with its item associations in one transaction.
+
+    The tag row is locked first, so no association can be added while the
+    existing ones are checked, copied to the reassign target or removed.
+    """
     tag = check_tag_exists(tag_id, session)
+    session.execute(select(Tag.id).where(Tag.id == tag.id).with_for_update())
+    tagged_items = item_tag_association.c.tag_id == tag.id
+
+    if strategy is DeleteStrategy.RESTRICT:
+        if session.scalar(select(exists().where(tagged_items))):
+            raise ResourceInUse(resource=AppResource.TAG, dependent=AppResource.ITEM)
+    elif strategy is DeleteStrategy.REASSIGN:
+        target = check_tag_reassign_target(tag, reassign_to, session)
+        session.execute(
+            insert(item_tag_association)
+            .from_select(
+                ["item_id", "tag_id"],
+                select(
+                    item_tag_association.c.item_id,
+                    literal(target.id, item_tag_association.c.tag_id.type),
+                ).where(tagged_items),
+            )
+            .on_conflict_do_nothing()
+        )
 
-    session.delete(tag)
-    session.commit()
+    affected_items = session.execute(
+        delete(item_tag_association).where(tagged_items)
+    ).rowcount
 
-    return ResourceDeletedMessage(id=tag.id, resource=AppResource.TAG)
+    session.delete(tag)
+    commit_versioned(AppResource.TAG, session)
+    response_cache.bump_version(AppResource.TAG)
+
+    return ResourceDeletedMessage(
+        id=tag.id,
+        resource=AppResource.TAG,
+        strategy=strategy,
+        affected_items=affected_items,
+    )
 
 
 def patch_tag(
     tag_id: str,
     body: TagPatchRequest,
     session: Session,
+    if_match: Optional[str] = None,
 ) -> TagResponse:
     tag = check_tag_exists(tag_id, session)
 
+    check_version_precondition(
+        resource=AppResource.TAG,
+        version=tag.version,
+        if_match=if_match,
+        expected_version=body.version,
+    )
+
     if body.name is not None:
         check_tag_name_exists(body.name, session, previous_tag_id=tag_id)
         tag.name = body.name
@@ -127,7 +239,8 @@ def patch_tag(
     if body.is_active is not None:
         tag.is_active = body.is_active
 
-    session.commit()
+    commit_versioned(AppResource.TAG, session)
+    response_cache.bump_version(AppResource.TAG)
     session.refresh(tag)
 
     return TagResponse(result=tag)
@@ -159,3 +272,29 @@ def check_tag_exists(
         raise ResourceNotFound(resource=AppResource.TAG)
 
     return tag
+
+
+def check_tag_reassign_target(
+    tag: Tag,
+    reassign_to: Optional[str],
+    session: Session,
+) -> Tag:
+    if reassign_to is None:
+        raise InvalidReassignTarget(
+            resource=AppResource.TAG,
+            reason="reassign_to is required with strategy=reassign.",
+        )
+
+    if reassign_to.lower() == tag.id:
+        raise InvalidReassignTarget(
+            resource=AppResource.TAG, reason="it is the tag being deleted."
+        )
+
+    target = session.scalar(select(Tag).where(Tag.id == reassign_to))
+
+    if not target:
+        raise InvalidReassignTarget(
+            resource=AppResource.TAG, reason="it does not exist."
+        )
+
+    return target
@@ -0,0 +1,93 @@
+from typing import List
+
+from sqlalchemy import bindparam, func, select, text, tuple_, update
+from sqlalchemy.orm import Session
+
+from ..database_schema import Item, Tag, item_tag_association
+from ..models.tag import TagItemCountDriftModel, TagItemCounts
+
+TAG_COUNTS = ("item_count", "active_item_count")
+
+
+def reconcile_tag_item_counts(
+    repair: bool,
+    session: Session,
+) -> List[TagItemCountDriftModel]:
+    """Compare the tag counters with counts recomputed from the item tags.
+
+    When repairing, the tag table is locked first so the counter triggers of
+    concurrent writes wait for the repair and then apply their deltas on top
+    of the corrected counts.
+    """
+    if repair:
+        session.execute(text("LOCK TABLE tag IN SHARE ROW EXCLUSIVE MODE"))
+
+    expected = (
+        select(
+            item_tag_association.c.tag_id,
+            func.count().label("item_count"),
+            func.count().filter(Item.is_active.is_(True)).label("active_item_count"),
+        )
+        .join(Item, Item.id == item_tag_association.c.item_id)
+        .group_by(item_tag_association.c.tag_id)
+        .subquery()
+    )
+
+    expected_counts = [
+        func.coalesce(expected.c[count], 0).label(f"expected_{count}")
+        for count in TAG_COUNTS
+    ]
+    actual_counts = [
+        getattr(Tag, count).label(f"actual_{count}") for count in TAG_COUNTS
+    ]
+
+    drift_query = (
+        select(Tag.id, *expected_counts, *actual_counts)
+        .outerjoin(expected, expected.c.tag_id == Tag.id)
+        .where(tuple_(*expected_counts).is_distinct_from(tuple_(*actual_counts)))
+        .order_by(Tag.id)
+    )
+
+    drifts = [
+        TagItemCountDriftModel(
+            tag_id=row.id,
+            expected=TagItemCounts(**{
+                count: row._mapping[f"expected_{count}"] for count in TAG_COUNTS
+            }),
+            actual=TagItemCounts(**{
+                count: row._mapping[f"actual_{count}"] for count in TAG_COUNTS
+            }),
+        )
+        for row in session.execute(drift_query)
+    ]
+
+    if not repair:
+        session.rollback()
+        return drifts
+
+    if drifts:
+        # A Core update leaves version and updated_at alone: the counters are
+        # not edits of the tag itself.
+        tag_table = Tag.__table__
+        session.execute(
+            update(tag_table)
+            .where(tag_table.c.id == bindparam("tag_id"))
+            .values({
+                **{count: bindparam(f"expected_{count}") for count in TAG_COUNTS},
+                "updated_at": tag_table.c.updated_at,
+            }),
+            [
+                {
+                    "tag_id": drift.tag_id,
+                    **{
+                        f"expected_{count}": value
+                        for count, value in drift.expected.model_dump().items()
+                    },
+                }
+                for drift in drifts
+            ],
+        )
+
+    session.commit()
+
+    return drifts
@@ -0,0 +1,52 @@
+from typing import Optional
+
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+from ..models.exceptions.resource import ResourceVersionConflict
+from ..models.utils import AppResource
+
+
+def format_etag(version: int) -> str:
+    return f'"{version}"'
+
+
+def etag_matches(if_match: str, version: int) -> bool:
+    """Compare If-Match with the strong comparison of RFC 9110.
+
+    A weak entity tag (W/"...") never matches, as it only says the content
+    is equivalent, not that it is the same version.
+    """
+    if if_match.strip() == "*":
+        return True
+
+    entity_tags = (entity_tag.strip() for entity_tag in if_match.split(","))
+
+    return format_etag(version) in entity_tags
+
+
+def check_version_precondition(
+    resource: AppResource,
+    version: int,
+    if_match: Optional[str],
+    expected_version: Optional[int],
+):
+    if if_match is not None and not etag_matches(if_match, version):
+        raise ResourceVersionConflict(resource=resource)
+
+    if expected_version is not None and expected_version != version:
+        raise ResourceVersionConflict(resource=resource)
+
+
+def commit_versioned(resource: AppResource, session: Session):
+    """Commit a versioned write.
+
+    The ORM updates versioned rows with ``WHERE version = :loaded_version``,
+    so a concurrent write between our read and our update leaves no row to
+    update instead of being silently overwritten.
+    """
+    try:
+        session.commit()
+    except StaleDataError as exc:
+        session.rollback()
+        raise ResourceVersionConflict(resource=resource) from exc
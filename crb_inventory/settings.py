@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -11,9 +13,45 @@ class Settings(BaseSettings):
     DB_PASSWORD: str
     DB_DRIVER: str
     APP_URL: str
+    DB_ECHO: bool = True
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_CONNECTION_BUDGET: int = 0
+    WEB_CONCURRENCY: int = 1
+    HEALTH_CHECK_CACHE_TTL: float = 1.0
+    HEALTH_CHECK_TIMEOUT: float = 2.0
+    RESPONSE_CACHE_MAX_ENTRIES: int = 1024
+    RESPONSE_CACHE_TTL: float = 5.0
+    RESPONSE_CACHE_STALE_TTL: float = 0.0
+    AUTOCOMPLETE_NAME_INDEX_MAX_AGE: float = 30.0
+    ARCHIVE_INACTIVE_AFTER_DAYS: int = 90
+    ARCHIVE_BATCH_SIZE: int = 500
+    ARCHIVE_BATCH_PAUSE: float = 0.5
+    ITEM_BULK_CHUNK_SIZE: int = 1000
+    RESERVATION_DEFAULT_TTL: int = 600
+    RESERVATION_SWEEP_BATCH_SIZE: int = 1000
+    RESERVATION_SWEEP_INTERVAL: float = 5.0
+    IDEMPOTENCY_KEY_TTL: int = 86400
+    IDEMPOTENCY_WAIT_TIMEOUT: float = 10.0
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_BACKEND: str = "memory"
+    RATE_LIMIT_MAX_BUCKETS: int = 100000
+    RATE_LIMIT_TRUSTED_PROXIES: str = ""
+    RATE_LIMIT_READ_RATE: float = 50.0
+    RATE_LIMIT_READ_BURST: int = 100
+    RATE_LIMIT_WRITE_RATE: float = 10.0
+    RATE_LIMIT_WRITE_BURST: int = 20
+    RATE_LIMIT_BULK_RATE: float = 1.0
+    RATE_LIMIT_BULK_BURST: int = 5
+
+
+class AppSettings(Settings):
+    @property
+    def DB_URL(self) -> str:
+        return f"{self.DB_DRIVER}://{self.DB_USER}:{self.DB_PASSWORD}@{self.DB_HOST}:{self.DB_PORT}/{self.DB_NAME}"
 
 
-class AppSettings(BaseSettings):
-    settings: Settings = Settings()
-    APP_URL: str = settings.APP_URL
-    DB_URL: str = f"{settings.DB_DRIVER}://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
+@lru_cache
+def get_settings() -> AppSettings:
+    """Parse the settings on first use and share them afterwards."""
+    return AppSettings()
@@ -5,11 +5,11 @@ from sqlalchemy import pool
 
 from alembic import context
 
-from crb_inventory.settings import AppSettings
+from crb_inventory.settings import get_settings
 from crb_inventory.database_schema import mapper_registry
 
 
-settings = AppSettings()
+settings = get_settings()
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
@@ -0,0 +1,166 @@
+"""stock reservations
+
+Revision ID: 02a65370b93e
+Revises: 65e0963fdfa1
+Create Date: 2026-10-19 11:32:33.152222
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '02a65370b93e'
+down_revision: Union[str, None] = '65e0963fdfa1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Reservations update reserved_quantity on every hold, so those updates are
+# not recorded as item changes.
+RECORD_ITEM_CHANGE_FUNCTION = """
+CREATE OR REPLACE FUNCTION record_item_change() RETURNS trigger AS $$
+DECLARE
+    event_id BIGINT;
+    event_type TEXT;
+    event_item_id UUID;
+    event_payload JSONB;
+    event_created_at TIMESTAMPTZ;
+    message TEXT;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        event_type := 'item.created';
+        event_item_id := NEW.id;
+        event_payload := to_jsonb(NEW);
+    ELSIF TG_OP = 'DELETE' THEN
+        event_type := 'item.deleted';
+        event_item_id := OLD.id;
+        event_payload := jsonb_build_object('id', OLD.id);
+    ELSE
+        IF (to_jsonb(NEW) - 'reserved_quantity')
+            = (to_jsonb(OLD) - 'reserved_quantity') THEN
+            RETURN NULL;
+        END IF;
+
+        IF NEW.stock_quantity IS DISTINCT FROM OLD.stock_quantity
+            AND (to_jsonb(NEW) - 'stock_quantity' - 'reserved_quantity'
+                - 'updated_at' - 'version')
+                = (to_jsonb(OLD) - 'stock_quantity' - 'reserved_quantity'
+                - 'updated_at' - 'version') THEN
+            event_type := 'item.stock_changed';
+        ELSE
+            event_type := 'item.updated';
+        END IF;
+        event_item_id := NEW.id;
+        event_payload := to_jsonb(NEW);
+    END IF;
+
+    INSERT INTO item_change_event (item_id, event_type, payload)
+    VALUES (event_item_id, event_type, event_payload)
+    RETURNING id, created_at INTO event_id, event_created_at;
+
+    message := json_build_object(
+        'id', event_id,
+        'event_type', event_type,
+        'item_id', event_item_id,
+        'created_at', event_created_at,
+        'payload', event_payload
+    )::text;
+
+    IF octet_length(message) > 7900 THEN
+        message := json_build_object('id', event_id, 'truncated', true)::text;
+    END IF;
+
+    PERFORM pg_notify('item_changes', message);
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+PREVIOUS_RECORD_ITEM_CHANGE_FUNCTION = """
+CREATE OR REPLACE FUNCTION record_item_change() RETURNS trigger AS $$
+DECLARE
+    event_id BIGINT;
+    event_type TEXT;
+    event_item_id UUID;
+    event_payload JSONB;
+    event_created_at TIMESTAMPTZ;
+    message TEXT;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        event_type := 'item.created';
+        event_item_id := NEW.id;
+        event_payload := to_jsonb(NEW);
+    ELSIF TG_OP = 'DELETE' THEN
+        event_type := 'item.deleted';
+        event_item_id := OLD.id;
+        event_payload := jsonb_build_object('id', OLD.id);
+    ELSE
+        IF NEW.stock_quantity IS DISTINCT FROM OLD.stock_quantity
+            AND (to_jsonb(NEW) - 'stock_quantity' - 'updated_at' - 'version')
+                = (to_jsonb(OLD) - 'stock_quantity' - 'updated_at' - 'version') THEN
+            event_type := 'item.stock_changed';
+        ELSE
+            event_type := 'item.updated';
+        END IF;
+        event_item_id := NEW.id;
+        event_payload := to_jsonb(NEW);
+    END IF;
+
+    INSERT INTO item_change_event (item_id, event_type, payload)
+    VALUES (event_item_id, event_type, event_payload)
+    RETURNING id, created_at INTO event_id, event_created_at;
+
+    message := json_build_object(
+        'id', event_id,
+        'event_type', event_type,
+        'item_id', event_item_id,
+        'created_at', event_created_at,
+        'payload', event_payload
+    )::text;
+
+    IF octet_length(message) > 7900 THEN
+        message := json_build_object('id', event_id, 'truncated', true)::text;
+    END IF;
+
+    PERFORM pg_notify('item_changes', message);
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table('stock_reservation',
+    sa.Column('id', sa.UUID(as_uuid=False), nullable=False),
+    sa.Column('item_id', sa.UUID(as_uuid=False), nullable=False),
+    sa.Column('quantity', sa.INTEGER(), nullable=False),
+    sa.Column('status', sa.TEXT(), nullable=False),
+    sa.Column('expires_at', postgresql.TIMESTAMP(timezone=True), nullable=False),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['item_id'], ['item.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_stock_reservation_held_expires_at', 'stock_reservation', ['expires_at'], unique=False, postgresql_where=sa.text("status = 'held'"))
+    op.create_index(op.f('ix_stock_reservation_item_id'), 'stock_reservation', ['item_id'], unique=False)
+    op.add_column('item', sa.Column('reserved_quantity', sa.INTEGER(), server_default='0', nullable=False))
+    # ### end Alembic commands ###
+
+    op.execute(RECORD_ITEM_CHANGE_FUNCTION)
+
+
+def downgrade() -> None:
+    op.execute(PREVIOUS_RECORD_ITEM_CHANGE_FUNCTION)
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_column('item', 'reserved_quantity')
+    op.drop_index(op.f('ix_stock_reservation_item_id'), table_name='stock_reservation')
+    op.drop_index('ix_stock_reservation_held_expires_at', table_name='stock_reservation', postgresql_where=sa.text("status = 'held'"))
+    op.drop_table('stock_reservation')
+    # ### end Alembic commands ###
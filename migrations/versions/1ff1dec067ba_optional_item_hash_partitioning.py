@@ -0,0 +1,139 @@
+"""optional hash partitioning of item and item_tag_association
+
+Revision ID: 1ff1dec067ba
+Revises: 91e367759a7a
+Create Date: 2026-10-19 11:20:04.771532
+
+Partitioning is opt-in because it rewrites both tables and has to run in a
+maintenance window:
+
+    alembic -x item_partitions=16 upgrade head
+
+Without the argument this revision is a no-op. Both tables are partitioned by
+hash of the item id with the same modulus, so a lookup by id touches a single
+partition and item/tag joins can run partition-wise. A unique index on a
+partitioned table must contain the partition key, so item name uniqueness is
+moved to the item_name_registry table, kept up to date by a trigger.
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '1ff1dec067ba'
+down_revision: Union[str, None] = '91e367759a7a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+ITEM_CHANGE_EVENT_TRIGGER = """
+CREATE TRIGGER item_change_event_trigger
+AFTER INSERT OR UPDATE OR DELETE ON item
+FOR EACH ROW EXECUTE FUNCTION record_item_change();
+"""
+
+MAINTAIN_ITEM_NAME_REGISTRY_FUNCTION = """
+CREATE OR REPLACE FUNCTION maintain_item_name_registry() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP = 'UPDATE' AND NEW.name = OLD.name THEN
+        RETURN NULL;
+    END IF;
+
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        DELETE FROM item_name_registry
+        WHERE name = OLD.name AND item_id = OLD.id;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO item_name_registry (name, item_id) VALUES (NEW.name, NEW.id);
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ITEM_NAME_REGISTRY_TRIGGER = """
+CREATE TRIGGER item_name_registry_trigger
+AFTER INSERT OR DELETE OR UPDATE OF name ON item
+FOR EACH ROW EXECUTE FUNCTION maintain_item_name_registry();
+"""
+
+
+def upgrade() -> None:
+    partitions = int(context.get_x_argument(as_dictionary=True).get('item_partitions', 0))
+
+    if partitions > 0:
+        partition_item_tables(partitions)
+
+
+def downgrade() -> None:
+    if is_item_partitioned():
+        unpartition_item_tables()
+
+
+def is_item_partitioned() -> bool:
+    return op.get_bind().scalar(sa.text(
+        "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table "
+        "WHERE partrelid = 'item'::regclass)"
+    ))
+
+
+def partition_item_tables(partitions: int) -> None:
+    rebuild_item_tables(
+        item_options=' PARTITION BY HASH (id)',
+        association_options=' PARTITION BY HASH (item_id)',
+        partitions=partitions,
+    )
+
+    op.execute('CREATE INDEX ix_item_name ON item (name)')
+    op.execute('CREATE TABLE item_name_registry (name TEXT PRIMARY KEY, item_id UUID NOT NULL)')
+    op.execute('INSERT INTO item_name_registry (name, item_id) SELECT name, id FROM item')
+    op.execute(MAINTAIN_ITEM_NAME_REGISTRY_FUNCTION)
+    op.execute(ITEM_NAME_REGISTRY_TRIGGER)
+
+
+def unpartition_item_tables() -> None:
+    rebuild_item_tables(item_options='', association_options='', partitions=0)
+
+    op.execute('CREATE UNIQUE INDEX ix_item_name ON item (name)')
+    op.execute('DROP TABLE item_name_registry')
+    op.execute('DROP FUNCTION IF EXISTS maintain_item_name_registry()')
+
+
+def rebuild_item_tables(item_options: str, association_options: str, partitions: int) -> None:
+    op.execute('ALTER TABLE item_tag_association RENAME TO item_tag_association_old')
+    op.execute('ALTER TABLE item RENAME TO item_old')
+
+    op.execute(f'CREATE TABLE item (LIKE item_old INCLUDING DEFAULTS){item_options}')
+    op.execute(
+        'CREATE TABLE item_tag_association '
+        f'(LIKE item_tag_association_old INCLUDING DEFAULTS){association_options}'
+    )
+
+    for remainder in range(partitions):
+        bounds = f'FOR VALUES WITH (MODULUS {partitions}, REMAINDER {remainder})'
+        op.execute(f'CREATE TABLE item_p{remainder} PARTITION OF item {bounds}')
+        op.execute(
+            f'CREATE TABLE item_tag_association_p{remainder} '
+            f'PARTITION OF item_tag_association {bounds}'
+        )
+
+    op.execute('INSERT INTO item SELECT * FROM item_old')
+    op.execute('INSERT INTO item_tag_association SELECT * FROM item_tag_association_old')
+
+    op.execute('DROP TABLE item_tag_association_old')
+    op.execute('DROP TABLE item_old')
+
+    op.create_primary_key('item_pkey', 'item', ['id'])
+    op.create_foreign_key('item_category_id_fkey', 'item', 'category', ['category_id'], ['id'])
+    op.create_index('ix_item_updated_at_id', 'item', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_item_inactive_updated_at', 'item', ['updated_at'], unique=False, postgresql_where=sa.text('NOT is_active'))
+
+    op.create_primary_key('item_tag_association_pkey', 'item_tag_association', ['item_id', 'tag_id'])
+    op.create_foreign_key('item_tag_association_item_id_fkey', 'item_tag_association', 'item', ['item_id'], ['id'])
+    op.create_foreign_key('item_tag_association_tag_id_fkey', 'item_tag_association', 'tag', ['tag_id'], ['id'])
+
+    op.execute(ITEM_CHANGE_EVENT_TRIGGER)
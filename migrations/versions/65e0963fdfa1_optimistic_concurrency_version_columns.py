@@ -0,0 +1,148 @@
+"""optimistic concurrency version columns
+
+Revision ID: 65e0963fdfa1
+Revises: d7f91de4f9f4
+Create Date: 2026-10-19 11:29:25.114335
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '65e0963fdfa1'
+down_revision: Union[str, None] = 'd7f91de4f9f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Every update now bumps version, so it has to be ignored when telling a stock
+# change apart from other updates.
+RECORD_ITEM_CHANGE_FUNCTION = """
+CREATE OR REPLACE FUNCTION record_item_change() RETURNS trigger AS $$
+DECLARE
+    event_id BIGINT;
+    event_type TEXT;
+    event_item_id UUID;
+    event_payload JSONB;
+    event_created_at TIMESTAMPTZ;
+    message TEXT;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        event_type := 'item.created';
+        event_item_id := NEW.id;
+        event_payload := to_jsonb(NEW);
+    ELSIF TG_OP = 'DELETE' THEN
+        event_type := 'item.deleted';
+        event_item_id := OLD.id;
+        event_payload := jsonb_build_object('id', OLD.id);
+    ELSE
+        IF NEW.stock_quantity IS DISTINCT FROM OLD.stock_quantity
+            AND (to_jsonb(NEW) - 'stock_quantity' - 'updated_at' - 'version')
+                = (to_jsonb(OLD) - 'stock_quantity' - 'updated_at' - 'version') THEN
+            event_type := 'item.stock_changed';
+        ELSE
+            event_type := 'item.updated';
+        END IF;
+        event_item_id := NEW.id;
+        event_payload := to_jsonb(NEW);
+    END IF;
+
+    INSERT INTO item_change_event (item_id, event_type, payload)
+    VALUES (event_item_id, event_type, event_payload)
+    RETURNING id, created_at INTO event_id, event_created_at;
+
+    message := json_build_object(
+        'id', event_id,
+        'event_type', event_type,
+        'item_id', event_item_id,
+        'created_at', event_created_at,
+        'payload', event_payload
+    )::text;
+
+    IF octet_length(message) > 7900 THEN
+        message := json_build_object('id', event_id, 'truncated', true)::text;
+    END IF;
+
+    PERFORM pg_notify('item_changes', message);
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+PREVIOUS_RECORD_ITEM_CHANGE_FUNCTION = """
+CREATE OR REPLACE FUNCTION record_item_change() RETURNS trigger AS $$
+DECLARE
+    event_id BIGINT;
+    event_type TEXT;
+    event_item_id UUID;
+    event_payload JSONB;
+    event_created_at TIMESTAMPTZ;
+    message TEXT;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        event_type := 'item.created';
+        event_item_id := NEW.id;
+        event_payload := to_jsonb(NEW);
+    ELSIF TG_OP = 'DELETE' THEN
+        event_type := 'item.deleted';
+        event_item_id := OLD.id;
+        event_payload := jsonb_build_object('id', OLD.id);
+    ELSE
+        IF NEW.stock_quantity IS DISTINCT FROM OLD.stock_quantity
+            AND (to_jsonb(NEW) - 'stock_quantity' - 'updated_at')
+                = (to_jsonb(OLD) - 'stock_quantity' - 'updated_at') THEN
+            event_type := 'item.stock_changed';
+        ELSE
+            event_type := 'item.updated';
+        END IF;
+        event_item_id := NEW.id;
+        event_payload := to_jsonb(NEW);
+    END IF;
+
+    INSERT INTO item_change_event (item_id, event_type, payload)
+    VALUES (event_item_id, event_type, event_payload)
+    RETURNING id, created_at INTO event_id, event_created_at;
+
+    message := json_build_object(
+        'id', event_id,
+        'event_type', event_type,
+        'item_id', event_item_id,
+        'created_at', event_created_at,
+        'payload', event_payload
+    )::text;
+
+    IF octet_length(message) > 7900 THEN
+        message := json_build_object('id', event_id, 'truncated', true)::text;
+    END IF;
+
+    PERFORM pg_notify('item_changes', message);
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+
+def upgrade() -> None:
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.add_column('category', sa.Column('version', sa.INTEGER(), server_default='1', nullable=False))
+    op.add_column('item', sa.Column('version', sa.INTEGER(), server_default='1', nullable=False))
+    op.add_column('item_archive', sa.Column('version', sa.INTEGER(), server_default='1', nullable=False))
+    op.add_column('tag', sa.Column('version', sa.INTEGER(), server_default='1', nullable=False))
+    # ### end Alembic commands ###
+
+    op.execute(RECORD_ITEM_CHANGE_FUNCTION)
+
+
+def downgrade() -> None:
+    op.execute(PREVIOUS_RECORD_ITEM_CHANGE_FUNCTION)
+
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_column('tag', 'version')
+    op.drop_column('item_archive', 'version')
+    op.drop_column('item', 'version')
+    op.drop_column('category', 'version')
+    # ### end Alembic commands ###
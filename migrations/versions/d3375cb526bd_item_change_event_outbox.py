@@ -0,0 +1,100 @@
+"""item change event outbox and notify trigger
+
+Revision ID: d3375cb526bd
+Revises: be4ac5f34778
+Create Date: 2026-10-19 09:12:41.503218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd3375cb526bd'
+down_revision: Union[str, None] = 'be4ac5f34778'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+RECORD_ITEM_CHANGE_FUNCTION = """
+CREATE OR REPLACE FUNCTION record_item_change() RETURNS trigger AS $$
+DECLARE
+    event_id BIGINT;
+    event_type TEXT;
+    event_item_id UUID;
+    event_payload JSONB;
+    event_created_at TIMESTAMPTZ;
+    message TEXT;
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        event_type := 'item.created';
+        event_item_id := NEW.id;
+        event_payload := to_jsonb(NEW);
+    ELSIF TG_OP = 'DELETE' THEN
+        event_type := 'item.deleted';
+        event_item_id := OLD.id;
+        event_payload := jsonb_build_object('id', OLD.id);
+    ELSE
+        IF NEW.stock_quantity IS DISTINCT FROM OLD.stock_quantity
+            AND (to_jsonb(NEW) - 'stock_quantity' - 'updated_at')
+                = (to_jsonb(OLD) - 'stock_quantity' - 'updated_at') THEN
+            event_type := 'item.stock_changed';
+        ELSE
+            event_type := 'item.updated';
+        END IF;
+        event_item_id := NEW.id;
+        event_payload := to_jsonb(NEW);
+    END IF;
+
+    INSERT INTO item_change_event (item_id, event_type, payload)
+    VALUES (event_item_id, event_type, event_payload)
+    RETURNING id, created_at INTO event_id, event_created_at;
+
+    message := json_build_object(
+        'id', event_id,
+        'event_type', event_type,
+        'item_id', event_item_id,
+        'created_at', event_created_at,
+        'payload', event_payload
+    )::text;
+
+    IF octet_length(message) > 7900 THEN
+        message := json_build_object('id', event_id, 'truncated', true)::text;
+    END IF;
+
+    PERFORM pg_notify('item_changes', message);
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+ITEM_CHANGE_EVENT_TRIGGER = """
+CREATE TRIGGER item_change_event_trigger
+AFTER INSERT OR UPDATE OR DELETE ON item
+FOR EACH ROW EXECUTE FUNCTION record_item_change();
+"""
+
+
+def upgrade() -> None:
+    op.create_table('item_change_event',
+    sa.Column('id', sa.BIGINT(), sa.Identity(always=True), nullable=False),
+    sa.Column('item_id', sa.UUID(as_uuid=False), nullable=False),
+    sa.Column('event_type', sa.TEXT(), nullable=False),
+    sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('created_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_item_change_event_created_at'), 'item_change_event', ['created_at'], unique=False)
+
+    op.execute(RECORD_ITEM_CHANGE_FUNCTION)
+    op.execute(ITEM_CHANGE_EVENT_TRIGGER)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS item_change_event_trigger ON item')
+    op.execute('DROP FUNCTION IF EXISTS record_item_change()')
+    op.drop_index(op.f('ix_item_change_event_created_at'), table_name='item_change_event')
+    op.drop_table('item_change_event')
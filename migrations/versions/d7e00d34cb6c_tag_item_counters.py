@@ -0,0 +1,147 @@
+"""tag item counters
+
+Revision ID: d7e00d34cb6c
+Revises: e2a59a86479a
+Create Date: 2026-10-19 12:14:24.803447
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7e00d34cb6c'
+down_revision: Union[str, None] = 'e2a59a86479a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+APPLY_TAG_ITEM_COUNT_DELTA_FUNCTION = """
+CREATE OR REPLACE FUNCTION apply_tag_item_count_delta() RETURNS trigger AS $$
+DECLARE
+    changed_tags TEXT;
+BEGIN
+    changed_tags := CASE
+        WHEN TG_TABLE_NAME = 'item' AND TG_OP = 'UPDATE' THEN '
+            SELECT
+                association.tag_id,
+                0 AS items,
+                CASE WHEN new_items.is_active THEN 1 ELSE -1 END AS active_items
+            FROM new_items
+            JOIN old_items ON old_items.id = new_items.id
+            JOIN item_tag_association AS association
+                ON association.item_id = new_items.id
+            WHERE new_items.is_active <> old_items.is_active'
+        WHEN TG_TABLE_NAME = 'item' THEN '
+            DELETE FROM item_tag_association AS association
+            USING old_items
+            WHERE association.item_id = old_items.id
+            RETURNING
+                association.tag_id,
+                -1 AS items,
+                CASE WHEN old_items.is_active THEN -1 ELSE 0 END AS active_items'
+        WHEN TG_OP = 'INSERT' THEN '
+            SELECT
+                new_rows.tag_id,
+                1 AS items,
+                CASE WHEN item.is_active THEN 1 ELSE 0 END AS active_items
+            FROM new_rows
+            JOIN item ON item.id = new_rows.item_id'
+        ELSE '
+            SELECT
+                old_rows.tag_id,
+                -1 AS items,
+                CASE WHEN item.is_active THEN -1 ELSE 0 END AS active_items
+            FROM old_rows
+            JOIN item ON item.id = old_rows.item_id'
+    END;
+
+    EXECUTE '
+        WITH changed AS (' || changed_tags || '),
+        delta AS (
+            SELECT tag_id, sum(items) AS items, sum(active_items) AS active_items
+            FROM changed
+            GROUP BY tag_id
+            HAVING sum(items) <> 0 OR sum(active_items) <> 0
+        ),
+        locked AS (
+            SELECT tag.id
+            FROM tag
+            JOIN delta ON delta.tag_id = tag.id
+            ORDER BY tag.id
+            FOR NO KEY UPDATE OF tag
+        )
+        UPDATE tag SET
+            item_count = tag.item_count + delta.items,
+            active_item_count = tag.active_item_count + delta.active_items
+        FROM delta
+        WHERE tag.id = delta.tag_id AND tag.id IN (SELECT id FROM locked)';
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+TAG_ITEM_COUNT_TRIGGERS = """
+CREATE TRIGGER tag_item_count_insert_trigger
+AFTER INSERT ON item_tag_association REFERENCING NEW TABLE AS new_rows
+FOR EACH STATEMENT EXECUTE FUNCTION apply_tag_item_count_delta();
+
+CREATE TRIGGER tag_item_count_delete_trigger
+AFTER DELETE ON item_tag_association REFERENCING OLD TABLE AS old_rows
+FOR EACH STATEMENT EXECUTE FUNCTION apply_tag_item_count_delta();
+
+CREATE TRIGGER tag_item_count_item_update_trigger
+AFTER UPDATE ON item REFERENCING OLD TABLE AS old_items NEW TABLE AS new_items
+FOR EACH STATEMENT EXECUTE FUNCTION apply_tag_item_count_delta();
+
+CREATE TRIGGER tag_item_count_item_delete_trigger
+AFTER DELETE ON item REFERENCING OLD TABLE AS old_items
+FOR EACH STATEMENT EXECUTE FUNCTION apply_tag_item_count_delta();
+"""
+
+BACKFILL_TAG_ITEM_COUNTS = """
+UPDATE tag
+SET item_count = counts.item_count, active_item_count = counts.active_item_count
+FROM (
+    SELECT
+        item_tag_association.tag_id,
+        count(*) AS item_count,
+        count(*) FILTER (WHERE item.is_active) AS active_item_count
+    FROM item_tag_association
+    JOIN item ON item.id = item_tag_association.item_id
+    GROUP BY item_tag_association.tag_id
+) AS counts
+WHERE tag.id = counts.tag_id;
+"""
+
+
+def upgrade() -> None:
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_constraint(op.f('item_tag_association_item_id_fkey'), 'item_tag_association', type_='foreignkey')
+    op.create_foreign_key(op.f('item_tag_association_item_id_fkey'), 'item_tag_association', 'item', ['item_id'], ['id'], initially='DEFERRED', deferrable=True)
+    op.add_column('tag', sa.Column('item_count', sa.INTEGER(), server_default='0', nullable=False))
+    op.add_column('tag', sa.Column('active_item_count', sa.INTEGER(), server_default='0', nullable=False))
+    op.create_index('ix_tag_active_item_count_id', 'tag', ['active_item_count', 'id'], unique=False)
+    # ### end Alembic commands ###
+
+    op.execute(APPLY_TAG_ITEM_COUNT_DELTA_FUNCTION)
+    op.execute(TAG_ITEM_COUNT_TRIGGERS)
+    op.execute(BACKFILL_TAG_ITEM_COUNTS)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS tag_item_count_insert_trigger ON item_tag_association')
+    op.execute('DROP TRIGGER IF EXISTS tag_item_count_delete_trigger ON item_tag_association')
+    op.execute('DROP TRIGGER IF EXISTS tag_item_count_item_update_trigger ON item')
+    op.execute('DROP TRIGGER IF EXISTS tag_item_count_item_delete_trigger ON item')
+    op.execute('DROP FUNCTION IF EXISTS apply_tag_item_count_delta()')
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_index('ix_tag_active_item_count_id', table_name='tag')
+    op.drop_column('tag', 'active_item_count')
+    op.drop_column('tag', 'item_count')
+    op.drop_constraint(op.f('item_tag_association_item_id_fkey'), 'item_tag_association', type_='foreignkey')
+    op.create_foreign_key(op.f('item_tag_association_item_id_fkey'), 'item_tag_association', 'item', ['item_id'], ['id'], ondelete='CASCADE')
+    # ### end Alembic commands ###
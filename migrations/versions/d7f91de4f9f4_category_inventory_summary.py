@@ -0,0 +1,118 @@
+"""category inventory summary
+
+Revision ID: d7f91de4f9f4
+Revises: 1ff1dec067ba
+Create Date: 2026-10-19 11:26:40.709461
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'd7f91de4f9f4'
+down_revision: Union[str, None] = '1ff1dec067ba'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+APPLY_CATEGORY_INVENTORY_DELTA_FUNCTION = """
+CREATE OR REPLACE FUNCTION apply_category_inventory_delta() RETURNS trigger AS $$
+DECLARE
+    changed_items TEXT;
+BEGIN
+    changed_items := CASE TG_OP
+        WHEN 'INSERT' THEN 'SELECT *, 1 AS sign FROM new_items'
+        WHEN 'DELETE' THEN 'SELECT *, -1 AS sign FROM old_items'
+        ELSE 'SELECT *, 1 AS sign FROM new_items '
+            || 'UNION ALL SELECT *, -1 AS sign FROM old_items'
+    END;
+
+    EXECUTE '
+        INSERT INTO category_inventory_summary AS summary (
+            category_id, active_item_count, total_stock, low_stock_item_count
+        )
+        SELECT category_id, items, stock, low_stock
+        FROM (
+            SELECT
+                category_id,
+                sum(sign) AS items,
+                sum(sign * stock_quantity) AS stock,
+                coalesce(
+                    sum(sign) FILTER (WHERE stock_quantity < minimum_threshold), 0
+                ) AS low_stock
+            FROM (' || changed_items || ') AS changed
+            WHERE is_active
+            GROUP BY category_id
+        ) AS delta
+        WHERE items <> 0 OR stock <> 0 OR low_stock <> 0
+        ORDER BY category_id
+        ON CONFLICT (category_id) DO UPDATE SET
+            active_item_count = summary.active_item_count + EXCLUDED.active_item_count,
+            total_stock = summary.total_stock + EXCLUDED.total_stock,
+            low_stock_item_count =
+                summary.low_stock_item_count + EXCLUDED.low_stock_item_count,
+            updated_at = now()';
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+
+CATEGORY_INVENTORY_TRIGGERS = """
+CREATE TRIGGER category_inventory_insert_trigger
+AFTER INSERT ON item REFERENCING NEW TABLE AS new_items
+FOR EACH STATEMENT EXECUTE FUNCTION apply_category_inventory_delta();
+
+CREATE TRIGGER category_inventory_update_trigger
+AFTER UPDATE ON item REFERENCING OLD TABLE AS old_items NEW TABLE AS new_items
+FOR EACH STATEMENT EXECUTE FUNCTION apply_category_inventory_delta();
+
+CREATE TRIGGER category_inventory_delete_trigger
+AFTER DELETE ON item REFERENCING OLD TABLE AS old_items
+FOR EACH STATEMENT EXECUTE FUNCTION apply_category_inventory_delta();
+"""
+
+BACKFILL_CATEGORY_INVENTORY_SUMMARY = """
+INSERT INTO category_inventory_summary (
+    category_id, active_item_count, total_stock, low_stock_item_count
+)
+SELECT
+    category_id,
+    count(*),
+    sum(stock_quantity),
+    count(*) FILTER (WHERE stock_quantity < minimum_threshold)
+FROM item
+WHERE is_active
+GROUP BY category_id;
+"""
+
+
+def upgrade() -> None:
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.create_table('category_inventory_summary',
+    sa.Column('category_id', sa.UUID(as_uuid=False), nullable=False),
+    sa.Column('active_item_count', sa.INTEGER(), server_default='0', nullable=False),
+    sa.Column('total_stock', sa.BIGINT(), server_default='0', nullable=False),
+    sa.Column('low_stock_item_count', sa.INTEGER(), server_default='0', nullable=False),
+    sa.Column('updated_at', postgresql.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['category_id'], ['category.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('category_id')
+    )
+    # ### end Alembic commands ###
+
+    op.execute(APPLY_CATEGORY_INVENTORY_DELTA_FUNCTION)
+    op.execute(CATEGORY_INVENTORY_TRIGGERS)
+    op.execute(BACKFILL_CATEGORY_INVENTORY_SUMMARY)
+
+
+def downgrade() -> None:
+    op.execute('DROP TRIGGER IF EXISTS category_inventory_insert_trigger ON item')
+    op.execute('DROP TRIGGER IF EXISTS category_inventory_update_trigger ON item')
+    op.execute('DROP TRIGGER IF EXISTS category_inventory_delete_trigger ON item')
+    op.execute('DROP FUNCTION IF EXISTS apply_category_inventory_delta()')
+    # ### commands auto generated by Alembic - please adjust! ###
+    op.drop_table('category_inventory_summary')
+    # ### end Alembic commands ###
@@ -1,16 +1,25 @@
+import os
+
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 from testcontainers.postgres import PostgresContainer
 
+from crb_inventory.core.cache import response_cache
 from crb_inventory.core.database import get_session
+from crb_inventory.core.rate_limit import rate_limiter
 from crb_inventory.database_schema import mapper_registry
 from crb_inventory.main import app, v1
 
 
 @pytest.fixture(scope="session")
 def engine():
+    # TEST_DB_URL points the suite at a running Postgres instead of a container.
+    if url := os.environ.get("TEST_DB_URL"):
+        yield create_engine(url)
+        return
+
     with PostgresContainer("postgres:15", driver="psycopg2") as postgres:
         _engine = create_engine(postgres.get_connection_url())
 
@@ -23,6 +32,9 @@ def client(session):
     def get_session_override():
         return session
 
+    response_cache.clear()
+    rate_limiter.reset()
+
     with TestClient(app) as client:
         app.dependency_overrides[get_session] = get_session_override
         v1.dependency_overrides[get_session] = get_session_override
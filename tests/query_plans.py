@@ -0,0 +1,202 @@
+import difflib
+import json
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator
+
+from sqlalchemy import Connection, event, text
+from sqlalchemy.orm import Session
+
+from crb_inventory.services.category_summary import (
+    reconcile_category_inventory_summary,
+)
+from crb_inventory.services.tag_counts import reconcile_tag_item_counts
+
+PLAN_BASELINE_PATH = Path(__file__).parent / "database" / "query_plans.json"
+SEED_STARTED_AT = "2026-01-01 00:00:00+00"
+
+
+def seed_inventory(session: Session, items: int, categories: int, tags: int):
+    """Fill the item tables with a deterministic inventory.
+
+    Item ids are UUIDv7 keys created 30 seconds apart, one in ten items is
+    inactive, and each item has one to four tags drawn with a skew towards
+    the first ones, so tag sizes range from a few items to a few percent of
+    the table. Triggers are off while seeding and the counters they keep are
+    repaired afterwards.
+    """
+    for table in ("item", "item_tag_association"):
+        session.execute(text(f"ALTER TABLE {table} DISABLE TRIGGER USER"))
+
+    session.execute(
+        text(
+            "INSERT INTO category (id, name, description) "
+            "SELECT gen_random_uuid(), 'Category ' || g, 'Seeded category' "
+            "FROM generate_series(1, :categories) AS g"
+        ),
+        {"categories": categories},
+    )
+    session.execute(
+        text(
+            "INSERT INTO tag (id, name, description) "
+            "SELECT gen_random_uuid(), 'tag-' || g, 'Seeded tag' "
+            "FROM generate_series(1, :tags) AS g"
+        ),
+        {"tags": tags},
+    )
+    session.execute(
+        text(
+            "INSERT INTO item (id, name, description, category_id, "
+            "minimum_threshold, stock_quantity, is_active, created_at, updated_at) "
+            "SELECT (lpad(to_hex(floor(extract(epoch FROM created_at) * 1000)"
+            "::bigint), 12, '0') || '7' || substr(hash, 1, 3) || '8' "
+            "|| substr(hash, 4, 15))::uuid, "
+            "upper(hash) || ' item', 'Seeded item', "
+            "categories.ids[1 + g % :categories], g % 13, g % 97, g % 10 <> 0, "
+            "created_at, created_at + (g % 7) * interval '1 day' "
+            "FROM generate_series(1, :items) AS g, "
+            "LATERAL (SELECT md5(g::text) AS hash, CAST(:started_at AS timestamptz) "
+            "+ g * interval '30 seconds' AS created_at) AS seed, "
+            "(SELECT array_agg(id ORDER BY name) AS ids FROM category) AS categories"
+        ),
+        {"items": items, "categories": categories, "started_at": SEED_STARTED_AT},
+    )
+    session.execute(
+        text(
+            "INSERT INTO item_tag_association (item_id, tag_id) "
+            "SELECT DISTINCT item.id, tags.ids[1 + floor(:tags * power("
+            "(abs(hashtext(item.name || slot)) % 10000) / 10000.0, 2))::int] "
+            "FROM item, generate_series(1, 1 + abs(hashtext(item.name)) % 4) "
+            "AS slot, (SELECT array_agg(id ORDER BY name) AS ids FROM tag) AS tags"
+        ),
+        {"tags": tags},
+    )
+    session.commit()
+
+    for table in ("item", "item_tag_association"):
+        session.execute(text(f"ALTER TABLE {table} ENABLE TRIGGER USER"))
+
+    reconcile_tag_item_counts(repair=True, session=session)
+    reconcile_category_inventory_summary(repair=True, session=session)
+    session.commit()
+
+
+@contextmanager
+def capture_statements(connection: Connection) -> Iterator[list[tuple[str, Any]]]:
+    """Collect the SELECT statements run on the connection, with parameters."""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, *_):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append((statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+
+
+def explain_statement(connection: Connection, statement: str, parameters) -> dict:
+    plan = connection.exec_driver_sql(
+        "EXPLAIN (FORMAT JSON) " + statement, parameters
+    ).scalar()
+
+    return plan[0]["Plan"]
+
+
+def plan_nodes(plan: dict, depth: int = 0) -> Iterator[tuple[int, dict]]:
+    yield depth, plan
+
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child, depth + 1)
+
+
+def describe_node(node: dict) -> str:
+    description = node["Node Type"]
+
+    if node.get("Scan Direction") == "Backward":
+        description += " Backward"
+    if "Index Name" in node:
+        description += f" using {node['Index Name']}"
+    if "Relation Name" in node:
+        description += f" on {node['Relation Name']}"
+    if "CTE Name" in node:
+        description += f" on {node['CTE Name']}"
+    if "Subplan Name" in node:
+        description += f" ({node['Subplan Name']})"
+
+    return description
+
+
+def render_plan(plan: dict) -> list[str]:
+    """Render a plan as one line per node, without costs or row counts."""
+    return ["  " * depth + describe_node(node) for depth, node in plan_nodes(plan)]
+
+
+@dataclass(frozen=True)
+class PlanCheck:
+    """Properties every plan of a query shape should keep.
+
+    Sequential scans of the guarded tables fail the check, except in the
+    COUNT of a list that counts most of the table anyway when
+    full_count_allowed is set. Every expected index has to appear in one of
+    the plans.
+    """
+
+    indexes: tuple[str, ...] = ()
+    full_count_allowed: bool = False
+    guarded_tables: tuple[str, ...] = ("item", "item_tag_association")
+
+    def violations(self, statements: list[str], plans: list[dict]) -> list[str]:
+        found = []
+        used_indexes = set()
+
+        for statement, plan in zip(statements, plans):
+            is_count = statement.lstrip().upper().startswith("SELECT COUNT(")
+
+            for _, node in plan_nodes(plan):
+                used_indexes.add(node.get("Index Name"))
+
+                if (
+                    node["Node Type"] == "Seq Scan"
+                    and node.get("Relation Name") in self.guarded_tables
+                    and not (is_count and self.full_count_allowed)
+                ):
+                    found.append(f"sequential scan on {node['Relation Name']}")
+
+        found += [
+            f"index {index} is not used"
+            for index in self.indexes
+            if index not in used_indexes
+        ]
+
+        return found
+
+
+def read_plan_baseline() -> dict[str, list[str]]:
+    if not PLAN_BASELINE_PATH.exists():
+        return {}
+
+    return json.loads(PLAN_BASELINE_PATH.read_text())
+
+
+def write_plan_baseline(name: str, lines: list[str]):
+    baseline = read_plan_baseline()
+    baseline[name] = lines
+    PLAN_BASELINE_PATH.write_text(
+        json.dumps(dict(sorted(baseline.items())), indent=2) + "\n"
+    )
+
+
+def plan_diff(name: str, expected: list[str], actual: list[str]) -> str:
+    return "\n".join(
+        difflib.unified_diff(
+            expected,
+            actual,
+            fromfile=f"{name} (baseline)",
+            tofile=f"{name} (current)",
+            lineterm="",
+        )
+    )
@@ -0,0 +1,92 @@
+from http import HTTPStatus
+
+from crb_inventory.core.cache import response_cache
+from crb_inventory.core.name_index import NameIndex
+from crb_inventory.models.utils import AppResource, NameSuggestion
+from tests.factories import CategoryFactory, ItemFactory, TagFactory
+
+EXPECTED_LOADS = 2
+
+
+def names_of(response):
+    return [suggestion["name"] for suggestion in response.json()["result"]]
+
+
+def test_name_index_should_reload_only_after_a_write():
+    index = NameIndex(AppResource.TAG, max_age=60)
+    loads = []
+
+    def load():
+        loads.append(1)
+        return [
+            NameSuggestion(id=str(number), name=name)
+            for number, name in enumerate(["beta", "Alpha", "alphabet", "gamma"])
+        ]
+
+    first = index.search(prefix="ALPHA", limit=10, load=load)
+    second = index.search(prefix="b", limit=10, load=load)
+    response_cache.bump_version(AppResource.TAG)
+    third = index.search(prefix="alphab", limit=10, load=load)
+
+    assert [suggestion.name for suggestion in first] == ["Alpha", "alphabet"]
+    assert [suggestion.name for suggestion in second] == ["beta"]
+    assert [suggestion.name for suggestion in third] == ["alphabet"]
+    assert len(loads) == EXPECTED_LOADS
+
+
+def test_autocomplete_items_should_match_active_names_by_prefix(session, client):
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+    for name in ["Parafuso 10mm", "parafuso 5mm", "Porca", "Parafuso_x"]:
+        session.add(ItemFactory(name=name, category_id=category.id))
+    inactive_item = ItemFactory(name="Parafuso antigo", category_id=category.id)
+    session.add(inactive_item)
+    session.commit()
+    client.patch(f"/v1/item/{inactive_item.id}", json={"is_active": False})
+
+    response = client.get("/v1/item/autocomplete", params={"prefix": "PARAFUSO"})
+    escaped = client.get("/v1/item/autocomplete", params={"prefix": "parafuso_"})
+    limited = client.get("/v1/item/autocomplete", params={"prefix": "para", "limit": 1})
+
+    assert response.status_code == HTTPStatus.OK
+    assert names_of(response) == ["Parafuso 10mm", "parafuso 5mm", "Parafuso_x"]
+    assert names_of(escaped) == ["Parafuso_x"]
+    assert names_of(limited) == ["Parafuso 10mm"]
+
+
+def test_autocomplete_tags_should_follow_writes(session, client):
+    tag = TagFactory(name="eletrica")
+    session.add(tag)
+    session.commit()
+
+    before = client.get("/v1/tag/autocomplete", params={"prefix": "el"})
+    client.post("/v1/tag/", json={"name": "eletronica"})
+    client.patch(f"/v1/tag/{tag.id}", json={"is_active": False})
+    after = client.get("/v1/tag/autocomplete", params={"prefix": "el"})
+
+    assert before.status_code == HTTPStatus.OK
+    assert names_of(before) == ["eletrica"]
+    assert names_of(after) == ["eletronica"]
+
+
+def test_autocomplete_categories_should_return_ids_and_names(session, client):
+    category, other_category = (
+        CategoryFactory(name="Ferramentas"),
+        CategoryFactory(name="Fixadores"),
+    )
+    session.add_all([category, other_category])
+    session.commit()
+
+    response = client.get("/v1/category/autocomplete", params={"prefix": "fe"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"result": [{"id": category.id, "name": "Ferramentas"}]}
+
+
+def test_autocomplete_should_require_a_prefix(client):
+    missing = client.get("/v1/tag/autocomplete")
+    empty = client.get("/v1/item/autocomplete", params={"prefix": ""})
+
+    assert missing.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert empty.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
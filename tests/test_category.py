@@ -233,3 +233,40 @@ def test_check_category_exists(session):
 
     with pytest.raises(ResourceNotFound):
         check_category_exists(random_id, session)
+
+
+def test_read_categories_batch_should_return_found_categories_and_missing_ids(
+    session, client
+):
+    route = "/v1/category/batch-get"
+    missing_id = "56f0572c-1dec-4b4d-b517-4cac967146a7"
+
+    categories = CategoryFactory.create_batch(2)
+    session.bulk_save_objects(categories)
+    session.commit()
+
+    response = client.post(
+        route, json={"ids": [category.id for category in categories] + [missing_id]}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.json()["result"]) == len(categories)
+    assert response.json()["missing"] == [missing_id]
+
+
+def test_update_category_with_stale_version_should_return_412(session, client):
+    route = "/v1/category/"
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    category_data = {"name": "Category updated", "is_active": True, "version": 1}
+
+    response = client.put(f"{route}{category.id}", json=category_data)
+    assert response.status_code == HTTPStatus.OK
+    assert response.headers["ETag"] == '"2"'
+
+    response = client.put(f"{route}{category.id}", json=category_data)
+
+    assert response.status_code == HTTPStatus.PRECONDITION_FAILED
+    assert response.json()["error_code"] == "002"
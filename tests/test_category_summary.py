@@ -0,0 +1,226 @@
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+
+from sqlalchemy import select, update
+
+from crb_inventory.database_schema import CategoryInventorySummary, Item
+from crb_inventory.services.category_summary import (
+    reconcile_category_inventory_summary,
+)
+from crb_inventory.services.item_archive import archive_inactive_items
+from tests.factories import CategoryFactory, ItemFactory
+
+
+def read_summary(session, category_id):
+    session.expire_all()
+
+    return session.scalar(
+        select(CategoryInventorySummary).where(
+            CategoryInventorySummary.category_id == category_id
+        )
+    )
+
+
+def test_summary_should_follow_item_writes(session, client):
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    low_stock_item = ItemFactory(
+        category_id=category.id, minimum_threshold=10, stock_quantity=5
+    )
+    stocked_item = ItemFactory(
+        category_id=category.id, minimum_threshold=10, stock_quantity=40
+    )
+    session.add_all([low_stock_item, stocked_item])
+    session.commit()
+
+    expected_active_items = 2
+    expected_total_stock = 45
+    summary = read_summary(session, category.id)
+    assert summary.active_item_count == expected_active_items
+    assert summary.total_stock == expected_total_stock
+    assert summary.low_stock_item_count == 1
+
+    response = client.patch(
+        f"/v1/item/{low_stock_item.id}", json={"stock_quantity": 20}
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    expected_total_stock = 60
+    summary = read_summary(session, category.id)
+    assert summary.total_stock == expected_total_stock
+    assert summary.low_stock_item_count == 0
+
+    response = client.patch(f"/v1/item/{stocked_item.id}", json={"is_active": False})
+    assert response.status_code == HTTPStatus.OK
+
+    expected_total_stock = 20
+    summary = read_summary(session, category.id)
+    assert summary.active_item_count == 1
+    assert summary.total_stock == expected_total_stock
+
+    response = client.delete(f"/v1/item/{low_stock_item.id}")
+    assert response.status_code == HTTPStatus.OK
+
+    summary = read_summary(session, category.id)
+    assert summary.active_item_count == 0
+    assert summary.total_stock == 0
+
+
+def test_summary_should_move_item_between_categories(session, client):
+    source, target = CategoryFactory(), CategoryFactory()
+    session.add_all([source, target])
+    session.commit()
+
+    stock_quantity = 30
+    item = ItemFactory(category_id=source.id, stock_quantity=stock_quantity)
+    session.add(item)
+    session.commit()
+
+    response = client.patch(f"/v1/item/{item.id}", json={"category_id": target.id})
+    assert response.status_code == HTTPStatus.OK
+
+    assert read_summary(session, source.id).active_item_count == 0
+    assert read_summary(session, target.id).active_item_count == 1
+    assert read_summary(session, target.id).total_stock == stock_quantity
+
+
+def test_summary_should_follow_bulk_archive(session):
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    items = ItemFactory.create_batch(3, category_id=category.id, stock_quantity=25)
+    session.add_all(items)
+    session.commit()
+
+    session.execute(
+        update(Item).where(Item.category_id == category.id).values(is_active=False)
+    )
+    session.commit()
+    archive_inactive_items(
+        inactive_before=datetime.now(timezone.utc) + timedelta(days=1),
+        batch_size=100,
+        session=session,
+    )
+
+    summary = read_summary(session, category.id)
+    assert summary.active_item_count == 0
+    assert summary.total_stock == 0
+
+
+def test_read_category_summary_should_include_categories_without_items(session, client):
+    empty_category, stocked_category = CategoryFactory(), CategoryFactory()
+    session.add_all([empty_category, stocked_category])
+    session.commit()
+
+    stock_quantity = 50
+    expected_categories = 2
+    session.add(
+        ItemFactory(category_id=stocked_category.id, stock_quantity=stock_quantity)
+    )
+    session.commit()
+
+    response = client.get("/v1/category/summary")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["total"] == expected_categories
+    summaries = {
+        summary["category_id"]: summary for summary in response.json()["result"]
+    }
+    assert summaries[empty_category.id]["active_item_count"] == 0
+    assert summaries[stocked_category.id]["active_item_count"] == 1
+    assert summaries[stocked_category.id]["total_stock"] == stock_quantity
+    assert summaries[stocked_category.id]["category_name"] == stocked_category.name
+
+
+def test_reconcile_should_report_and_repair_drift(session):
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    stock_quantity = 50
+    drifted_item_count = 7
+    session.add(ItemFactory(category_id=category.id, stock_quantity=stock_quantity))
+    session.commit()
+
+    session.execute(
+        update(CategoryInventorySummary)
+        .where(CategoryInventorySummary.category_id == category.id)
+        .values(active_item_count=drifted_item_count, total_stock=0)
+    )
+    session.commit()
+
+    drifts = reconcile_category_inventory_summary(repair=False, session=session)
+
+    assert len(drifts) == 1
+    assert drifts[0].expected.active_item_count == 1
+    assert drifts[0].actual.active_item_count == drifted_item_count
+    assert read_summary(session, category.id).active_item_count == drifted_item_count
+
+    drifts = reconcile_category_inventory_summary(repair=True, session=session)
+
+    assert len(drifts) == 1
+    summary = read_summary(session, category.id)
+    assert summary.active_item_count == 1
+    assert summary.total_stock == stock_quantity
+    assert reconcile_category_inventory_summary(repair=True, session=session) == []
+
+
+def test_read_categories_should_include_stats_for_the_page(session, client):
+    category, empty_category = CategoryFactory(), CategoryFactory()
+    session.add_all([category, empty_category])
+    session.commit()
+    session.add_all([
+        ItemFactory(category_id=category.id, minimum_threshold=10, stock_quantity=5),
+        ItemFactory(category_id=category.id, minimum_threshold=10, stock_quantity=40),
+    ])
+    session.commit()
+    inactive_item = ItemFactory(category_id=category.id, stock_quantity=100)
+    session.add(inactive_item)
+    session.commit()
+    client.patch(f"/v1/item/{inactive_item.id}", json={"is_active": False})
+
+    plain = client.get("/v1/category/")
+    response = client.get("/v1/category/", params={"include": "stats"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert {category["stats"] for category in plain.json()["result"]} == {None}
+    assert {result["id"]: result["stats"] for result in response.json()["result"]} == {
+        category.id: {
+            "active_item_count": 2,
+            "total_stock": 45,
+            "low_stock_item_count": 1,
+        },
+        empty_category.id: {
+            "active_item_count": 0,
+            "total_stock": 0,
+            "low_stock_item_count": 0,
+        },
+    }
+
+
+def test_read_categories_stats_should_not_be_served_from_cache_after_item_writes(
+    session, client
+):
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+    params = {"include": "stats"}
+
+    first_response = client.get("/v1/category/", params=params)
+    client.post(
+        "/v1/item/",
+        json={
+            "name": "Item Novo",
+            "category_id": category.id,
+            "minimum_threshold": 1,
+            "stock_quantity": 1,
+        },
+    )
+    second_response = client.get("/v1/category/", params=params)
+
+    assert first_response.json()["result"][0]["stats"]["active_item_count"] == 0
+    assert second_response.headers["X-Cache"] == "MISS"
+    assert second_response.json()["result"][0]["stats"]["active_item_count"] == 1
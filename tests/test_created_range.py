@@ -0,0 +1,153 @@
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+
+import uuid_utils
+from sqlalchemy import select
+
+from crb_inventory.database_schema import Item
+from crb_inventory.models.filters import CreatedRange
+from crb_inventory.services.uuid import created_between, uuid_v7_bound
+from tests.factories import CategoryFactory, ItemFactory, TagFactory
+
+DAY_ONE = datetime(2024, 5, 1, 10, 30, tzinfo=UTC)
+DAY_TWO = DAY_ONE + timedelta(days=1)
+DAY_THREE = DAY_ONE + timedelta(days=2)
+
+
+def uuid_v7_at(moment: datetime) -> str:
+    milliseconds = int(moment.timestamp() * 1000)
+    return str(
+        uuid_utils.uuid7(
+            timestamp=milliseconds // 1000, nanos=milliseconds % 1000 * 1_000_000
+        )
+    )
+
+
+def create_items_on_three_days(session):
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    items = [
+        ItemFactory(id=uuid_v7_at(moment), category_id=category.id)
+        for moment in (DAY_ONE, DAY_TWO, DAY_TWO + timedelta(hours=2), DAY_THREE)
+    ]
+    session.add_all(items)
+    session.commit()
+
+    return category, items
+
+
+def test_uuid_v7_bound_should_enclose_ids_generated_in_the_same_millisecond():
+    moment = datetime(2024, 5, 1, 10, 30, 0, 123000, tzinfo=UTC)
+    generated_id = uuid_v7_at(moment)
+
+    assert uuid_v7_bound(moment) <= generated_id
+    assert generated_id < uuid_v7_bound(moment + timedelta(milliseconds=1))
+
+
+def test_uuid_v7_bound_should_treat_naive_datetimes_as_utc():
+    naive_moment = datetime(2024, 5, 1, 10, 30)
+
+    assert uuid_v7_bound(naive_moment) == uuid_v7_bound(
+        naive_moment.replace(tzinfo=UTC)
+    )
+
+
+def test_uuid_v7_bound_should_clamp_moments_before_the_epoch():
+    assert uuid_v7_bound(datetime(1900, 1, 1, tzinfo=UTC)) == (
+        "00000000-0000-0000-0000-000000000000"
+    )
+
+
+def test_created_between_should_compare_the_primary_key(session):
+    created = CreatedRange(created_after=DAY_ONE, created_before=DAY_TWO)
+    statement = select(Item.id).where(created_between(Item.id, created))
+
+    compiled = str(statement.compile(session.get_bind()))
+
+    assert "item.id >=" in compiled
+    assert "item.id <" in compiled
+    assert "created_at" not in compiled.split("WHERE")[1]
+
+
+def test_read_items_should_filter_by_creation_range(session, client):
+    _, items = create_items_on_three_days(session)
+
+    response = client.get(
+        "/v1/item/",
+        params={
+            "created_after": DAY_TWO.isoformat(),
+            "created_before": DAY_THREE.isoformat(),
+        },
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["total"] == len(items[1:3])
+    assert {item["id"] for item in response.json()["result"]} == {
+        item.id for item in items[1:3]
+    }
+
+
+def test_read_items_by_category_should_filter_by_created_after(session, client):
+    category, items = create_items_on_three_days(session)
+
+    response = client.get(
+        f"/v1/item/category/{category.id}",
+        params={"created_after": DAY_THREE.isoformat()},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert [item["id"] for item in response.json()["result"]] == [items[3].id]
+
+
+def test_read_tags_should_filter_by_created_before(session, client):
+    older_tag = TagFactory(id=uuid_v7_at(DAY_ONE))
+    session.add_all([older_tag, TagFactory(id=uuid_v7_at(DAY_THREE))])
+    session.commit()
+
+    response = client.get("/v1/tag/", params={"created_before": DAY_TWO.isoformat()})
+
+    assert response.status_code == HTTPStatus.OK
+    assert [tag["id"] for tag in response.json()["result"]] == [older_tag.id]
+
+
+def test_read_item_creation_stats_should_count_items_per_day(session, client):
+    create_items_on_three_days(session)
+
+    response = client.get("/v1/item/stats/created", params={"bucket": "day"})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["bucket"] == "day"
+    assert [
+        (datetime.fromisoformat(row["start"]).date(), row["count"])
+        for row in response.json()["result"]
+    ] == [(DAY_ONE.date(), 1), (DAY_TWO.date(), 2), (DAY_THREE.date(), 1)]
+
+
+def test_read_item_creation_stats_should_count_items_per_hour_in_range(session, client):
+    create_items_on_three_days(session)
+
+    response = client.get(
+        "/v1/item/stats/created",
+        params={
+            "bucket": "hour",
+            "created_after": DAY_TWO.isoformat(),
+            "created_before": DAY_THREE.isoformat(),
+        },
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert [
+        (datetime.fromisoformat(row["start"]), row["count"])
+        for row in response.json()["result"]
+    ] == [
+        (DAY_TWO.replace(minute=0), 1),
+        (DAY_TWO.replace(minute=0) + timedelta(hours=2), 1),
+    ]
+
+
+def test_read_item_creation_stats_should_reject_unknown_buckets(client):
+    response = client.get("/v1/item/stats/created", params={"bucket": "week"})
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
@@ -0,0 +1,68 @@
+import subprocess
+import sys
+
+import pytest
+
+from crb_inventory.core.database import pool_options
+from crb_inventory.settings import get_settings
+
+
+def test_pool_should_keep_defaults_without_connection_budget():
+    settings = get_settings().model_copy(
+        update={"DB_CONNECTION_BUDGET": 0, "DB_POOL_SIZE": 7, "DB_MAX_OVERFLOW": 3}
+    )
+
+    assert pool_options(settings) == {"pool_size": 7, "max_overflow": 3}
+
+
+def test_pool_should_split_connection_budget_between_workers():
+    settings = get_settings().model_copy(
+        update={"DB_CONNECTION_BUDGET": 40, "WEB_CONCURRENCY": 6}
+    )
+    # 6 connections per worker, one of them for the change feed listener.
+    expected_pool_size = 5
+
+    assert pool_options(settings) == {
+        "pool_size": expected_pool_size,
+        "max_overflow": 0,
+    }
+
+
+def test_pool_should_reject_budget_below_two_connections_per_worker():
+    settings = get_settings().model_copy(
+        update={"DB_CONNECTION_BUDGET": 15, "WEB_CONCURRENCY": 8}
+    )
+
+    with pytest.raises(ValueError, match="DB_CONNECTION_BUDGET=15 is too small"):
+        pool_options(settings)
+
+
+# Forking the test process itself could deadlock on threads it runs, so the
+# check forks from a fresh interpreter.
+FORK_CHECK = """
+import os
+from crb_inventory.core.database import get_engine
+
+parent_engine = get_engine()
+pid = os.fork()
+
+if pid == 0:
+    os._exit(int(get_engine.cache_info().currsize != 0))
+
+_, status = os.waitpid(pid, 0)
+assert os.waitstatus_to_exitcode(status) == 0, "child reused the parent engine"
+assert get_engine() is parent_engine
+"""
+FORK_CHECK_TIMEOUT = 30
+
+
+def test_forked_child_should_not_reuse_parent_engine():
+    result = subprocess.run(
+        [sys.executable, "-c", FORK_CHECK],
+        capture_output=True,
+        text=True,
+        timeout=FORK_CHECK_TIMEOUT,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
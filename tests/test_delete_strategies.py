@@ -0,0 +1,164 @@
+from http import HTTPStatus
+
+from sqlalchemy import select
+
+from crb_inventory.database_schema import (
+    Category,
+    Item,
+    ItemTombstone,
+    Tag,
+    item_tag_association,
+)
+from tests.factories import CategoryFactory, ItemFactory, TagFactory
+
+ITEM_COUNT = 3
+
+
+def create_category_with_tagged_items(session):
+    category, other_category = CategoryFactory(), CategoryFactory()
+    tag, other_tag = TagFactory(), TagFactory()
+    session.add_all([category, other_category, tag, other_tag])
+    session.commit()
+
+    items = ItemFactory.create_batch(ITEM_COUNT, category_id=category.id)
+    session.add_all(items)
+    session.commit()
+
+    for item in items:
+        item.tags.append(tag)
+    items[0].tags.append(other_tag)
+    session.commit()
+
+    return category, other_category, tag, other_tag, [item.id for item in items]
+
+
+def tag_ids_of(session, item_id):
+    return set(
+        session.scalars(
+            select(item_tag_association.c.tag_id).where(
+                item_tag_association.c.item_id == item_id
+            )
+        )
+    )
+
+
+def test_delete_category_should_restrict_by_default_when_it_has_items(session, client):
+    category, *_ = create_category_with_tagged_items(session)
+
+    response = client.delete(f"/v1/category/{category.id}")
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert response.json()["exc"] == "ResourceInUse"
+    assert response.headers["X-Error-Code"] == "008"
+    assert session.get(Category, category.id) is not None
+
+
+def test_delete_category_should_cascade_to_items_tags_and_tombstones(session, client):
+    category, other_category, _, _, item_ids = create_category_with_tagged_items(
+        session
+    )
+    other_item = ItemFactory(category_id=other_category.id)
+    session.add(other_item)
+    session.commit()
+
+    response = client.delete(
+        f"/v1/category/{category.id}", params={"strategy": "cascade"}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["strategy"] == "cascade"
+    assert response.json()["affected_items"] == ITEM_COUNT
+    session.expire_all()
+    assert session.get(Category, category.id) is None
+    assert session.scalars(select(Item.id)).all() == [other_item.id]
+    assert session.execute(select(item_tag_association)).all() == []
+    assert set(session.scalars(select(ItemTombstone.item_id))) == set(item_ids)
+
+
+def test_delete_category_should_reassign_items_and_bump_their_versions(session, client):
+    category, other_category, *_ = create_category_with_tagged_items(session)
+
+    response = client.delete(
+        f"/v1/category/{category.id}",
+        params={"strategy": "reassign", "reassign_to": other_category.id},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["affected_items"] == ITEM_COUNT
+    session.expire_all()
+    items = session.scalars(select(Item)).all()
+    assert {item.category_id for item in items} == {other_category.id}
+    assert {item.version for item in items} == {2}
+
+
+def test_delete_category_should_reject_invalid_reassign_targets(session, client):
+    category, *_ = create_category_with_tagged_items(session)
+    unknown_id = "0190fcb2-5e4a-7c3b-9d1e-2f4a6b8c0d1e"
+
+    responses = [
+        client.delete(
+            f"/v1/category/{category.id}", params={"strategy": "reassign", **params}
+        )
+        for params in ({}, {"reassign_to": category.id}, {"reassign_to": unknown_id})
+    ]
+
+    assert {response.status_code for response in responses} == {
+        HTTPStatus.UNPROCESSABLE_ENTITY
+    }
+    assert {response.json()["exc"] for response in responses} == {
+        "InvalidReassignTarget"
+    }
+    assert session.scalar(select(Item.category_id).limit(1)) == category.id
+
+
+def test_delete_tag_should_cascade_to_associations_by_default(session, client):
+    _, _, tag, other_tag, item_ids = create_category_with_tagged_items(session)
+
+    response = client.delete(f"/v1/tag/{tag.id}")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["strategy"] == "cascade"
+    assert response.json()["affected_items"] == ITEM_COUNT
+    assert session.get(Tag, tag.id) is None
+    assert tag_ids_of(session, item_ids[0]) == {other_tag.id}
+    assert len(session.scalars(select(Item.id)).all()) == ITEM_COUNT
+
+
+def test_delete_tag_should_restrict_when_it_is_in_use(session, client):
+    _, _, tag, *_ = create_category_with_tagged_items(session)
+    unused_tag = TagFactory()
+    session.add(unused_tag)
+    session.commit()
+
+    restricted = client.delete(f"/v1/tag/{tag.id}", params={"strategy": "restrict"})
+    unused = client.delete(f"/v1/tag/{unused_tag.id}", params={"strategy": "restrict"})
+
+    assert restricted.status_code == HTTPStatus.CONFLICT
+    assert restricted.json()["exc"] == "ResourceInUse"
+    assert unused.status_code == HTTPStatus.OK
+    assert unused.json()["affected_items"] == 0
+
+
+def test_delete_tag_should_reassign_associations_without_duplicates(session, client):
+    _, _, tag, other_tag, item_ids = create_category_with_tagged_items(session)
+
+    response = client.delete(
+        f"/v1/tag/{tag.id}",
+        params={"strategy": "reassign", "reassign_to": other_tag.id},
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["affected_items"] == ITEM_COUNT
+    assert {item_id: tag_ids_of(session, item_id) for item_id in item_ids} == {
+        item_id: {other_tag.id} for item_id in item_ids
+    }
+
+
+def test_delete_item_should_remove_its_tags(session, client):
+    _, _, tag, _, item_ids = create_category_with_tagged_items(session)
+
+    response = client.delete(f"/v1/item/{item_ids[0]}")
+
+    assert response.status_code == HTTPStatus.OK
+    assert tag_ids_of(session, item_ids[0]) == set()
+    assert tag_ids_of(session, item_ids[1]) == {tag.id}
@@ -0,0 +1,132 @@
+from http import HTTPStatus
+
+from sqlalchemy import func, select, update
+
+from crb_inventory.database_schema import IdempotencyKey, Item
+from crb_inventory.services.idempotency import purge_idempotency_keys
+from crb_inventory.settings import get_settings
+from tests.factories import CategoryFactory, ItemFactory, TagFactory
+
+
+def create_category(session):
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    return category
+
+
+def test_create_item_retry_should_replay_first_response(session, client):
+    category = create_category(session)
+    body = {"name": "Widget", "category_id": category.id, "stock_quantity": 5}
+    headers = {"Idempotency-Key": "create-widget"}
+
+    first = client.post("/v1/item/", json=body, headers=headers)
+    retry = client.post("/v1/item/", json=body, headers=headers)
+
+    assert first.status_code == HTTPStatus.CREATED
+    assert first.headers["Idempotent-Replayed"] == "false"
+    assert retry.status_code == HTTPStatus.CREATED
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert retry.json() == first.json()
+    assert session.scalar(select(func.count()).select_from(Item)) == 1
+
+
+def test_add_tag_to_item_retry_should_not_return_already_associated(session, client):
+    category = create_category(session)
+    item = ItemFactory(category_id=category.id)
+    tag = TagFactory()
+    session.add_all([item, tag])
+    session.commit()
+
+    url = f"/v1/item/{item.id}/tag/{tag.id}"
+    headers = {"Idempotency-Key": "tag-item"}
+
+    first = client.post(url, headers=headers)
+    retry = client.post(url, headers=headers)
+
+    assert first.status_code == HTTPStatus.CREATED
+    assert retry.status_code == HTTPStatus.CREATED
+    assert retry.json() == first.json()
+
+
+def test_reused_key_with_different_request_should_return_422(session, client):
+    category = create_category(session)
+    headers = {"Idempotency-Key": "reused-key"}
+
+    client.post(
+        "/v1/item/",
+        json={"name": "First", "category_id": category.id},
+        headers=headers,
+    )
+    response = client.post(
+        "/v1/item/",
+        json={"name": "Second", "category_id": category.id},
+        headers=headers,
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert response.json()["error_code"] == "061"
+    assert response.json()["idempotency_key"] == "reused-key"
+
+
+def test_failed_request_should_not_be_replayed(session, client):
+    category = create_category(session)
+    body = {"name": "Taken", "category_id": category.id}
+    headers = {"Idempotency-Key": "retry-after-failure"}
+
+    client.post("/v1/item/", json=body)
+    failed = client.post("/v1/item/", json=body, headers=headers)
+
+    assert failed.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert session.get(IdempotencyKey, "retry-after-failure") is None
+
+    body["name"] = "Available"
+    response = client.post("/v1/item/", json=body, headers=headers)
+
+    assert response.status_code == HTTPStatus.CREATED
+
+
+def test_request_still_in_progress_should_return_409(session, client, monkeypatch):
+    category = create_category(session)
+    body = {"name": "Slow", "category_id": category.id}
+    headers = {"Idempotency-Key": "in-progress"}
+
+    client.post("/v1/item/", json=body, headers=headers)
+    session.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.key == "in-progress")
+        .values(response_status=None, response_body=None)
+    )
+    session.commit()
+    monkeypatch.setattr(get_settings(), "IDEMPOTENCY_WAIT_TIMEOUT", 0.1)
+
+    response = client.post("/v1/item/", json=body, headers=headers)
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert response.json()["error_code"] == "060"
+
+
+def test_expired_key_should_be_reclaimed_and_purged(session, client):
+    headers = {"Idempotency-Key": "expiring"}
+
+    first = client.post("/v1/category/", json={"name": "Expiring"}, headers=headers)
+    session.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.key == "expiring")
+        .values(expires_at=func.now())
+    )
+    session.commit()
+
+    response = client.post("/v1/category/", json={"name": "Reclaimed"}, headers=headers)
+
+    assert first.status_code == HTTPStatus.CREATED
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.json()["result"]["name"] == "Reclaimed"
+    assert response.headers["Idempotent-Replayed"] == "false"
+    assert purge_idempotency_keys(session=session) == 0
+
+    session.execute(update(IdempotencyKey).values(expires_at=func.now()))
+    session.commit()
+
+    assert purge_idempotency_keys(session=session) == 1
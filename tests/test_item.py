@@ -1,12 +1,16 @@
 from http import HTTPStatus
 
 import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import Session
 
+from crb_inventory.database_schema import Item
 from crb_inventory.models.exceptions.item import (
     ItemNameAlreadyExists,
     TagAlreadyAssociatedWithItem,
     TagNotAssociatedWithItem,
 )
+from crb_inventory.models.exceptions.pagination import InvalidCursor
 from crb_inventory.models.exceptions.resource import (
     ResourceNotFound,
 )
@@ -560,3 +564,303 @@ def test_read_items_by_tag_should_return_200_and_items(session, client):
     assert "stock_quantity" in response.json()["result"][0]
     assert "created_at" in response.json()["result"][0]
     assert "updated_at" in response.json()["result"][0]
+
+
+def test_read_items_batch_should_return_found_items_and_missing_ids(session, client):
+    route = "/v1/item/batch-get"
+    missing_id = "56f0572c-1dec-4b4d-b517-4cac967146a7"
+
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    items = ItemFactory.create_batch(3, category_id=category.id)
+    session.bulk_save_objects(items)
+    session.commit()
+
+    ids = [item.id for item in items] + [missing_id, items[0].id]
+
+    response = client.post(route, json={"ids": ids})
+
+    assert response.status_code == HTTPStatus.OK
+    assert {item["id"] for item in response.json()["result"]} == {
+        item.id for item in items
+    }
+    assert response.json()["missing"] == [missing_id]
+
+
+def test_read_items_batch_should_return_422_with_all_invalid_ids(client):
+    route = "/v1/item/batch-get"
+    valid_id = "56f0572c-1dec-4b4d-b517-4cac967146a7"
+
+    response = client.post(route, json={"ids": ["invalid-1", valid_id, "invalid-2"]})
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert response.json()["detail"][0]["msg"] == (
+        "Value error, values should be valid UUIDs, invalid values: "
+        "invalid-1, invalid-2"
+    )
+
+
+def test_read_items_delta_should_return_changes_after_watermark(session, client):
+    route = "/v1/item/delta"
+
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    items = ItemFactory.create_batch(3, category_id=category.id)
+    session.add_all(items)
+    session.commit()
+
+    first_sync = client.get(route)
+
+    assert first_sync.status_code == HTTPStatus.OK
+    assert {item["id"] for item in first_sync.json()["result"]} == {
+        item.id for item in items
+    }
+    assert first_sync.json()["deleted"] == []
+    assert first_sync.json()["has_more"] is False
+
+    watermark = first_sync.json()["watermark"]
+    client.patch(f"/v1/item/{items[0].id}", json={"is_active": False})
+    client.delete(f"/v1/item/{items[1].id}")
+
+    second_sync = client.get(f"{route}?since={watermark}")
+
+    assert second_sync.status_code == HTTPStatus.OK
+    assert [item["id"] for item in second_sync.json()["result"]] == [items[0].id]
+    assert second_sync.json()["result"][0]["is_active"] is False
+    assert [tombstone["item_id"] for tombstone in second_sync.json()["deleted"]] == [
+        items[1].id
+    ]
+
+    third_sync = client.get(f"{route}?since={second_sync.json()['watermark']}")
+
+    assert third_sync.json()["result"] == []
+    assert third_sync.json()["deleted"] == []
+    assert third_sync.json()["watermark"] == second_sync.json()["watermark"]
+
+
+def test_read_items_delta_should_page_with_limit(session, client):
+    route = "/v1/item/delta"
+    limit = 2
+
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    session.add_all(ItemFactory.create_batch(3, category_id=category.id))
+    session.commit()
+
+    first_page = client.get(f"{route}?limit={limit}")
+    second_page = client.get(
+        f"{route}?limit={limit}&since={first_page.json()['watermark']}"
+    )
+
+    assert len(first_page.json()["result"]) == limit
+    assert first_page.json()["has_more"] is True
+    assert len(second_page.json()["result"]) == 1
+    assert second_page.json()["has_more"] is False
+
+
+def test_read_items_delta_should_page_changes_and_tombstones_together(session, client):
+    route = "/v1/item/delta"
+    limit = 5
+
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    items = ItemFactory.create_batch(6, category_id=category.id)
+    session.add_all(items)
+    session.commit()
+    for item in items[3:]:
+        client.delete(f"/v1/item/{item.id}")
+
+    first_page = client.get(f"{route}?limit={limit}")
+    second_page = client.get(
+        f"{route}?limit={limit}&since={first_page.json()['watermark']}"
+    )
+
+    assert len(first_page.json()["result"] + first_page.json()["deleted"]) == limit
+    assert first_page.json()["has_more"] is True
+    assert second_page.json()["result"] == []
+    assert len(second_page.json()["deleted"]) == 1
+    assert second_page.json()["has_more"] is False
+
+
+def test_read_items_delta_should_wait_for_open_transactions(session, client, engine):
+    route = "/v1/item/delta"
+
+    # Separate categories, as both writes would otherwise wait on one summary row.
+    slow_category, fast_category = CategoryFactory(), CategoryFactory()
+    session.add_all([slow_category, fast_category])
+    session.commit()
+
+    slow_item = ItemFactory(category_id=slow_category.id)
+    fast_item = ItemFactory(category_id=fast_category.id)
+    session.add_all([slow_item, fast_item])
+    session.commit()
+    slow_item_id, fast_item_id = slow_item.id, fast_item.id
+    watermark = client.get(route).json()["watermark"]
+    # Requests share the test session, end the transaction the read left open.
+    session.rollback()
+
+    with Session(engine) as slow:
+        slow.execute(
+            update(Item).where(Item.id == slow_item_id).values(description="slow")
+        )
+        client.patch(f"/v1/item/{fast_item_id}", json={"description": "fast"})
+
+        # The fast change started after the slow one, which has yet to commit.
+        while_slow_runs = client.get(f"{route}?since={watermark}").json()
+        session.rollback()
+        slow.commit()
+
+    after_slow_commits = client.get(
+        f"{route}?since={while_slow_runs['watermark']}"
+    ).json()
+
+    assert while_slow_runs["result"] == []
+    assert [item["id"] for item in after_slow_commits["result"]] == [
+        slow_item_id,
+        fast_item_id,
+    ]
+
+
+def test_read_items_delta_with_invalid_watermark_should_return_422(client):
+    route = "/v1/item/delta"
+
+    response = client.get(f"{route}?since=not-a-watermark")
+
+    exception = InvalidCursor()
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert response.json()["exc"] == exception.__class__.__name__
+    assert response.headers["X-Error-Code"] == exception.error_code
+
+
+def test_update_item_with_matching_if_match_should_bump_version(session, client):
+    route = "/v1/item/"
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    item = ItemFactory(category_id=category.id)
+    session.add(item)
+    session.commit()
+
+    expected_version = 2
+    item_data = {
+        "name": "Item 1 updated",
+        "is_active": True,
+        "category_id": item.category_id,
+        "minimum_threshold": 10,
+        "stock_quantity": 20,
+    }
+
+    etag = client.get(f"{route}{item.id}").headers["ETag"]
+    response = client.put(
+        f"{route}{item.id}", json=item_data, headers={"If-Match": etag}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["result"]["version"] == expected_version
+    assert response.headers["ETag"] == f'"{expected_version}"'
+
+
+def test_update_item_with_stale_if_match_should_return_412(session, client):
+    route = "/v1/item/"
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    item = ItemFactory(category_id=category.id)
+    session.add(item)
+    session.commit()
+
+    item_data = {
+        "name": "Item 1 updated",
+        "is_active": True,
+        "category_id": item.category_id,
+        "minimum_threshold": 10,
+        "stock_quantity": 20,
+    }
+
+    etag = client.get(f"{route}{item.id}").headers["ETag"]
+    client.patch(f"{route}{item.id}", json={"stock_quantity": 5})
+    response = client.put(
+        f"{route}{item.id}", json=item_data, headers={"If-Match": etag}
+    )
+
+    assert response.status_code == HTTPStatus.PRECONDITION_FAILED
+    assert response.json()["error_code"] == "002"
+    assert response.json()["exc"] == "ResourceVersionConflict"
+
+
+def test_patch_item_with_weak_if_match_should_return_412(session, client):
+    route = "/v1/item/"
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    item = ItemFactory(category_id=category.id)
+    session.add(item)
+    session.commit()
+
+    etag = client.get(f"{route}{item.id}").headers["ETag"]
+    response = client.patch(
+        f"{route}{item.id}",
+        json={"stock_quantity": 5},
+        headers={"If-Match": f"W/{etag}"},
+    )
+
+    assert response.status_code == HTTPStatus.PRECONDITION_FAILED
+    assert response.json()["exc"] == "ResourceVersionConflict"
+
+
+def test_patch_item_with_stale_body_version_should_return_412(session, client):
+    route = "/v1/item/"
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    item = ItemFactory(category_id=category.id)
+    session.add(item)
+    session.commit()
+
+    response = client.patch(
+        f"{route}{item.id}", json={"stock_quantity": 5, "version": 1}
+    )
+    assert response.status_code == HTTPStatus.OK
+
+    response = client.patch(
+        f"{route}{item.id}", json={"stock_quantity": 6, "version": 1}
+    )
+
+    assert response.status_code == HTTPStatus.PRECONDITION_FAILED
+    assert response.headers["X-Error-Code"] == "002"
+
+
+def test_patch_item_after_concurrent_write_should_return_412(session, client):
+    route = "/v1/item/"
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    item = ItemFactory(category_id=category.id, stock_quantity=10)
+    session.add(item)
+    session.commit()
+    assert item.version == 1
+
+    # Another writer commits after this session has loaded the item.
+    with session.get_bind().begin() as connection:
+        connection.execute(
+            update(Item).where(Item.id == item.id).values(version=Item.version + 1)
+        )
+
+    response = client.patch(f"{route}{item.id}", json={"stock_quantity": 5})
+
+    assert response.status_code == HTTPStatus.PRECONDITION_FAILED
+    assert response.json()["error_code"] == "002"
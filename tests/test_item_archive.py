@@ -0,0 +1,160 @@
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+
+from sqlalchemy import select
+
+from crb_inventory.database_schema import (
+    Item,
+    item_archive,
+    item_tag_association_archive,
+)
+from crb_inventory.models.exceptions.item import ItemNameAlreadyExists
+from crb_inventory.services.item_archive import archive_inactive_items
+from tests.factories import CategoryFactory, ItemFactory, TagFactory
+
+
+def archive_all_inactive_items(session):
+    return archive_inactive_items(
+        inactive_before=datetime.now(timezone.utc) + timedelta(days=1),
+        batch_size=100,
+        session=session,
+    )
+
+
+def test_archive_inactive_items_should_move_items_and_tags(session):
+    category = CategoryFactory()
+    tag = TagFactory()
+    session.add_all([category, tag])
+    session.commit()
+
+    active_item = ItemFactory(category_id=category.id)
+    inactive_item = ItemFactory(category_id=category.id)
+    session.add_all([active_item, inactive_item])
+    session.commit()
+
+    inactive_item.is_active = False
+    inactive_item.tags.append(tag)
+    session.commit()
+
+    active_item_id, inactive_item_id, tag_id = active_item.id, inactive_item.id, tag.id
+
+    archived = archive_all_inactive_items(session)
+
+    assert archived == 1
+    assert session.scalars(select(Item.id)).all() == [active_item_id]
+    assert session.execute(select(item_archive.c.id)).scalars().all() == [
+        inactive_item_id
+    ]
+    assert session.execute(select(item_tag_association_archive)).all() == [
+        (inactive_item_id, tag_id)
+    ]
+
+
+def test_archive_inactive_items_should_skip_recently_deactivated_items(session):
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    item = ItemFactory(category_id=category.id)
+    session.add(item)
+    session.commit()
+
+    item.is_active = False
+    session.commit()
+
+    archived = archive_inactive_items(
+        inactive_before=datetime.now(timezone.utc) - timedelta(days=1),
+        batch_size=100,
+        session=session,
+    )
+
+    assert archived == 0
+
+
+def test_read_item_with_include_archived_should_return_archived_item(session, client):
+    route = "/v1/item/"
+
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    item = ItemFactory(category_id=category.id)
+    session.add(item)
+    session.commit()
+
+    item.is_active = False
+    session.commit()
+    item_id = item.id
+    archive_all_inactive_items(session)
+
+    not_found_response = client.get(f"{route}{item_id}")
+    response = client.get(f"{route}{item_id}?include_archived=true")
+
+    assert not_found_response.status_code == HTTPStatus.NOT_FOUND
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["result"]["id"] == item_id
+    assert response.json()["result"]["archived_at"] is not None
+
+
+def test_restore_archived_item_should_return_item_with_tags(session, client):
+    route = "/v1/item/"
+
+    category = CategoryFactory()
+    tag = TagFactory()
+    session.add_all([category, tag])
+    session.commit()
+
+    item = ItemFactory(category_id=category.id)
+    session.add(item)
+    session.commit()
+
+    item.is_active = False
+    item.tags.append(tag)
+    session.commit()
+    item_id, tag_id = item.id, tag.id
+    archive_all_inactive_items(session)
+
+    response = client.post(f"{route}{item_id}/restore")
+    tags_response = client.get(f"{route}{item_id}/tag")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["result"]["id"] == item_id
+    assert response.json()["result"]["is_active"] is False
+    assert response.json()["result"]["archived_at"] is None
+    assert [tag["id"] for tag in tags_response.json()["result"]] == [tag_id]
+
+
+def test_restore_archived_item_with_taken_name_should_return_422(session, client):
+    route = "/v1/item/"
+
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    item = ItemFactory(category_id=category.id)
+    session.add(item)
+    session.commit()
+
+    item.is_active = False
+    session.commit()
+    item_id, item_name = item.id, item.name
+    archive_all_inactive_items(session)
+
+    session.add(ItemFactory(name=item_name, category_id=category.id))
+    session.commit()
+
+    response = client.post(f"{route}{item_id}/restore")
+
+    exception = ItemNameAlreadyExists()
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert response.headers["X-Error-Code"] == exception.error_code
+
+
+def test_restore_item_not_archived_should_return_404(client):
+    route = "/v1/item/"
+    random_id = "56f0572c-1dec-4b4d-b517-4cac967146a7"
+
+    response = client.post(f"{route}{random_id}/restore")
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
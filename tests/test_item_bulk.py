@@ -0,0 +1,145 @@
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import select
+
+from crb_inventory.database_schema import Item, ItemTombstone, item_tag_association
+from crb_inventory.settings import get_settings
+from tests.factories import CategoryFactory, ItemFactory, TagFactory
+
+SMALL_CHUNK_SIZE = 2
+
+
+@pytest.fixture
+def small_chunks(monkeypatch):
+    monkeypatch.setattr(get_settings(), "ITEM_BULK_CHUNK_SIZE", SMALL_CHUNK_SIZE)
+
+
+def create_tagged_items(session, count):
+    category = CategoryFactory()
+    tag = TagFactory()
+    session.add_all([category, tag])
+    session.commit()
+
+    items = ItemFactory.create_batch(count, category_id=category.id)
+    session.add_all(items)
+    session.commit()
+
+    for item in items:
+        item.tags.append(tag)
+    session.commit()
+
+    return category, tag, [item.id for item in items]
+
+
+def test_bulk_delete_by_ids_should_remove_items_tags_and_write_tombstones(
+    session, client, small_chunks
+):
+    _, _, item_ids = create_tagged_items(session, 5)
+    deleted_ids = item_ids[:3]
+    unknown_id = "0190fcb2-5e4a-7c3b-9d1e-2f4a6b8c0d1e"
+
+    response = client.post(
+        "/v1/item/bulk-delete", json={"ids": [*deleted_ids, unknown_id]}
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {
+        "deleted": len(deleted_ids),
+        "tags_removed": len(deleted_ids),
+    }
+    assert set(session.scalars(select(Item.id))) == set(item_ids[3:])
+    assert set(session.scalars(select(item_tag_association.c.item_id))) == set(
+        item_ids[3:]
+    )
+    assert set(session.scalars(select(ItemTombstone.item_id))) == set(deleted_ids)
+
+
+def test_bulk_delete_by_category_should_process_every_chunk(
+    session, client, small_chunks
+):
+    category, _, item_ids = create_tagged_items(session, 5)
+    other_category = CategoryFactory()
+    session.add(other_category)
+    session.commit()
+    other_item = ItemFactory(category_id=other_category.id)
+    session.add(other_item)
+    session.commit()
+
+    response = client.post("/v1/item/bulk-delete", json={"category_id": category.id})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["deleted"] == len(item_ids)
+    assert session.scalars(select(Item.id)).all() == [other_item.id]
+
+
+def test_bulk_delete_by_inactive_since_should_keep_recently_updated_items(
+    session, client
+):
+    _, _, item_ids = create_tagged_items(session, 2)
+    session.execute(
+        Item.__table__
+        .update()
+        .where(Item.id == item_ids[0])
+        .values(
+            is_active=False, updated_at=datetime.now(timezone.utc) - timedelta(days=30)
+        )
+    )
+    session.commit()
+
+    response = client.post(
+        "/v1/item/bulk-delete",
+        json={
+            "inactive_since": (
+                datetime.now(timezone.utc) - timedelta(days=7)
+            ).isoformat()
+        },
+    )
+
+    assert response.json() == {"deleted": 1, "tags_removed": 1}
+    assert session.scalars(select(Item.id)).all() == [item_ids[1]]
+
+
+def test_bulk_deactivate_by_tag_should_bump_versions_and_keep_tags(
+    session, client, small_chunks
+):
+    _, tag, item_ids = create_tagged_items(session, 3)
+
+    response = client.post("/v1/item/bulk-deactivate", json={"tag_id": tag.id})
+    repeated = client.post("/v1/item/bulk-deactivate", json={"tag_id": tag.id})
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json() == {"deactivated": len(item_ids)}
+    assert repeated.json() == {"deactivated": 0}
+
+    session.expire_all()
+    items = session.scalars(select(Item)).all()
+    assert {item.is_active for item in items} == {False}
+    assert {item.version for item in items} == {2}
+    assert len(session.execute(select(item_tag_association)).all()) == len(item_ids)
+
+
+def test_bulk_endpoints_should_require_ids_or_a_filter(client):
+    response = client.post("/v1/item/bulk-delete", json={})
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert "ids or at least one of" in response.json()["detail"][0]["msg"]
+
+
+def test_bulk_endpoints_should_validate_ids(client):
+    response = client.post(
+        "/v1/item/bulk-deactivate", json={"ids": ["invalid"], "category_id": None}
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+def test_bulk_deactivate_should_reject_inactive_since(client):
+    response = client.post(
+        "/v1/item/bulk-deactivate",
+        json={"inactive_since": datetime.now(timezone.utc).isoformat()},
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+    assert "inactive_since" in response.json()["detail"][0]["msg"]
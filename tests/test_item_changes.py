@@ -0,0 +1,187 @@
+import asyncio
+from datetime import datetime, timezone
+
+from sqlalchemy.orm import Session
+
+from crb_inventory.core.change_feed import (
+    ChangeFeed,
+    Subscription,
+    format_sse,
+    parse_last_event_id,
+    stream_item_changes,
+)
+from crb_inventory.models.item import ItemChangeEventModel
+from crb_inventory.services.item_changes import read_item_changes
+from tests.factories import CategoryFactory, ItemFactory
+
+
+def test_item_writes_should_record_change_events(session, client):
+    route = "/v1/item/"
+    patched_stock_quantity = 5
+
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    item = ItemFactory(category_id=category.id)
+    session.add(item)
+    session.commit()
+
+    client.patch(f"{route}{item.id}", json={"stock_quantity": patched_stock_quantity})
+    client.patch(f"{route}{item.id}", json={"name": "Item renamed"})
+    client.delete(f"{route}{item.id}")
+
+    changes = read_item_changes(after=(0, 0), limit=10, session=session)
+
+    assert [change.event_type for change in changes] == [
+        "item.created",
+        "item.stock_changed",
+        "item.updated",
+        "item.deleted",
+    ]
+    assert all(change.item_id == item.id for change in changes)
+    assert changes[1].payload["stock_quantity"] == patched_stock_quantity
+    assert changes[2].payload["name"] == "Item renamed"
+
+
+def test_read_item_changes_should_resume_after_event_id(session):
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    session.add_all(ItemFactory.create_batch(3, category_id=category.id))
+    session.commit()
+
+    first_change, *remaining_changes = read_item_changes(
+        after=(0, 0), limit=10, session=session
+    )
+
+    resumed_changes = read_item_changes(
+        after=first_change.position, limit=10, session=session
+    )
+
+    assert resumed_changes == remaining_changes
+
+
+def test_read_item_changes_should_wait_for_earlier_transactions(session, engine):
+    # Separate categories, as both writes would otherwise wait on one summary row.
+    early_category, late_category = CategoryFactory(), CategoryFactory()
+    session.add_all([early_category, late_category])
+    session.commit()
+
+    early_item = ItemFactory(category_id=early_category.id)
+    late_item = ItemFactory(category_id=late_category.id)
+
+    with Session(engine) as early, Session(engine) as late:
+        early.add(early_item)
+        early.flush()
+        late.add(late_item)
+        late.flush()
+        item_ids = [early_item.id, late_item.id]
+        late.commit()
+
+        # The later event has committed, the earlier one not yet.
+        while_early_runs = read_item_changes(after=(0, 0), limit=10, session=session)
+        session.rollback()
+        early.commit()
+
+    changes = read_item_changes(after=(0, 0), limit=10, session=session)
+
+    assert while_early_runs == []
+    assert [change.item_id for change in changes] == item_ids
+
+
+def make_change_event(xid, event_id):
+    return ItemChangeEventModel(
+        id=event_id,
+        event_type="item.updated",
+        item_id="56f0572c-1dec-4b4d-b517-4cac967146a7",
+        created_at=datetime.now(timezone.utc),
+        payload={},
+        xid=xid,
+    )
+
+
+def test_stream_should_skip_only_live_events_sent_with_the_backlog():
+    replayed = [make_change_event(700, 11), make_change_event(701, 10)]
+    live = [replayed[1], make_change_event(702, 9), make_change_event(702, 12)]
+    subscription = Subscription()
+
+    async def read_stream():
+        for event in live:
+            subscription.queue.put_nowait(event)
+        subscription.overflowed = True
+
+        return [
+            message
+            async for message in stream_item_changes(
+                replayed, subscription, after=(700, 4)
+            )
+        ]
+
+    messages = asyncio.run(read_stream())
+
+    assert messages == [format_sse(event) for event in replayed + live[1:]]
+
+
+def test_change_feed_should_fan_out_and_drop_slow_subscribers(monkeypatch):
+    feed = ChangeFeed("test_channel")
+    monkeypatch.setattr(feed, "_ensure_listener", lambda: None)
+
+    event = make_change_event(700, 1)
+
+    async def publish_events():
+        fast_subscription = feed.subscribe()
+        slow_subscription = feed.subscribe()
+        slow_subscription.queue = asyncio.Queue(maxsize=1)
+        slow_subscription.queue.put_nowait(event)
+
+        feed.publish(event)
+
+        return fast_subscription, slow_subscription
+
+    fast_subscription, slow_subscription = asyncio.run(publish_events())
+
+    assert fast_subscription.queue.get_nowait() == event
+    assert slow_subscription.overflowed is True
+    assert feed.subscribers == 1
+
+
+def test_closing_subscriptions_should_end_open_streams(monkeypatch):
+    feed = ChangeFeed("test_channel")
+    monkeypatch.setattr(feed, "_ensure_listener", lambda: None)
+
+    async def close_stream():
+        feed._loop = asyncio.get_running_loop()
+        subscription = feed.subscribe()
+        stream = asyncio.ensure_future(
+            anext(stream_item_changes([], subscription), None)
+        )
+        await asyncio.sleep(0)
+
+        feed.close_subscriptions()
+
+        return await asyncio.wait_for(stream, timeout=1)
+
+    assert asyncio.run(close_stream()) is None
+    assert feed.subscribers == 0
+
+
+def test_format_sse_should_use_event_id_and_type():
+    xid, event_id = 700, 42
+    event = ItemChangeEventModel(
+        id=event_id,
+        event_type="item.deleted",
+        item_id="56f0572c-1dec-4b4d-b517-4cac967146a7",
+        created_at=datetime.now(timezone.utc),
+        payload={"id": "56f0572c-1dec-4b4d-b517-4cac967146a7"},
+        xid=xid,
+    )
+
+    message = format_sse(event)
+
+    assert message.startswith(f"id: {xid}-{event_id}\nevent: item.deleted\ndata: {{")
+    assert message.endswith("\n\n")
+    assert parse_last_event_id(f"{xid}-{event_id}") == (xid, event_id)
+    assert parse_last_event_id(str(event_id)) is None
+    assert parse_last_event_id("not-an-id") is None
@@ -0,0 +1,292 @@
+from datetime import datetime
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import select, text
+
+from crb_inventory.database_schema import Category, Item, Tag
+from crb_inventory.models.filters import CreatedRange, Page
+from crb_inventory.models.item import (
+    ItemFilter,
+    ItemListOrder,
+    ItemSort,
+    ItemStateFilter,
+    ItemTagFilter,
+    ItemTagMatch,
+)
+from crb_inventory.services.item_filter import (
+    MATCHED_ITEMS_SORT_MAX_ITEMS,
+    ItemFilterFence,
+    choose_item_filter_fence,
+    item_filter_clause,
+)
+from crb_inventory.services.item_order import page_items
+from tests.factories import CategoryFactory, ItemFactory, TagFactory
+
+SEEDED_ITEMS = 10000
+SEEDED_CATEGORIES = 50
+SEEDED_TAGS = 200
+PLAN_PAGE = Page(page=1, page_size=20)
+
+
+@pytest.fixture
+def filtered_items(session):
+    tools, fasteners = CategoryFactory(), CategoryFactory()
+    steel, zinc = TagFactory(name="aco"), TagFactory(name="zinco")
+    session.add_all([tools, fasteners, steel, zinc])
+    session.commit()
+
+    items = {
+        name: ItemFactory(
+            name=name, category_id=category.id, stock_quantity=stock_quantity
+        )
+        for name, category, stock_quantity in [
+            ("Parafuso", fasteners, 40),
+            ("Porca", fasteners, 5),
+            ("Prego", fasteners, 0),
+            ("Alicate", tools, 8),
+            ("Pinca", tools, 12),
+        ]
+    }
+    session.add_all(items.values())
+    session.commit()
+
+    for name, tags in [
+        ("Parafuso", [steel, zinc]),
+        ("Porca", [steel]),
+        ("Prego", [zinc]),
+        ("Alicate", [steel, zinc]),
+    ]:
+        items[name].tags.extend(tags)
+    session.commit()
+
+    return {"tools": tools, "fasteners": fasteners, "steel": steel, "zinc": zinc}
+
+
+def names_of(client, **params):
+    response = client.get("/v1/item/", params={"sort": "name", **params})
+    assert response.status_code == HTTPStatus.OK
+
+    return [item["name"] for item in response.json()["result"]]
+
+
+def test_item_filter_should_combine_categories_stock_and_name_prefix(
+    client, filtered_items
+):
+    tools, fasteners = filtered_items["tools"].id, filtered_items["fasteners"].id
+
+    assert names_of(client, category_id=[tools, fasteners], min_stock=5) == [
+        "Alicate",
+        "Parafuso",
+        "Pinca",
+        "Porca",
+    ]
+    assert names_of(client, category_id=fasteners, max_stock=5) == ["Porca", "Prego"]
+    assert names_of(client, name_prefix="P", min_stock=1, max_stock=20) == [
+        "Pinca",
+        "Porca",
+    ]
+
+
+def test_item_filter_should_match_any_or_all_tags(client, filtered_items):
+    steel, zinc = filtered_items["steel"].id, filtered_items["zinc"].id
+
+    any_tag = client.get("/v1/item/", params={"sort": "name", "tag_id": [steel, zinc]})
+    all_tags = names_of(client, tag_id=[steel, zinc], tag_match="all")
+    narrowed = names_of(client, tag_id=[zinc], category_id=filtered_items["tools"].id)
+
+    assert [item["name"] for item in any_tag.json()["result"]] == [
+        "Alicate",
+        "Parafuso",
+        "Porca",
+        "Prego",
+    ]
+    assert any_tag.json()["total"] == len(any_tag.json()["result"])
+    assert all_tags == ["Alicate", "Parafuso"]
+    assert narrowed == ["Alicate"]
+
+
+def test_item_filter_should_list_inactive_items(session, client, filtered_items):
+    item = session.scalar(select(Item).where(Item.name == "Pinca"))
+    client.patch(f"/v1/item/{item.id}", json={"is_active": False})
+
+    assert names_of(client, is_active=False) == ["Pinca"]
+    assert "Pinca" not in names_of(client, category_id=filtered_items["tools"].id)
+
+
+def test_item_filter_should_follow_tag_changes(session, client, filtered_items):
+    zinc = filtered_items["zinc"].id
+    item = session.scalar(select(Item).where(Item.name == "Porca"))
+
+    before = names_of(client, tag_id=zinc)
+    client.post(f"/v1/item/{item.id}/tag/{zinc}")
+    after = names_of(client, tag_id=zinc)
+    client.delete(f"/v1/tag/{zinc}", params={"strategy": "cascade"})
+    deleted = names_of(client, tag_id=zinc)
+
+    assert before == ["Alicate", "Parafuso", "Prego"]
+    assert after == ["Alicate", "Parafuso", "Porca", "Prego"]
+    assert deleted == []
+
+
+def test_item_filter_should_reject_invalid_values(client):
+    responses = [
+        client.get("/v1/item/", params={"tag_id": "not-a-uuid"}),
+        client.get("/v1/item/", params={"category_id": ["1", "2"]}),
+        client.get("/v1/item/", params={"tag_match": "some"}),
+        client.get("/v1/item/", params={"min_stock": -1}),
+        client.get("/v1/item/", params={"name_prefix": ""}),
+    ]
+
+    assert [response.status_code for response in responses] == [
+        HTTPStatus.UNPROCESSABLE_ENTITY
+    ] * len(responses)
+
+
+@pytest.fixture
+def seeded_items(session):
+    # The change feed and summary triggers only slow the seeding down here.
+    session.execute(text("ALTER TABLE item DISABLE TRIGGER USER"))
+    session.execute(
+        text(
+            "INSERT INTO category (id, name) "
+            "SELECT gen_random_uuid(), 'category ' || g "
+            "FROM generate_series(1, :categories) AS g"
+        ),
+        {"categories": SEEDED_CATEGORIES},
+    )
+    session.execute(
+        text(
+            "INSERT INTO tag (id, name) "
+            "SELECT gen_random_uuid(), 'tag-' || g "
+            "FROM generate_series(1, :tags) AS g"
+        ),
+        {"tags": SEEDED_TAGS},
+    )
+    session.execute(
+        text(
+            "INSERT INTO item (id, name, category_id, minimum_threshold, "
+            "stock_quantity, is_active) "
+            "SELECT gen_random_uuid(), md5(g::text), "
+            "(ARRAY(SELECT id FROM category))[1 + g % :categories], "
+            "g % 13, g % 97, g % 10 <> 0 "
+            "FROM generate_series(1, :items) AS g"
+        ),
+        {"items": SEEDED_ITEMS, "categories": SEEDED_CATEGORIES},
+    )
+    session.execute(
+        text(
+            "INSERT INTO item_tag_association (item_id, tag_id) "
+            "SELECT DISTINCT item.id, (ARRAY(SELECT id FROM tag))[1 + slot % :tags] "
+            "FROM item, LATERAL (VALUES (abs(hashtext(item.name))), "
+            "(abs(hashtext(item.name || 'x')))) AS slots (slot)"
+        ),
+        {"tags": SEEDED_TAGS},
+    )
+    session.execute(text("ALTER TABLE item ENABLE TRIGGER USER"))
+    session.commit()
+    session.execute(text("ANALYZE category, tag, item, item_tag_association"))
+
+    return {
+        "category_id": session.scalar(select(Category.id).limit(1)),
+        "tag_ids": session.scalars(select(Tag.id).order_by(Tag.name).limit(2)).all(),
+    }
+
+
+def explain(session, item_filter, sort, fence):
+    items_query = page_items(
+        select(Item.id).where(item_filter_clause(item_filter, fence)),
+        page=PLAN_PAGE,
+        order=ItemListOrder(sort=sort),
+    )
+    compiled = items_query.compile(
+        dialect=session.bind.dialect, compile_kwargs={"render_postcompile": True}
+    )
+
+    return "\n".join(
+        row[0]
+        for row in session.connection().exec_driver_sql(
+            "EXPLAIN " + str(compiled), compiled.params
+        )
+    )
+
+
+@pytest.mark.parametrize(
+    ("build_filter", "sort_and_fence", "expected_nodes"),
+    [
+        (
+            lambda seed: ItemFilter(category_ids=[seed["category_id"]]),
+            (ItemSort.NAME, None),
+            ["ix_item_active_category_id_name_id"],
+        ),
+        (
+            lambda seed: ItemFilter(state=ItemStateFilter(min_stock=90)),
+            (ItemSort.STOCK_QUANTITY, None),
+            ["ix_item_active_stock_quantity_id"],
+        ),
+        (
+            lambda seed: ItemFilter(name_prefix="ab"),
+            (ItemSort.NEWEST, None),
+            ["ix_item_name_pattern"],
+        ),
+        (
+            lambda seed: ItemFilter(name_prefix="ab"),
+            (ItemSort.SHORTFALL, ItemFilterFence.NAME_PREFIX),
+            ["CTE matched_items", "ix_item_name_pattern"],
+        ),
+        (
+            lambda seed: ItemFilter(tags=ItemTagFilter(tag_ids=seed["tag_ids"])),
+            (ItemSort.NAME, ItemFilterFence.TAGS),
+            ["CTE matched_items", "ix_item_tag_association_tag_id_item_id"],
+        ),
+        (
+            lambda seed: ItemFilter(
+                tags=ItemTagFilter(tag_ids=seed["tag_ids"], match=ItemTagMatch.ALL)
+            ),
+            (ItemSort.NEWEST, None),
+            ["Aggregate", "ix_item_tag_association_tag_id_item_id"],
+        ),
+    ],
+)
+def test_item_filter_should_read_its_index(
+    session, seeded_items, build_filter, sort_and_fence, expected_nodes
+):
+    plan = explain(session, build_filter(seeded_items), *sort_and_fence)
+
+    assert all(node in plan for node in expected_nodes), plan
+
+
+def test_item_filter_should_fence_only_small_unordered_matches():
+    tag_id = "0190a000-0000-7000-8000-000000000001"
+    tag_filter = ItemFilter(tags=ItemTagFilter(tag_ids=[tag_id]))
+    prefix_filter = ItemFilter(name_prefix="par")
+    by_name = ItemListOrder(sort=ItemSort.NAME)
+    small, large = 100, MATCHED_ITEMS_SORT_MAX_ITEMS + 1
+
+    assert choose_item_filter_fence(tag_filter, by_name, {tag_id: small}, small) == (
+        ItemFilterFence.TAGS
+    )
+    assert choose_item_filter_fence(tag_filter, by_name, {tag_id: large}, large) is None
+    assert (
+        choose_item_filter_fence(
+            tag_filter, ItemListOrder(sort=ItemSort.NEWEST), {tag_id: small}, small
+        )
+        is None
+    )
+    assert choose_item_filter_fence(prefix_filter, by_name, {}, small) == (
+        ItemFilterFence.NAME_PREFIX
+    )
+    narrowed_prefix_filters = [
+        prefix_filter.model_copy(update={"category_ids": [tag_id]}),
+        prefix_filter.model_copy(update={"tags": ItemTagFilter(tag_ids=[tag_id])}),
+        prefix_filter.model_copy(update={"state": ItemStateFilter(min_stock=1)}),
+        prefix_filter.model_copy(update={"state": ItemStateFilter(is_active=False)}),
+        prefix_filter.model_copy(
+            update={"created": CreatedRange(created_after=datetime(2026, 1, 1))}
+        ),
+    ]
+    for narrowed_filter in narrowed_prefix_filters:
+        assert (
+            choose_item_filter_fence(narrowed_filter, by_name, {tag_id: large}, small)
+            is None
+        ), narrowed_filter
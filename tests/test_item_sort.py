@@ -0,0 +1,113 @@
+from http import HTTPStatus
+
+import pytest
+
+from tests.factories import CategoryFactory, ItemFactory, TagFactory
+
+PAGE_SIZE = 2
+ITEM_STOCK = [
+    # name, minimum_threshold, stock_quantity
+    ("Porca", 10, 4),
+    ("Arruela", 9, 4),
+    ("Parafuso", 3, 30),
+    ("Broca", 20, 5),
+    ("Chave", 0, 12),
+]
+
+
+@pytest.fixture
+def stocked_items(session):
+    category, tag = CategoryFactory(), TagFactory()
+    session.add_all([category, tag])
+    session.commit()
+
+    items = [
+        ItemFactory(
+            name=name,
+            category_id=category.id,
+            minimum_threshold=minimum_threshold,
+            stock_quantity=stock_quantity,
+        )
+        for name, minimum_threshold, stock_quantity in ITEM_STOCK
+    ]
+    session.add_all(items)
+    session.commit()
+
+    for item in items:
+        item.tags.append(tag)
+    session.commit()
+
+    return category, tag, items
+
+
+def walk_pages(client, route, sort):
+    names = []
+    params = {"sort": sort, "page_size": PAGE_SIZE}
+
+    while True:
+        response = client.get(route, params=params)
+        assert response.status_code == HTTPStatus.OK
+        names += [item["name"] for item in response.json()["result"]]
+
+        if response.json()["next_cursor"] is None:
+            return names
+        params["cursor"] = response.json()["next_cursor"]
+
+
+@pytest.mark.parametrize(
+    ("sort", "expected_names"),
+    [
+        ("name", ["Arruela", "Broca", "Chave", "Parafuso", "Porca"]),
+        ("shortfall", ["Broca", "Porca", "Arruela", "Chave", "Parafuso"]),
+    ],
+)
+def test_item_lists_should_walk_every_sort_with_cursors(
+    client, stocked_items, sort, expected_names
+):
+    category, tag, _ = stocked_items
+
+    for route in (
+        "/v1/item/",
+        f"/v1/item/category/{category.id}",
+        f"/v1/item/tag/{tag.id}",
+    ):
+        assert walk_pages(client, route, sort) == expected_names
+
+
+def test_item_sort_should_break_ties_on_id(client, stocked_items):
+    _, _, items = stocked_items
+    porca, arruela = items[0], items[1]
+
+    response = client.get("/v1/item/", params={"sort": "stock_quantity"})
+
+    assert [item["id"] for item in response.json()["result"][:2]] == sorted([
+        porca.id,
+        arruela.id,
+    ])
+
+
+def test_item_sort_should_order_by_last_update(client, stocked_items):
+    _, _, items = stocked_items
+    client.patch(f"/v1/item/{items[2].id}", json={"description": "revisado"})
+
+    response = client.get("/v1/item/", params={"sort": "updated_at"})
+
+    assert response.json()["result"][0]["id"] == items[2].id
+
+
+def test_item_lists_should_reject_foreign_or_invalid_cursors(client, stocked_items):
+    first_page = client.get(
+        "/v1/item/", params={"sort": "name", "page_size": PAGE_SIZE}
+    )
+    cursor = first_page.json()["next_cursor"]
+
+    responses = [
+        client.get("/v1/item/", params={"sort": "shortfall", "cursor": cursor}),
+        client.get("/v1/item/", params={"sort": "name", "cursor": "not-a-cursor"}),
+        client.get("/v1/item/", params={"sort": "created_at"}),
+    ]
+
+    assert [response.status_code for response in responses] == [
+        HTTPStatus.UNPROCESSABLE_ENTITY
+    ] * len(responses)
+    assert responses[0].json()["exc"] == "InvalidCursor"
@@ -3,6 +3,8 @@ import pytest
 from crb_inventory.models.validators import (
     validate_positive_value,
     validate_tag_name_value,
+    validate_uuid_list_value,
+    validate_uuid_value,
 )
 
 
@@ -42,3 +44,45 @@ def test_validate_tag_name_value_should_raise_value_error_when_invalid_format():
         match="value should be in the format of lowercase alphanumeric characters separated by hyphens",
     ):
         validate_tag_name_value(value)
+
+
+def test_validate_uuid_list_value_should_return_values_when_all_are_valid():
+    values = [
+        "56f0572c-1dec-4b4d-b517-4cac967146a7",
+        "0190fcb2-5e4a-7c3b-9d1e-2f4a6b8c0d1e",
+    ]
+    assert validate_uuid_list_value(values) == values
+
+
+def test_validate_uuid_list_value_should_report_every_invalid_value():
+    values = ["invalid-1", "56f0572c-1dec-4b4d-b517-4cac967146a7", "invalid-2"]
+    with pytest.raises(
+        ValueError,
+        match="values should be valid UUIDs, invalid values: invalid-1, invalid-2",
+    ):
+        validate_uuid_list_value(values)
+
+
+def test_validate_uuid_value_should_return_value_when_value_is_canonical():
+    value = "0190FCB2-5E4A-7C3B-9D1E-2F4A6B8C0D1E"
+    assert validate_uuid_value(value) == value
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "0190fcb25e4a7c3b9d1e2f4a6b8c0d1e",
+        "{0190fcb2-5e4a-7c3b-9d1e-2f4a6b8c0d1e}",
+        "urn:uuid:0190fcb2-5e4a-7c3b-9d1e-2f4a6b8c0d1e",
+        "0190fcb2-5e4a-7c3b-9d1e-2f4a6b8c0d1e\n",
+    ],
+)
+def test_validate_uuid_value_should_raise_value_error_when_value_is_not_canonical(
+    value,
+):
+    with pytest.raises(ValueError, match="value should be a valid UUID"):
+        validate_uuid_value(value)
+
+
+def test_validate_uuid_value_should_return_none_when_value_is_none():
+    assert validate_uuid_value(None) is None
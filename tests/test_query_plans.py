@@ -0,0 +1,308 @@
+import os
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from crb_inventory.database_schema import Category, Item, Tag, mapper_registry
+from crb_inventory.models.category import CategoryInclude
+from crb_inventory.models.filters import CreatedRange, Page
+from crb_inventory.models.item import (
+    ItemCreationBucket,
+    ItemFilter,
+    ItemListOrder,
+    ItemSort,
+    ItemStateFilter,
+    ItemTagFilter,
+    ItemTagMatch,
+)
+from crb_inventory.models.tag import TagSort
+from crb_inventory.models.utils import BatchGetRequest
+from crb_inventory.services.autocomplete import autocomplete_items
+from crb_inventory.services.category import read_categories
+from crb_inventory.services.item import (
+    read_item,
+    read_item_creation_stats,
+    read_item_tags,
+    read_items,
+    read_items_batch,
+    read_items_by_category,
+    read_items_by_tag,
+    read_items_delta,
+)
+from crb_inventory.services.tag import read_tags
+from tests.query_plans import (
+    PlanCheck,
+    capture_statements,
+    explain_statement,
+    plan_diff,
+    read_plan_baseline,
+    render_plan,
+    seed_inventory,
+    write_plan_baseline,
+)
+
+PLAN_SCHEMA = "query_plans"
+PLAN_ITEMS = int(os.environ.get("QUERY_PLAN_ITEMS", "100000"))
+PLAN_CATEGORIES = 200
+PLAN_TAGS = 500
+PAGE = Page(page=1, page_size=20)
+DEEP_PAGE = Page(page=50, page_size=20)
+ONE_DAY = CreatedRange(
+    created_after=datetime(2026, 1, 10, tzinfo=timezone.utc),
+    created_before=datetime(2026, 1, 11, tzinfo=timezone.utc),
+)
+BATCH_SIZE = 50
+
+
+@pytest.fixture(scope="module")
+def plan_session(engine):
+    with engine.connect() as connection:
+        connection.execute(text(f"DROP SCHEMA IF EXISTS {PLAN_SCHEMA} CASCADE"))
+        connection.execute(text(f"CREATE SCHEMA {PLAN_SCHEMA}"))
+        connection.execute(text(f"SET search_path TO {PLAN_SCHEMA}"))
+        mapper_registry.metadata.create_all(connection)
+        connection.commit()
+
+        session = Session(bind=connection)
+        seed_inventory(
+            session, items=PLAN_ITEMS, categories=PLAN_CATEGORIES, tags=PLAN_TAGS
+        )
+
+        with engine.connect().execution_options(
+            isolation_level="AUTOCOMMIT"
+        ) as maintenance:
+            maintenance.execute(text(f"VACUUM ANALYZE {PLAN_SCHEMA}.item"))
+            maintenance.execute(
+                text(f"VACUUM ANALYZE {PLAN_SCHEMA}.item_tag_association")
+            )
+            maintenance.execute(text(f"VACUUM ANALYZE {PLAN_SCHEMA}.tag"))
+            maintenance.execute(text(f"VACUUM ANALYZE {PLAN_SCHEMA}.category"))
+
+        yield session
+
+        session.close()
+        connection.execute(text(f"DROP SCHEMA {PLAN_SCHEMA} CASCADE"))
+        connection.execute(text("RESET search_path"))
+        connection.commit()
+
+
+@pytest.fixture(scope="module")
+def plan_seed(plan_session):
+    popular_tags = plan_session.scalars(
+        select(Tag.id).order_by(Tag.active_item_count.desc()).limit(3)
+    ).all()
+    small_tag = plan_session.scalar(
+        select(Tag.id)
+        .where(Tag.active_item_count > 0)
+        .order_by(Tag.active_item_count)
+        .limit(1)
+    )
+    categories = plan_session.scalars(select(Category.id).limit(2)).all()
+    items = plan_session.scalars(
+        select(Item.id).order_by(Item.name).limit(BATCH_SIZE)
+    ).all()
+
+    return {
+        "popular_tags": popular_tags,
+        "small_tag": small_tag,
+        "categories": categories,
+        "items": items,
+        "watermark": read_items_delta(
+            since=None, limit=PLAN_ITEMS // 2, session=plan_session
+        ).watermark,
+    }
+
+
+def item_list(page=PAGE, sort=ItemSort.NEWEST, **filters):
+    return lambda session, seed: read_items(
+        page=page,
+        order=ItemListOrder(sort=sort),
+        item_filter=ItemFilter(**filters),
+        session=session,
+    )
+
+
+def item_list_after_cursor(sort):
+    def run(session, seed):
+        first_page = read_items(
+            page=PAGE, order=ItemListOrder(sort=sort), session=session
+        )
+        read_items(
+            page=PAGE,
+            order=ItemListOrder(sort=sort, cursor=first_page.next_cursor),
+            session=session,
+        )
+
+    return run
+
+
+# Each case runs a service and checks the plan of every SELECT it issues.
+# Lists without a filter, and the most popular tags together, count a large
+# share of item, where a sequential scan is the cheapest plan, hence
+# full_count_allowed. Counts of a category may read any of the indexes led
+# by category_id, so only the index of the page is expected there.
+PLAN_CASES = {
+    "item_list_newest": (
+        item_list(),
+        PlanCheck(indexes=("item_pkey",), full_count_allowed=True),
+    ),
+    "item_list_deep_page": (
+        item_list(page=DEEP_PAGE),
+        PlanCheck(indexes=("item_pkey",), full_count_allowed=True),
+    ),
+    "item_list_by_name": (
+        item_list(sort=ItemSort.NAME),
+        PlanCheck(indexes=("ix_item_active_name_id",), full_count_allowed=True),
+    ),
+    "item_list_by_stock_quantity": (
+        item_list(sort=ItemSort.STOCK_QUANTITY),
+        PlanCheck(
+            indexes=("ix_item_active_stock_quantity_id",), full_count_allowed=True
+        ),
+    ),
+    "item_list_by_updated_at": (
+        item_list(sort=ItemSort.UPDATED_AT),
+        PlanCheck(indexes=("ix_item_updated_at_id",), full_count_allowed=True),
+    ),
+    "item_list_by_shortfall": (
+        item_list(sort=ItemSort.SHORTFALL),
+        PlanCheck(indexes=("ix_item_active_shortfall_id",), full_count_allowed=True),
+    ),
+    "item_list_by_name_after_cursor": (
+        item_list_after_cursor(ItemSort.NAME),
+        PlanCheck(indexes=("ix_item_active_name_id",), full_count_allowed=True),
+    ),
+    "item_list_created_one_day": (
+        item_list(created=ONE_DAY),
+        PlanCheck(indexes=("item_pkey",)),
+    ),
+    "item_list_by_category": (
+        lambda session, seed: read_items_by_category(
+            category_id=seed["categories"][0],
+            page=PAGE,
+            order=ItemListOrder(sort=ItemSort.NAME),
+            session=session,
+        ),
+        PlanCheck(indexes=("ix_item_active_category_id_name_id",)),
+    ),
+    "item_list_by_categories": (
+        lambda session, seed: item_list(category_ids=seed["categories"])(session, seed),
+        PlanCheck(indexes=("item_pkey",)),
+    ),
+    "item_list_by_tag": (
+        lambda session, seed: read_items_by_tag(
+            tag_id=seed["popular_tags"][0], page=PAGE, session=session
+        ),
+        PlanCheck(indexes=("ix_item_tag_association_tag_id_item_id",)),
+    ),
+    "item_list_by_small_tag_by_name": (
+        lambda session, seed: read_items_by_tag(
+            tag_id=seed["small_tag"],
+            page=PAGE,
+            order=ItemListOrder(sort=ItemSort.NAME),
+            session=session,
+        ),
+        PlanCheck(indexes=("ix_item_tag_association_tag_id_item_id",)),
+    ),
+    "item_list_by_any_tag": (
+        lambda session, seed: item_list(
+            tags=ItemTagFilter(tag_ids=seed["popular_tags"])
+        )(session, seed),
+        PlanCheck(
+            indexes=("ix_item_tag_association_tag_id_item_id",),
+            full_count_allowed=True,
+        ),
+    ),
+    "item_list_by_all_tags": (
+        lambda session, seed: item_list(
+            sort=ItemSort.SHORTFALL,
+            tags=ItemTagFilter(tag_ids=seed["popular_tags"], match=ItemTagMatch.ALL),
+        )(session, seed),
+        PlanCheck(indexes=("ix_item_tag_association_tag_id_item_id",)),
+    ),
+    "item_list_by_name_prefix": (
+        item_list(sort=ItemSort.NAME, name_prefix="ab"),
+        PlanCheck(indexes=("ix_item_name_pattern",)),
+    ),
+    "item_list_by_stock_range": (
+        item_list(
+            sort=ItemSort.STOCK_QUANTITY,
+            state=ItemStateFilter(min_stock=10, max_stock=12),
+        ),
+        PlanCheck(indexes=("ix_item_active_stock_quantity_id",)),
+    ),
+    "item_read": (
+        lambda session, seed: read_item(seed["items"][0], session=session),
+        PlanCheck(indexes=("item_pkey",)),
+    ),
+    "item_read_tags": (
+        lambda session, seed: read_item_tags(seed["items"][0], session=session),
+        PlanCheck(indexes=("item_pkey", "item_tag_association_pkey")),
+    ),
+    "item_batch_read": (
+        lambda session, seed: read_items_batch(
+            BatchGetRequest(ids=seed["items"]), session=session
+        ),
+        PlanCheck(indexes=("item_pkey",)),
+    ),
+    "item_delta": (
+        lambda session, seed: read_items_delta(
+            since=seed["watermark"], limit=100, session=session
+        ),
+        PlanCheck(indexes=("ix_item_updated_at_id",)),
+    ),
+    "item_creation_stats_one_day": (
+        lambda session, seed: read_item_creation_stats(
+            bucket=ItemCreationBucket.HOUR, created=ONE_DAY, session=session
+        ),
+        PlanCheck(indexes=("item_pkey",)),
+    ),
+    "item_autocomplete": (
+        lambda session, seed: autocomplete_items(
+            prefix="ab", limit=10, session=session
+        ),
+        PlanCheck(indexes=("ix_item_name_pattern",)),
+    ),
+    "category_list_with_stats": (
+        lambda session, seed: read_categories(
+            page=1, page_size=20, include=CategoryInclude.STATS, session=session
+        ),
+        PlanCheck(indexes=("ix_item_category_id_is_active",)),
+    ),
+    "tag_list_by_popularity": (
+        lambda session, seed: read_tags(
+            page=1, page_size=20, sort=TagSort.POPULARITY, session=session
+        ),
+        PlanCheck(indexes=("ix_tag_active_item_count_id",)),
+    ),
+}
+
+
+@pytest.mark.parametrize("name", list(PLAN_CASES))
+def test_query_plan_should_keep_its_indexes(plan_session, plan_seed, name):
+    run, check = PLAN_CASES[name]
+    connection = plan_session.connection()
+
+    with capture_statements(connection) as statements:
+        run(plan_session, plan_seed)
+    plans = [
+        explain_statement(connection, statement, parameters)
+        for statement, parameters in statements
+    ]
+
+    lines = []
+    for number, plan in enumerate(plans, start=1):
+        lines += [f"-- statement {number}", *render_plan(plan)]
+
+    if os.environ.get("UPDATE_QUERY_PLANS"):
+        write_plan_baseline(name, lines)
+
+    violations = check.violations([statement for statement, _ in statements], plans)
+    baseline = read_plan_baseline().get(name, [])
+
+    assert not violations, "\n".join([
+        f"{name}: " + "; ".join(violations),
+        plan_diff(name, baseline, lines) if baseline else "\n".join(lines),
+    ])
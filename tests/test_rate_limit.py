@@ -0,0 +1,105 @@
+from http import HTTPStatus
+from time import sleep
+
+import pytest
+from starlette.requests import Request
+
+from crb_inventory.core.rate_limit import (
+    DatabaseRateLimitBackend,
+    MemoryRateLimitBackend,
+    RateLimit,
+    RateLimitGroup,
+    client_identity,
+    parse_trusted_proxies,
+    rate_limiter,
+)
+
+
+@pytest.fixture
+def strict_write_limit(monkeypatch):
+    monkeypatch.setitem(
+        rate_limiter.limits, RateLimitGroup.WRITE, RateLimit(rate=0.01, burst=2)
+    )
+
+
+def test_memory_backend_should_allow_burst_then_deny():
+    backend = MemoryRateLimitBackend(max_buckets=10)
+    limit = RateLimit(rate=1, burst=3)
+
+    assert [backend.acquire("client", limit) for _ in range(3)] == [0.0] * 3
+
+    retry_after = backend.acquire("client", limit)
+    assert 0 < retry_after <= 1
+    assert backend.acquire("other-client", limit) == 0
+
+
+def test_memory_backend_should_refill_over_time():
+    backend = MemoryRateLimitBackend(max_buckets=10)
+    limit = RateLimit(rate=100, burst=1)
+
+    assert backend.acquire("client", limit) == 0
+    assert backend.acquire("client", limit) > 0
+
+    sleep(limit.interval)
+
+    assert backend.acquire("client", limit) == 0
+
+
+def test_database_backend_should_share_buckets_between_instances(session, engine):
+    limit = RateLimit(rate=0.01, burst=2)
+    first_worker = DatabaseRateLimitBackend(engine)
+    second_worker = DatabaseRateLimitBackend(engine)
+
+    assert first_worker.acquire("client", limit) == 0
+    assert second_worker.acquire("client", limit) == 0
+    assert first_worker.acquire("client", limit) > 0
+    assert second_worker.acquire("other-client", limit) == 0
+
+
+def test_exhausted_client_should_receive_429(client, strict_write_limit):
+    for name in ("first", "second"):
+        response = client.post("/v1/tag/", json={"name": name})
+        assert response.status_code == HTTPStatus.CREATED
+
+    response = client.post("/v1/tag/", json={"name": "third"})
+
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+    assert response.json()["error_code"] == "070"
+    assert response.json()["group"] == "write"
+    assert int(response.headers["Retry-After"]) > 0
+
+
+def test_rate_limits_should_apply_per_client_and_group(client, strict_write_limit):
+    for name in ("first", "second"):
+        client.post("/v1/tag/", json={"name": name})
+
+    response = client.post(
+        "/v1/tag/", json={"name": "third"}, headers={"X-API-Key": "another-client"}
+    )
+    assert response.status_code == HTTPStatus.TOO_MANY_REQUESTS
+
+    response = client.get("/v1/tag/")
+    assert response.status_code == HTTPStatus.OK
+
+
+def request_from(host, forwarded_for=None):
+    headers = [(b"x-forwarded-for", forwarded_for.encode())] if forwarded_for else []
+
+    return Request({"type": "http", "client": (host, 4321), "headers": headers})
+
+
+def test_client_identity_should_trust_forwarded_for_only_from_proxies(monkeypatch):
+    monkeypatch.setattr(
+        rate_limiter, "trusted_proxies", parse_trusted_proxies("10.0.0.0/8, ::1")
+    )
+
+    assert client_identity(request_from("203.0.113.7", "198.51.100.1")) == (
+        "ip:203.0.113.7"
+    )
+    assert client_identity(request_from("10.0.0.2", "198.51.100.1")) == (
+        "ip:198.51.100.1"
+    )
+    assert client_identity(
+        request_from("10.0.0.2", "192.0.2.99, 198.51.100.1, 10.0.0.3")
+    ) == ("ip:198.51.100.1")
+    assert client_identity(request_from("::1")) == "ip:::1"
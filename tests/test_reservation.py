@@ -0,0 +1,215 @@
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from crb_inventory.database_schema import ItemChangeEvent, StockReservation
+from crb_inventory.models.exceptions.reservation import InsufficientStock
+from crb_inventory.models.reservation import ReservationCreateRequest
+from crb_inventory.services.reservation import create_reservation, expire_reservations
+from tests.factories import CategoryFactory, ItemFactory
+
+
+def create_item(session, stock_quantity):
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    item = ItemFactory(category_id=category.id, stock_quantity=stock_quantity)
+    session.add(item)
+    session.commit()
+
+    return item.id
+
+
+def test_create_reservation_should_hold_available_stock(session, client):
+    stock_quantity = 10
+    reserved_quantity = 4
+    item_id = create_item(session, stock_quantity)
+
+    response = client.post(
+        "/v1/reservation/", json={"item_id": item_id, "quantity": reserved_quantity}
+    )
+
+    assert response.status_code == HTTPStatus.CREATED
+    assert response.json()["result"]["status"] == "held"
+    assert response.json()["result"]["quantity"] == reserved_quantity
+
+    item = client.get(f"/v1/item/{item_id}").json()["result"]
+    assert item["stock_quantity"] == stock_quantity
+    assert item["reserved_quantity"] == reserved_quantity
+    assert item["available_quantity"] == stock_quantity - reserved_quantity
+
+
+def test_create_reservation_beyond_available_stock_should_return_409(session, client):
+    stock_quantity = 5
+    item_id = create_item(session, stock_quantity)
+
+    response = client.post(
+        "/v1/reservation/", json={"item_id": item_id, "quantity": stock_quantity}
+    )
+    assert response.status_code == HTTPStatus.CREATED
+
+    response = client.post("/v1/reservation/", json={"item_id": item_id, "quantity": 1})
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert response.json()["error_code"] == InsufficientStock(item_id, 1).error_code
+    assert response.json()["item_id"] == item_id
+
+
+def test_create_reservation_for_unknown_item_should_return_404(client):
+    response = client.post(
+        "/v1/reservation/",
+        json={"item_id": "01912e6e-8c5e-7b1a-9f6e-3c1d2b4a5e6f", "quantity": 1},
+    )
+
+    assert response.status_code == HTTPStatus.NOT_FOUND
+    assert response.json()["error_code"] == "001"
+
+
+def test_confirm_reservation_should_deduct_stock_once(session, client):
+    stock_quantity = 10
+    reserved_quantity = 3
+    expected_version = 2
+    item_id = create_item(session, stock_quantity)
+
+    reservation = client.post(
+        "/v1/reservation/", json={"item_id": item_id, "quantity": reserved_quantity}
+    ).json()["result"]
+
+    response = client.post(f"/v1/reservation/{reservation['id']}/confirm")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["result"]["status"] == "confirmed"
+
+    item = client.get(f"/v1/item/{item_id}").json()["result"]
+    assert item["stock_quantity"] == stock_quantity - reserved_quantity
+    assert item["reserved_quantity"] == 0
+    assert item["version"] == expected_version
+
+    response = client.post(f"/v1/reservation/{reservation['id']}/confirm")
+
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert response.json()["error_code"] == "051"
+
+
+def test_release_reservation_should_return_stock(session, client):
+    stock_quantity = 10
+    item_id = create_item(session, stock_quantity)
+
+    reservation = client.post(
+        "/v1/reservation/", json={"item_id": item_id, "quantity": stock_quantity}
+    ).json()["result"]
+
+    response = client.post(f"/v1/reservation/{reservation['id']}/release")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["result"]["status"] == "released"
+
+    item = client.get(f"/v1/item/{item_id}").json()["result"]
+    assert item["available_quantity"] == stock_quantity
+
+
+def test_lapsed_reservation_should_be_expired_by_sweeper(session, client):
+    stock_quantity = 10
+    reserved_quantity = 6
+    item_id = create_item(session, stock_quantity)
+
+    reservation = client.post(
+        "/v1/reservation/", json={"item_id": item_id, "quantity": reserved_quantity}
+    ).json()["result"]
+
+    session.execute(
+        update(StockReservation)
+        .where(StockReservation.id == reservation["id"])
+        .values(expires_at=func.now())
+    )
+    session.commit()
+
+    response = client.post(f"/v1/reservation/{reservation['id']}/confirm")
+    assert response.status_code == HTTPStatus.CONFLICT
+    assert "expired" in response.json()["detail"]
+
+    assert expire_reservations(batch_size=100, session=session) == 1
+    assert expire_reservations(batch_size=100, session=session) == 0
+
+    response = client.get(f"/v1/reservation/{reservation['id']}")
+    assert response.json()["result"]["status"] == "expired"
+
+    item = client.get(f"/v1/item/{item_id}").json()["result"]
+    assert item["reserved_quantity"] == 0
+
+
+def test_reservation_writes_should_refresh_cached_item_lists(session, client):
+    stock_quantity, reserved_quantity = 10, 3
+    item_id = create_item(session, stock_quantity)
+
+    def read_item():
+        response = client.get("/v1/item/")
+        return response.headers["X-Cache"], response.json()["result"][0]
+
+    read_item()
+    reservation = client.post(
+        "/v1/reservation/", json={"item_id": item_id, "quantity": reserved_quantity}
+    ).json()["result"]
+    after_create = read_item()
+
+    client.post(f"/v1/reservation/{reservation['id']}/release")
+    after_release = read_item()
+
+    lapsed = client.post(
+        "/v1/reservation/", json={"item_id": item_id, "quantity": reserved_quantity}
+    ).json()["result"]
+    session.execute(
+        update(StockReservation)
+        .where(StockReservation.id == lapsed["id"])
+        .values(expires_at=func.now())
+    )
+    session.commit()
+    read_item()
+    expire_reservations(batch_size=100, session=session)
+    after_expire = read_item()
+
+    assert [cache for cache, _ in (after_create, after_release, after_expire)] == [
+        "MISS"
+    ] * 3
+    assert after_create[1]["reserved_quantity"] == reserved_quantity
+    assert after_release[1]["available_quantity"] == stock_quantity
+    assert after_expire[1]["available_quantity"] == stock_quantity
+
+
+def test_reservations_should_not_record_item_changes(session, client):
+    item_id = create_item(session, 10)
+    count_changes = select(func.count()).select_from(ItemChangeEvent)
+    changes_before = session.scalar(count_changes)
+
+    reservation = client.post(
+        "/v1/reservation/", json={"item_id": item_id, "quantity": 1}
+    ).json()["result"]
+    client.post(f"/v1/reservation/{reservation['id']}/release")
+
+    assert session.scalar(count_changes) == changes_before
+
+
+def test_concurrent_reservations_should_never_oversell(session, engine):
+    stock_quantity = 10
+    attempts = 30
+    item_id = create_item(session, stock_quantity)
+
+    def reserve_one():
+        with Session(engine) as worker_session:
+            try:
+                create_reservation(
+                    ReservationCreateRequest(item_id=item_id, quantity=1),
+                    worker_session,
+                )
+            except InsufficientStock:
+                return False
+
+            return True
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: reserve_one(), range(attempts)))
+
+    assert results.count(True) == stock_quantity
@@ -0,0 +1,87 @@
+from http import HTTPStatus
+
+from crb_inventory.core.cache import ResponseCache
+from crb_inventory.models.utils import AppResource
+from tests.factories import CategoryFactory
+
+
+def test_response_cache_should_miss_after_version_bump():
+    cache = ResponseCache(max_entries=10, ttl=60)
+    key = ("/v1/tag/", (("page", 1),))
+
+    cache.store(key, cache.version(AppResource.TAG), b"[]")
+    entry, refresh = cache.lookup(key, cache.version(AppResource.TAG))
+    assert entry.body == b"[]"
+    assert refresh is False
+
+    cache.bump_version(AppResource.TAG)
+    entry, refresh = cache.lookup(key, cache.version(AppResource.TAG))
+    assert entry is None
+    assert refresh is True
+
+
+def test_response_cache_should_evict_least_recently_used_entry():
+    cache = ResponseCache(max_entries=2, ttl=60)
+
+    cache.store(("a",), 0, b"a")
+    cache.store(("b",), 0, b"b")
+    cache.lookup(("a",), 0)
+    cache.store(("c",), 0, b"c")
+
+    assert cache.lookup(("b",), 0)[0] is None
+    assert cache.lookup(("a",), 0)[0].body == b"a"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_response_cache_should_hand_stale_entry_to_a_single_refresher():
+    cache = ResponseCache(max_entries=10, ttl=0.000001, stale_ttl=60)
+    key = ("/v1/item/",)
+
+    cache.store(key, 0, b"stale")
+
+    first_entry, first_refresh = cache.lookup(key, 0)
+    second_entry, second_refresh = cache.lookup(key, 0)
+
+    assert first_entry.body == second_entry.body == b"stale"
+    expected_stale_hits = 2
+
+    assert first_refresh is True
+    assert second_refresh is False
+    assert cache.stats()["stale_hits"] == expected_stale_hits
+
+
+def test_read_categories_should_be_served_from_cache_until_a_write(session, client):
+    route = "/v1/category/"
+    expected_categories = 2
+
+    session.bulk_save_objects(CategoryFactory.create_batch(expected_categories))
+    session.commit()
+
+    first_response = client.get(route)
+    second_response = client.get(f"{route}?page=1&page_size=10")
+
+    assert first_response.headers["X-Cache"] == "MISS"
+    assert second_response.headers["X-Cache"] == "HIT"
+    assert second_response.json() == first_response.json()
+
+    client.post(route, json={"name": "Categoria Nova"})
+    third_response = client.get(route)
+
+    assert third_response.status_code == HTTPStatus.OK
+    assert third_response.headers["X-Cache"] == "MISS"
+    assert third_response.json()["total"] == expected_categories + 1
+
+
+def test_response_cache_metrics_should_report_hit_ratio(client):
+    route = "/v1/tag/"
+    expected_hit_ratio = 0.5
+
+    client.get(route)
+    client.get(route)
+
+    response = client.get("/v1/metrics/cache")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["hits"] == 1
+    assert response.json()["misses"] == 1
+    assert response.json()["hit_ratio"] == expected_hit_ratio
@@ -1,4 +1,11 @@
-from crb_inventory.main import APP_DATA
+from http import HTTPStatus
+
+from fastapi.testclient import TestClient
+
+from crb_inventory.core.cache import response_cache
+from crb_inventory.core.database import get_engine
+from crb_inventory.main import APP_DATA, create_app
+from crb_inventory.settings import get_settings
 
 
 def test_api_root_info(client):
@@ -19,3 +26,16 @@ def test_api_v1_root_info(client):
         "version": APP_DATA["version_v1"],
         "docs": APP_DATA["docs_v1"],
     }
+
+
+def test_app_factory_should_configure_on_startup_and_dispose_on_shutdown():
+    app = create_app()
+    response_cache.max_entries = 0
+    get_engine()
+
+    with TestClient(app) as client:
+        assert client.get("/").status_code == HTTPStatus.OK
+        assert response_cache.max_entries == get_settings().RESPONSE_CACHE_MAX_ENTRIES
+        assert app.openapi()["tags"][0]["externalDocs"]["url"].endswith("/v1/docs")
+
+    assert get_engine.cache_info().currsize == 0
@@ -0,0 +1,111 @@
+import asyncio
+from http import HTTPStatus
+from time import sleep
+
+import pytest
+
+from crb_inventory.core.single_flight import SingleFlight
+from tests.factories import CategoryFactory, ItemFactory
+
+CONCURRENT_CALLS = 5
+
+
+def run_concurrently(flight, calls):
+    async def gather():
+        return await asyncio.gather(
+            *(flight.run(key, function) for key, function in calls),
+            return_exceptions=True,
+        )
+
+    return asyncio.run(gather())
+
+
+def test_identical_concurrent_calls_should_share_one_execution():
+    flight = SingleFlight()
+    executions = []
+
+    def load():
+        executions.append(1)
+        sleep(0.05)
+        return b"[]"
+
+    results = run_concurrently(flight, [("items", load)] * CONCURRENT_CALLS)
+
+    assert results == [b"[]"] * CONCURRENT_CALLS
+    assert len(executions) == 1
+    assert flight.stats() == {
+        "executions": 1,
+        "coalesced": CONCURRENT_CALLS - 1,
+        "in_flight": 0,
+    }
+
+
+def test_calls_with_different_keys_should_not_be_coalesced():
+    flight = SingleFlight()
+
+    def load():
+        sleep(0.01)
+        return b"[]"
+
+    run_concurrently(flight, [("page 1", load), ("page 2", load)])
+
+    assert flight.stats()["executions"] == len(("page 1", "page 2"))
+    assert flight.stats()["coalesced"] == 0
+
+
+def test_failure_should_reach_every_waiter_and_release_the_key():
+    flight = SingleFlight()
+
+    def fail():
+        sleep(0.01)
+        raise ValueError("database unavailable")
+
+    results = run_concurrently(flight, [("items", fail)] * CONCURRENT_CALLS)
+
+    assert all(isinstance(result, ValueError) for result in results)
+    assert asyncio.run(flight.run("items", lambda: b"[]")) == b"[]"
+
+    with pytest.raises(ValueError, match="database unavailable"):
+        asyncio.run(flight.run("items", fail))
+
+
+def test_cancelled_leader_should_not_fail_the_other_callers():
+    flight = SingleFlight()
+
+    def load():
+        sleep(0.05)
+        return b"[]"
+
+    async def cancel_leader():
+        leader = asyncio.ensure_future(flight.run("items", load))
+        await asyncio.sleep(0.01)
+        waiter = asyncio.ensure_future(flight.run("items", load))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+
+        return await asyncio.gather(leader, waiter, return_exceptions=True)
+
+    leader_result, waiter_result = asyncio.run(cancel_leader())
+
+    assert isinstance(leader_result, asyncio.CancelledError)
+    assert waiter_result == b"[]"
+    assert flight.stats() == {"executions": 1, "coalesced": 1, "in_flight": 0}
+
+
+def test_single_flight_metrics_should_count_item_reads(session, client):
+    category = CategoryFactory()
+    session.add(category)
+    session.commit()
+
+    item = ItemFactory(category_id=category.id)
+    session.add(item)
+    session.commit()
+
+    before = client.get("/v1/metrics/single-flight").json()
+    response = client.get(f"/v1/item/{item.id}")
+    after = client.get("/v1/metrics/single-flight").json()
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["result"]["id"] == item.id
+    assert after["executions"] == before["executions"] + 1
+    assert after["in_flight"] == 0
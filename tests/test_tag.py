@@ -242,3 +242,57 @@ def test_check_tag_exists(session):
 
     with pytest.raises(ResourceNotFound):
         check_tag_exists(random_id, session)
+
+
+def test_read_tags_batch_should_return_found_tags_and_missing_ids(session, client):
+    route = "/v1/tag/batch-get"
+    missing_id = "56f0572c-1dec-4b4d-b517-4cac967146a7"
+
+    tags = TagFactory.create_batch(2)
+    session.bulk_save_objects(tags)
+    session.commit()
+
+    response = client.post(route, json={"ids": [tags[0].id, missing_id]})
+
+    assert response.status_code == HTTPStatus.OK
+    assert len(response.json()["result"]) == 1
+    assert response.json()["result"][0]["id"] == tags[0].id
+    assert response.json()["missing"] == [missing_id]
+
+
+def test_patch_tag_with_stale_if_match_should_return_412(session, client):
+    route = "/v1/tag/"
+    tag = TagFactory()
+    session.add(tag)
+    session.commit()
+
+    expected_version = 2
+    etag = client.get(f"{route}{tag.id}").headers["ETag"]
+
+    response = client.patch(
+        f"{route}{tag.id}", json={"description": "first"}, headers={"If-Match": etag}
+    )
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["result"]["version"] == expected_version
+
+    response = client.patch(
+        f"{route}{tag.id}", json={"description": "second"}, headers={"If-Match": etag}
+    )
+
+    assert response.status_code == HTTPStatus.PRECONDITION_FAILED
+    assert response.json()["error_code"] == "002"
+
+
+def test_update_tag_with_wildcard_if_match_should_return_200(session, client):
+    route = "/v1/tag/"
+    tag = TagFactory()
+    session.add(tag)
+    session.commit()
+
+    response = client.put(
+        f"{route}{tag.id}",
+        json={"name": "tag-wildcard", "is_active": True},
+        headers={"If-Match": "*"},
+    )
+
+    assert response.status_code == HTTPStatus.OK
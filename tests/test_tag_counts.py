@@ -0,0 +1,202 @@
+from datetime import datetime, timedelta, timezone
+from http import HTTPStatus
+
+from sqlalchemy import select, update
+
+from crb_inventory.database_schema import Tag
+from crb_inventory.services.item_archive import archive_inactive_items
+from crb_inventory.services.tag_counts import reconcile_tag_item_counts
+from tests.factories import CategoryFactory, ItemFactory, TagFactory
+
+ITEM_COUNT = 3
+
+
+def read_counts(session, tag_id):
+    session.expire_all()
+    tag = session.get(Tag, tag_id)
+
+    return tag.item_count, tag.active_item_count
+
+
+def create_tagged_items(session, count=ITEM_COUNT):
+    category = CategoryFactory()
+    tag = TagFactory()
+    session.add_all([category, tag])
+    session.commit()
+
+    items = ItemFactory.create_batch(count, category_id=category.id)
+    session.add_all(items)
+    session.commit()
+
+    for item in items:
+        item.tags.append(tag)
+    session.commit()
+
+    return category, tag, [item.id for item in items]
+
+
+def test_counters_should_follow_tag_and_item_writes(session, client):
+    category = CategoryFactory()
+    tag = TagFactory()
+    session.add_all([category, tag])
+    session.commit()
+    first, second = (
+        ItemFactory(category_id=category.id),
+        ItemFactory(category_id=category.id),
+    )
+    session.add_all([first, second])
+    session.commit()
+
+    client.post(f"/v1/item/{first.id}/tag/{tag.id}")
+    client.post(f"/v1/item/{second.id}/tag/{tag.id}")
+    assert read_counts(session, tag.id) == (2, 2)
+
+    client.patch(f"/v1/item/{first.id}", json={"is_active": False})
+    assert read_counts(session, tag.id) == (2, 1)
+
+    client.patch(f"/v1/item/{first.id}", json={"description": "still inactive"})
+    assert read_counts(session, tag.id) == (2, 1)
+
+    client.delete(f"/v1/item/{first.id}")
+    assert read_counts(session, tag.id) == (1, 1)
+
+    client.delete(f"/v1/item/{second.id}/tag/{tag.id}")
+    assert read_counts(session, tag.id) == (0, 0)
+
+
+def test_tag_responses_should_include_the_counters(session, client):
+    _, tag, _ = create_tagged_items(session)
+
+    response = client.get(f"/v1/tag/{tag.id}")
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["result"]["item_count"] == ITEM_COUNT
+    assert response.json()["result"]["active_item_count"] == ITEM_COUNT
+
+
+def test_counters_should_follow_bulk_writes(session, client):
+    category, tag, item_ids = create_tagged_items(session)
+
+    client.post("/v1/item/bulk-deactivate", json={"ids": item_ids[:1]})
+    assert read_counts(session, tag.id) == (ITEM_COUNT, ITEM_COUNT - 1)
+
+    client.post("/v1/item/bulk-delete", json={"ids": item_ids[:2]})
+    assert read_counts(session, tag.id) == (ITEM_COUNT - 2, ITEM_COUNT - 2)
+
+    client.delete(f"/v1/category/{category.id}", params={"strategy": "cascade"})
+    assert read_counts(session, tag.id) == (0, 0)
+
+
+def test_counters_should_follow_archive_and_restore(session, client):
+    _, tag, item_ids = create_tagged_items(session)
+    client.patch(f"/v1/item/{item_ids[0]}", json={"is_active": False})
+
+    archive_inactive_items(
+        inactive_before=datetime.now(timezone.utc) + timedelta(days=1),
+        batch_size=100,
+        session=session,
+    )
+    assert read_counts(session, tag.id) == (ITEM_COUNT - 1, ITEM_COUNT - 1)
+
+    client.post(f"/v1/item/{item_ids[0]}/restore")
+    assert read_counts(session, tag.id) == (ITEM_COUNT, ITEM_COUNT - 1)
+
+
+def test_counters_should_follow_tag_reassignment(session, client):
+    _, tag, item_ids = create_tagged_items(session)
+    target = TagFactory()
+    session.add(target)
+    session.commit()
+    client.post(f"/v1/item/{item_ids[0]}/tag/{target.id}")
+
+    client.delete(
+        f"/v1/tag/{tag.id}",
+        params={"strategy": "reassign", "reassign_to": target.id},
+    )
+
+    assert read_counts(session, target.id) == (ITEM_COUNT, ITEM_COUNT)
+
+
+def test_read_tags_should_sort_by_popularity(session, client):
+    _, popular_tag, item_ids = create_tagged_items(session)
+    unused_tag, niche_tag = TagFactory(), TagFactory()
+    session.add_all([unused_tag, niche_tag])
+    session.commit()
+    client.post(f"/v1/item/{item_ids[0]}/tag/{niche_tag.id}")
+
+    newest = client.get("/v1/tag/")
+    popular = client.get("/v1/tag/", params={"sort": "popularity"})
+
+    assert [tag["id"] for tag in newest.json()["result"]] == [
+        niche_tag.id,
+        unused_tag.id,
+        popular_tag.id,
+    ]
+    assert [tag["id"] for tag in popular.json()["result"]] == [
+        popular_tag.id,
+        niche_tag.id,
+        unused_tag.id,
+    ]
+
+
+def test_read_items_by_tag_should_take_the_total_from_the_counter(session, client):
+    _, tag, _ = create_tagged_items(session)
+    drifted_count = 42
+    session.execute(
+        update(Tag).where(Tag.id == tag.id).values(active_item_count=drifted_count)
+    )
+    session.commit()
+
+    counted = client.get(f"/v1/item/tag/{tag.id}")
+    ranged = client.get(
+        f"/v1/item/tag/{tag.id}",
+        params={"created_after": "2000-01-01T00:00:00Z"},
+    )
+
+    assert counted.json()["total"] == drifted_count
+    assert ranged.json()["total"] == ITEM_COUNT
+
+
+def test_reconcile_should_report_and_repair_drift(session):
+    _, tag, _ = create_tagged_items(session)
+    version, updated_at = session.execute(
+        select(Tag.version, Tag.updated_at).where(Tag.id == tag.id)
+    ).one()
+    session.execute(
+        update(Tag.__table__)
+        .where(Tag.id == tag.id)
+        .values(item_count=0, updated_at=Tag.__table__.c.updated_at)
+    )
+    session.commit()
+
+    reported = reconcile_tag_item_counts(repair=False, session=session)
+    assert [(drift.tag_id, drift.actual.item_count) for drift in reported] == [
+        (tag.id, 0)
+    ]
+    assert read_counts(session, tag.id) == (0, ITEM_COUNT)
+
+    repaired = reconcile_tag_item_counts(repair=True, session=session)
+    assert repaired[0].expected.item_count == ITEM_COUNT
+    assert read_counts(session, tag.id) == (ITEM_COUNT, ITEM_COUNT)
+    assert session.execute(
+        select(Tag.version, Tag.updated_at).where(Tag.id == tag.id)
+    ).one() == (version, updated_at)
+    assert reconcile_tag_item_counts(repair=False, session=session) == []
+
+
+def test_read_tags_should_not_be_served_from_cache_after_item_writes(session, client):
+    category = CategoryFactory()
+    tag = TagFactory()
+    session.add_all([category, tag])
+    session.commit()
+    item = ItemFactory(category_id=category.id)
+    session.add(item)
+    session.commit()
+
+    first_response = client.get("/v1/tag/")
+    client.post(f"/v1/item/{item.id}/tag/{tag.id}")
+    second_response = client.get("/v1/tag/")
+
+    assert first_response.json()["result"][0]["item_count"] == 0
+    assert second_response.headers["X-Cache"] == "MISS"
+    assert second_response.json()["result"][0]["item_count"] == 1